@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import uuid
+from pathlib import Path
+
+from starlette.staticfiles import StaticFiles
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+ASSET_BUILD_DIR = STATIC_DIR.parent.parent / "assets" / "build"
+ASSET_SOURCES = ("app.css", "app.js")
+ASSET_URL_PREFIX = "/assets/build"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _fingerprinted_name(name: str, content: bytes) -> str:
+    stem, dot, suffix = name.rpartition(".")
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    return f"{stem}.{digest}.{suffix}" if dot else f"{name}.{digest}"
+
+
+def _load_assets() -> dict[str, tuple[str, bytes]]:
+    assets = {}
+    for name in ASSET_SOURCES:
+        content = (STATIC_DIR / name).read_bytes()
+        assets[name] = (_fingerprinted_name(name, content), content)
+    return assets
+
+
+ASSETS = _load_assets()
+ASSET_VERSION = hashlib.sha256("|".join(hashed for hashed, _ in ASSETS.values()).encode("utf-8")).hexdigest()[:12]
+
+
+def asset_url(name: str) -> str:
+    return f"{ASSET_URL_PREFIX}/{ASSETS[name][0]}"
+
+
+def asset_urls() -> list[str]:
+    return [asset_url(name) for name in ASSET_SOURCES]
+
+
+def _emitted_names() -> set[str]:
+    return {name for hashed_name, _ in ASSETS.values() for name in (hashed_name, f"{hashed_name}.gz")}
+
+
+def _write_atomic(target: Path, content: bytes) -> None:
+    tmp_path = target.with_name(f".{target.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, target)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def assets_ready(target_dir: Path) -> bool:
+    return all((target_dir / name).is_file() for name in _emitted_names())
+
+
+def emit_assets(target_dir: Path, *, sweep: bool = True) -> None:
+    target_dir.mkdir(parents=True, exist_ok=True)
+    for hashed_name, content in ASSETS.values():
+        target = target_dir / hashed_name
+        if not target.exists():
+            _write_atomic(target, content)
+        gz_target = target_dir / f"{hashed_name}.gz"
+        if not gz_target.exists():
+            _write_atomic(gz_target, gzip.compress(content, compresslevel=9, mtime=0))
+    if not sweep:
+        return
+    current = _emitted_names()
+    for stale in target_dir.iterdir():
+        if stale.is_file() and stale.name not in current and not stale.name.startswith("."):
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+
+class FingerprintedStaticFiles(StaticFiles):
+    async def get_response(self, path: str, scope):
+        accept_encoding = ""
+        for key, value in scope.get("headers", []):
+            if key == b"accept-encoding":
+                accept_encoding = value.decode("latin-1").lower()
+                break
+        if "gzip" in accept_encoding and not path.endswith(".gz"):
+            _, stat_result = self.lookup_path(f"{path}.gz")
+            if stat_result is not None:
+                response = await super().get_response(f"{path}.gz", scope)
+                if response.status_code == 200:
+                    response.headers["Content-Encoding"] = "gzip"
+                    response.headers["Vary"] = "Accept-Encoding"
+                    response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+                    return response
+        response = await super().get_response(path, scope)
+        if response.status_code == 200:
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from ops import assets, auth, db as ops_db
+
+BOOTSTRAP_LOCK_TIMEOUT = 300.0
+BOOTSTRAP_LOCK_POLL_SECONDS = 0.1
+BOOTSTRAP_DONE_ENV = "OPS_BOOTSTRAPPED"
+
+bootstrap_logger = logging.getLogger("ops.bootstrap")
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock_file(handle) -> None:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+
+    def _unlock_file(handle) -> None:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(handle) -> None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def _unlock_file(handle) -> None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def lock_path(name: str = "bootstrap") -> Path:
+    return Path(f"{ops_db.DB_PATH}.{name}.lock")
+
+
+@contextmanager
+def bootstrap_lock(timeout: float = BOOTSTRAP_LOCK_TIMEOUT, name: str = "bootstrap"):
+    path = lock_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + timeout
+    with open(path, "a+b") as handle:
+        while True:
+            try:
+                _lock_file(handle)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"DB 초기화 잠금을 {timeout:.0f}초 안에 얻지 못했습니다: {path}")
+                time.sleep(BOOTSTRAP_LOCK_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            _unlock_file(handle)
+
+
+def already_done() -> bool:
+    return str(os.getenv(BOOTSTRAP_DONE_ENV, "")).strip() == "1"
+
+
+def run() -> list[tuple[int, str, float]]:
+    with bootstrap_lock():
+        applied = ops_db.init_db()
+        auth.ensure_admin_user()
+        assets.emit_assets(assets.ASSET_BUILD_DIR)
+    return applied
+
+
+def _admin_user_id() -> int | None:
+    conn = ops_db.get_conn()
+    try:
+        admin_user = conn.execute(
+            "SELECT id FROM users WHERE username = ?",
+            (auth.DEFAULT_ADMIN_USERNAME,),
+        ).fetchone()
+    finally:
+        conn.close()
+    return admin_user["id"] if admin_user else None
+
+
+def _log_legacy_progress(done: int, total: int) -> None:
+    bootstrap_logger.info("legacy tool migration: %s/%s", done, total)
+
+
+def migrate_legacy(progress=None, batch_size: int = 0) -> int | None:
+    try:
+        with bootstrap_lock(timeout=0, name="legacy"):
+            return ops_db.migrate_legacy_tools(
+                _admin_user_id(),
+                batch_size=batch_size or ops_db.LEGACY_MIGRATION_BATCH_SIZE,
+                progress=progress,
+            )
+    except TimeoutError:
+        return None
+
+
+def _migrate_legacy_in_background() -> None:
+    try:
+        imported = migrate_legacy(_log_legacy_progress)
+    except Exception:
+        bootstrap_logger.exception("legacy tool migration failed; it will resume from the last checkpoint on the next start")
+        return
+    if imported is not None:
+        bootstrap_logger.info("legacy tool migration finished: %s tools imported", imported)
+
+
+def start_legacy_migration() -> threading.Thread | None:
+    if not ops_db.legacy_migration_pending():
+        return None
+    thread = threading.Thread(target=_migrate_legacy_in_background, name="ops-legacy-migration", daemon=True)
+    thread.start()
+    return thread
+
+
+def describe(applied: list[tuple[int, str, float]]) -> list[str]:
+    if not applied:
+        return [f"DB 스키마 최신 상태 (버전 {ops_db.SCHEMA_VERSION})"]
+    return [f"DB 스키마 마이그레이션 {version} ({name}): {seconds * 1000:.1f} ms" for version, name, seconds in applied]
+
+
+def main() -> None:
+    started = time.perf_counter()
+    applied = run()
+    for line in describe(applied):
+        print(line)
+    print(f"DB 초기화 완료: {ops_db.DB_PATH} ({time.perf_counter() - started:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
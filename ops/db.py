@@ -1,19 +1,114 @@
 from __future__ import annotations
 
+import logging
 import os
 import sqlite3
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, Iterable
+
+from ops import metrics
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 DB_PATH = Path(os.getenv("OPS_DB_PATH", BASE_DIR / "operations.db"))
 LEGACY_DB_PATH_RAW = os.getenv("LEGACY_DB_PATH", "").strip()
 LEGACY_DB_PATH = Path(LEGACY_DB_PATH_RAW) if LEGACY_DB_PATH_RAW else None
+LEGACY_SOURCE = "tool_search"
+LEGACY_FACILITY_CATEGORY = "레거시 위치"
+LEGACY_MIGRATION_BATCH_SIZE = 500
+VERSIONED_TABLES = (
+    "users",
+    "facilities",
+    "inventory_items",
+    "inventory_transactions",
+    "complaints",
+    "complaint_updates",
+    "complaint_feedback",
+    "complaint_response_templates",
+    "work_orders",
+    "work_order_updates",
+    "contacts",
+    "office_records",
+    "office_record_updates",
+    "attachments",
+)
+CHANGE_LOG_TABLES = ("work_orders", "complaints", "inventory_items")
+CHANGE_LOG_RETENTION_DAYS = 30
+
+schema_logger = logging.getLogger("ops.schema")
+
+
+class OpsCursor(sqlite3.Cursor):
+    trace: list | None = None
+
+    def __next__(self):
+        row = super().__next__()
+        if self.trace is not None:
+            self.trace[2] += 1
+        return row
+
+    def fetchone(self):
+        row = super().fetchone()
+        if row is not None and self.trace is not None:
+            self.trace[2] += 1
+        return row
+
+    def fetchmany(self, size: int | None = None):
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        if self.trace is not None:
+            self.trace[2] += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = super().fetchall()
+        if self.trace is not None:
+            self.trace[2] += len(rows)
+        return rows
+
 
+class OpsConnection(sqlite3.Connection):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.after_commit: list = []
+        self.pending_changes: dict = {}
 
-def get_conn() -> sqlite3.Connection:
+    def execute(self, sql: str, parameters=()):
+        return self._traced("execute", sql, parameters)
+
+    def executemany(self, sql: str, parameters):
+        return self._traced("executemany", sql, parameters)
+
+    def _traced(self, method: str, sql: str, parameters):
+        cursor = self.cursor(OpsCursor)
+        opened_write = not self.in_transaction
+        started = time.perf_counter()
+        try:
+            getattr(cursor, method)(sql, parameters)
+        finally:
+            cursor.trace = metrics.record_query(
+                sql,
+                time.perf_counter() - started,
+                opened_write=opened_write and self.in_transaction,
+                rowcount=cursor.rowcount,
+            )
+        return cursor
+
+    def commit(self) -> None:
+        super().commit()
+        callbacks, self.after_commit = self.after_commit, []
+        for callback in callbacks:
+            callback()
+
+    def rollback(self) -> None:
+        super().rollback()
+        self.after_commit = []
+        self.pending_changes = {}
+
+
+def get_conn(*, check_same_thread: bool = True) -> sqlite3.Connection:
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = sqlite3.connect(str(DB_PATH), check_same_thread=check_same_thread, factory=OpsConnection)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
     conn.execute("PRAGMA journal_mode = WAL")
@@ -39,9 +134,7 @@ def _ensure_column(conn: sqlite3.Connection, table_name: str, column_sql: str, c
         conn.execute(f"ALTER TABLE {table_name} ADD COLUMN {column_sql}")
 
 
-def init_db() -> None:
-    conn = get_conn()
-
+def _migrate_base_tables(conn: sqlite3.Connection) -> None:
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS users (
@@ -427,12 +520,17 @@ def init_db() -> None:
         """
     )
 
+
+def _migrate_indexes(conn: sqlite3.Connection) -> None:
     conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_token_hash ON sessions(token_hash)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_users_phone ON users(phone)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_facilities_status ON facilities(status)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_facilities_name ON facilities(name)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_facilities_updated ON facilities(updated_at DESC, id DESC)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_inventory_status ON inventory_items(status)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_inventory_location ON inventory_items(location)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_inventory_low ON inventory_items(quantity, min_quantity)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_inventory_updated ON inventory_items(updated_at DESC, id DESC)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_inventory_tx_item ON inventory_transactions(item_id, created_at DESC)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_facilities_source_reference ON facilities(source_reference)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_complaints_status ON complaints(status)")
@@ -441,11 +539,14 @@ def init_db() -> None:
     conn.execute("CREATE INDEX IF NOT EXISTS idx_complaints_requester_phone ON complaints(requester_phone)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_complaints_batch ON complaints(batch_id)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_complaints_site_building ON complaints(site_name, building_label, unit_number)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_complaints_title ON complaints(title)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_complaints_updated ON complaints(updated_at DESC, id DESC)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_complaint_updates_complaint ON complaint_updates(complaint_id, created_at DESC)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_complaint_feedback_complaint ON complaint_feedback(complaint_id)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_complaint_feedback_rating ON complaint_feedback(rating, updated_at DESC)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_complaint_templates_active ON complaint_response_templates(is_active, category_primary, sort_order)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_work_orders_status ON work_orders(status)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_work_orders_updated ON work_orders(updated_at DESC, id DESC)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_work_orders_due_date ON work_orders(due_date)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_work_orders_priority ON work_orders(priority)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_work_orders_complaint ON work_orders(complaint_id)")
@@ -455,6 +556,7 @@ def init_db() -> None:
     conn.execute("CREATE INDEX IF NOT EXISTS idx_contacts_status ON contacts(status)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_contacts_phone ON contacts(phone)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_contacts_org ON contacts(organization, name)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_contacts_name ON contacts(name)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_office_records_type ON office_records(record_type)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_office_records_status ON office_records(status)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_office_records_due_date ON office_records(due_date)")
@@ -475,15 +577,107 @@ def init_db() -> None:
         "CREATE INDEX IF NOT EXISTS idx_complaint_import_batches_fingerprint ON complaint_import_batches(source_fingerprint)"
     )
 
-    _seed_default_complaint_templates(conn)
-    conn.commit()
-    conn.close()
+
+def _ensure_table_versions(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS table_versions (
+            table_name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    for table_name in VERSIONED_TABLES:
+        conn.execute("INSERT OR IGNORE INTO table_versions(table_name, version) VALUES (?, 0)", (table_name,))
+        for operation in ("INSERT", "UPDATE", "DELETE"):
+            conn.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table_name}_version_{operation.lower()}
+                AFTER {operation} ON {table_name}
+                BEGIN
+                    UPDATE table_versions SET version = version + 1 WHERE table_name = '{table_name}';
+                END
+                """
+            )
+
+
+def _ensure_change_log(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS change_log (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            table_name TEXT NOT NULL,
+            row_id INTEGER NOT NULL,
+            operation TEXT NOT NULL,
+            changed_at TEXT NOT NULL DEFAULT (datetime('now', 'localtime'))
+        )
+        """
+    )
+    for table_name in CHANGE_LOG_TABLES:
+        for operation, row_ref in (("INSERT", "NEW"), ("UPDATE", "NEW"), ("DELETE", "OLD")):
+            conn.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table_name}_changelog_{operation.lower()}
+                AFTER {operation} ON {table_name}
+                BEGIN
+                    INSERT INTO change_log(table_name, row_id, operation) VALUES ('{table_name}', {row_ref}.id, '{operation.lower()}');
+                END
+                """
+            )
+
+
+def prune_change_log(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "DELETE FROM change_log WHERE changed_at < datetime('now', 'localtime', ?)",
+        (f"-{CHANGE_LOG_RETENTION_DAYS} days",),
+    )
+
+
+def change_log_bounds(conn: sqlite3.Connection) -> tuple[int, int]:
+    head = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'change_log'").fetchone()
+    oldest = conn.execute("SELECT MIN(seq) AS seq FROM change_log").fetchone()
+    head_seq = int(head["seq"]) if head else 0
+    oldest_seq = int(oldest["seq"]) if oldest and oldest["seq"] is not None else head_seq + 1
+    return oldest_seq, head_seq
+
+
+def table_versions(conn: sqlite3.Connection, table_names: Iterable[str]) -> dict[str, int]:
+    names = list(table_names)
+    if not names:
+        return {}
+    placeholders = ",".join(["?"] * len(names))
+    rows = conn.execute(
+        f"SELECT table_name, version FROM table_versions WHERE table_name IN ({placeholders})",
+        names,
+    ).fetchall()
+    return {row["table_name"]: int(row["version"]) for row in rows}
 
 
-def _set_entity_code(conn: sqlite3.Connection, table: str, code_field: str, prefix: str, row_id: int) -> str:
-    code = f"{prefix}-{row_id:04d}"
-    conn.execute(f"UPDATE {table} SET {code_field} = ? WHERE id = ?", (code, row_id))
-    return code
+def entity_code(prefix: str, row_id: int) -> str:
+    return f"{prefix}-{row_id:04d}"
+
+
+def entity_code_sql(prefix: str) -> str:
+    return f"printf('{prefix}-%04d', next_id)"
+
+
+def next_id_sql(table: str) -> str:
+    return (
+        f"(SELECT max(COALESCE((SELECT seq FROM sqlite_sequence WHERE name = '{table}'), 0), "
+        f"COALESCE((SELECT MAX(id) FROM {table}), 0)) + 1 AS next_id)"
+    )
+
+
+def reserve_ids(conn: sqlite3.Connection, table: str, count: int = 1) -> int:
+    cursor = conn.execute(
+        f"UPDATE sqlite_sequence SET seq = max(seq, (SELECT COALESCE(MAX(id), 0) FROM {table})) + ? WHERE name = ?",
+        (count, table),
+    )
+    if cursor.rowcount:
+        return int(conn.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (table,)).fetchone()[0]) - count + 1
+    start = int(conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()[0])
+    conn.execute("INSERT INTO sqlite_sequence(name, seq) VALUES (?, ?)", (table, start + count))
+    return start + 1
 
 
 def _seed_default_complaint_templates(conn: sqlite3.Connection) -> None:
@@ -500,28 +694,104 @@ def _seed_default_complaint_templates(conn: sqlite3.Connection) -> None:
         ("전기 안전 안내", "전기", "회신", "처리중", 1, "전기 관련 민원으로 분류되어 안전 점검 후 조치하겠습니다. 위험 징후가 있으면 즉시 사용을 중지해 주세요.", 50),
         ("기계 설비 안내", "기계", "회신", "처리중", 1, "기계 설비 민원으로 분류되었습니다. 부품 상태와 설비 작동을 확인한 뒤 조치 결과를 안내드리겠습니다.", 60),
     ]
-    for name, category_primary, update_type, status_to, is_public_note, body, sort_order in defaults:
-        cursor = conn.execute(
-            """
-            INSERT INTO complaint_response_templates(
-                template_code, name, category_primary, update_type, status_to, is_public_note,
-                body, is_active, sort_order, created_at, updated_at
-            )
-            VALUES ('', ?, ?, ?, ?, ?, ?, 1, ?, ?, ?)
-            """,
-            (
-                name,
-                category_primary,
-                update_type,
-                status_to,
-                is_public_note,
-                body,
-                sort_order,
-                now_text,
-                now_text,
-            ),
+    first_id = reserve_ids(conn, "complaint_response_templates", len(defaults))
+    conn.executemany(
+        """
+        INSERT INTO complaint_response_templates(
+            id, template_code, name, category_primary, update_type, status_to, is_public_note,
+            body, is_active, sort_order, created_at, updated_at
         )
-        _set_entity_code(conn, "complaint_response_templates", "template_code", "CT", cursor.lastrowid)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?, ?)
+        """,
+        [
+            (first_id + offset, entity_code("CT", first_id + offset), *template, now_text, now_text)
+            for offset, template in enumerate(defaults)
+        ],
+    )
+
+
+def _ensure_legacy_migration_state(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS legacy_migration_state (
+            source TEXT PRIMARY KEY,
+            source_path TEXT NOT NULL DEFAULT '',
+            last_tool_id INTEGER NOT NULL DEFAULT 0,
+            imported INTEGER NOT NULL DEFAULT 0,
+            total INTEGER NOT NULL DEFAULT 0,
+            started_at TEXT NOT NULL DEFAULT '',
+            updated_at TEXT NOT NULL DEFAULT '',
+            completed_at TEXT NOT NULL DEFAULT ''
+        )
+        """
+    )
+
+
+def _ensure_table_stats(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS table_stats (
+            table_name TEXT PRIMARY KEY,
+            row_count INTEGER NOT NULL DEFAULT 0,
+            version INTEGER,
+            refreshed_at TEXT NOT NULL DEFAULT ''
+        )
+        """
+    )
+
+
+SCHEMA_MIGRATIONS = (
+    (1, "base tables", _migrate_base_tables),
+    (2, "indexes", _migrate_indexes),
+    (3, "table version triggers", _ensure_table_versions),
+    (4, "change log", _ensure_change_log),
+    (5, "default complaint templates", _seed_default_complaint_templates),
+    (6, "legacy migration checkpoint", _ensure_legacy_migration_state),
+    (7, "table stats cache", _ensure_table_stats),
+)
+SCHEMA_VERSION = SCHEMA_MIGRATIONS[-1][0]
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("PRAGMA user_version").fetchone()[0])
+
+
+def _apply_migrations(conn: sqlite3.Connection) -> list[tuple[int, str, float]]:
+    current = schema_version(conn)
+    if current > SCHEMA_VERSION:
+        schema_logger.warning("DB schema version %s is newer than this build (%s); skipping migrations", current, SCHEMA_VERSION)
+        return []
+    applied = []
+    for version, name, migrate in SCHEMA_MIGRATIONS:
+        if version <= current:
+            continue
+        started = time.perf_counter()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if schema_version(conn) >= version:
+                conn.rollback()
+                continue
+            migrate(conn)
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        elapsed = time.perf_counter() - started
+        schema_logger.info("schema migration %s (%s) applied in %.1f ms", version, name, elapsed * 1000)
+        applied.append((version, name, elapsed))
+    return applied
+
+
+def init_db() -> list[tuple[int, str, float]]:
+    conn = get_conn()
+    try:
+        applied = _apply_migrations(conn)
+        prune_change_log(conn)
+        conn.commit()
+    finally:
+        conn.close()
+    return applied
 
 
 def _note_from_legacy_row(row: sqlite3.Row) -> str:
@@ -535,69 +805,96 @@ def _note_from_legacy_row(row: sqlite3.Row) -> str:
     return " | ".join(parts)
 
 
-def migrate_legacy_tools(default_user_id: int | None = None) -> int:
-    if not LEGACY_DB_PATH or not LEGACY_DB_PATH.exists():
-        return 0
+def _legacy_checkpoint(conn: sqlite3.Connection) -> sqlite3.Row | None:
+    return conn.execute("SELECT * FROM legacy_migration_state WHERE source = ?", (LEGACY_SOURCE,)).fetchone()
 
+
+def legacy_migration_pending() -> bool:
+    if not LEGACY_DB_PATH or not LEGACY_DB_PATH.exists():
+        return False
     conn = get_conn()
-    current_count = conn.execute("SELECT COUNT(*) AS count FROM inventory_items").fetchone()["count"]
-    if current_count:
+    try:
+        checkpoint = _legacy_checkpoint(conn)
+        if checkpoint is not None:
+            return not checkpoint["completed_at"]
+        return not conn.execute("SELECT 1 FROM inventory_items LIMIT 1").fetchone()
+    finally:
         conn.close()
-        return 0
 
-    legacy = sqlite3.connect(str(LEGACY_DB_PATH))
-    legacy.row_factory = sqlite3.Row
 
-    if not _table_exists(legacy, "tools"):
-        legacy.close()
-        conn.close()
-        return 0
+def _legacy_children(legacy: sqlite3.Connection, table: str, columns: str, tool_ids: list[int]) -> dict[int, list[sqlite3.Row]]:
+    grouped: dict[int, list[sqlite3.Row]] = {}
+    placeholders = ",".join(["?"] * len(tool_ids))
+    for row in legacy.execute(f"SELECT tool_id, {columns} FROM {table} WHERE tool_id IN ({placeholders}) ORDER BY id ASC", tool_ids):
+        grouped.setdefault(row["tool_id"], []).append(row)
+    return grouped
 
-    location_map: dict[str, int] = {}
-    imported = 0
 
-    legacy_tools = legacy.execute("SELECT * FROM tools ORDER BY id ASC").fetchall()
-    for row in legacy_tools:
+def _migrate_legacy_batch(
+    conn: sqlite3.Connection,
+    legacy: sqlite3.Connection,
+    tools: list[sqlite3.Row],
+    location_map: dict[str, int],
+    default_user_id: int | None,
+    has_images: bool,
+    has_events: bool,
+) -> None:
+    new_locations: dict[str, str] = {}
+    for row in tools:
         location = (row["location"] or "").strip()
-        if location and location not in location_map:
-            cur = conn.execute(
-                """
-                INSERT INTO facilities(
-                    facility_code, category, name, building, floor, zone, status, note,
-                    created_by, updated_by, created_at, updated_at
-                )
-                VALUES ('', '레거시 위치', ?, '', '', '', '운영중', ?, ?, ?, ?, ?)
-                """,
+        if location and location not in location_map and location not in new_locations:
+            new_locations[location] = row["created_at"]
+    if new_locations:
+        first_id = reserve_ids(conn, "facilities", len(new_locations))
+        created = {location: first_id + offset for offset, location in enumerate(new_locations)}
+        conn.executemany(
+            """
+            INSERT INTO facilities(
+                id, facility_code, category, name, building, floor, zone, status, note,
+                created_by, updated_by, created_at, updated_at
+            )
+            VALUES (?, ?, ?, ?, '', '', '', '운영중', ?, ?, ?, ?, ?)
+            """,
+            [
                 (
+                    created[location],
+                    entity_code("FAC", created[location]),
+                    LEGACY_FACILITY_CATEGORY,
                     location,
                     "tool_search 위치 정보에서 자동 이관",
                     default_user_id,
                     default_user_id,
-                    row["created_at"],
-                    row["created_at"],
-                ),
-            )
-            facility_id = cur.lastrowid
-            _set_entity_code(conn, "facilities", "facility_code", "FAC", facility_id)
-            location_map[location] = facility_id
+                    created_at,
+                    created_at,
+                )
+                for location, created_at in new_locations.items()
+            ],
+        )
+        location_map.update(created)
 
-        cur = conn.execute(
-            """
-            INSERT INTO inventory_items(
-                item_code, category, name, specification, quantity, unit, location, status,
-                min_quantity, purchase_date, purchase_amount, note, legacy_tool_id,
-                created_by, updated_by, created_at, updated_at
-            )
-            VALUES ('', ?, ?, ?, ?, '개', ?, ?, 0, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+    tool_ids = [row["id"] for row in tools]
+    first_id = reserve_ids(conn, "inventory_items", len(tools))
+    item_ids = {tool_id: first_id + offset for offset, tool_id in enumerate(tool_ids)}
+    conn.executemany(
+        """
+        INSERT INTO inventory_items(
+            id, item_code, category, name, specification, quantity, unit, location, status,
+            min_quantity, purchase_date, purchase_amount, note, legacy_tool_id,
+            created_by, updated_by, created_at, updated_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, '개', ?, ?, 0, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
             (
+                item_ids[row["id"]],
+                entity_code("INV", item_ids[row["id"]]),
                 " / ".join(
                     [value.strip() for value in [row["cat_l"], row["cat_m"], row["cat_s"]] if (value or "").strip()]
                 ),
                 row["name"],
                 row["purpose"],
                 int(row["qty"] or 0),
-                location,
+                (row["location"] or "").strip(),
                 row["status"] or "정상",
                 (row["created_at"] or "")[:10],
                 int(row["purchase_amount"] or 0),
@@ -607,46 +904,125 @@ def migrate_legacy_tools(default_user_id: int | None = None) -> int:
                 default_user_id,
                 row["created_at"],
                 row["created_at"],
-            ),
+            )
+            for row in tools
+        ],
+    )
+
+    if has_images:
+        images = _legacy_children(legacy, "tool_images", "image_path, created_at", tool_ids)
+        conn.executemany(
+            """
+            INSERT INTO attachments(entity_type, entity_id, file_path, original_name, created_by, created_at)
+            VALUES ('inventory', ?, ?, ?, ?, ?)
+            """,
+            [
+                (item_ids[tool_id], Path(image["image_path"]).name, Path(image["image_path"]).name, default_user_id, image["created_at"])
+                for tool_id in tool_ids
+                for image in images.get(tool_id, [])
+                if Path(image["image_path"] or "").name
+            ],
         )
-        item_id = cur.lastrowid
-        _set_entity_code(conn, "inventory_items", "item_code", "INV", item_id)
-        imported += 1
-
-        if _table_exists(legacy, "tool_images"):
-            images = legacy.execute(
-                "SELECT image_path, created_at FROM tool_images WHERE tool_id = ? ORDER BY id ASC",
-                (row["id"],),
-            ).fetchall()
-            for image in images:
-                file_name = Path(image["image_path"]).name
-                if not file_name:
-                    continue
-                conn.execute(
-                    """
-                    INSERT INTO attachments(entity_type, entity_id, file_path, original_name, created_by, created_at)
-                    VALUES ('inventory', ?, ?, ?, ?, ?)
-                    """,
-                    (item_id, file_name, file_name, default_user_id, image["created_at"]),
+
+    if has_events:
+        events = _legacy_children(legacy, "tool_events", "event_type, person, note, created_at", tool_ids)
+        conn.executemany(
+            """
+            INSERT INTO inventory_transactions(item_id, tx_type, quantity_delta, reason, actor_user_id, created_at)
+            VALUES (?, ?, 0, ?, ?, ?)
+            """,
+            [
+                (
+                    item_ids[tool_id],
+                    event["event_type"],
+                    " | ".join([part for part in [(event["person"] or "").strip(), (event["note"] or "").strip()] if part]),
+                    default_user_id,
+                    event["created_at"],
                 )
+                for tool_id in tool_ids
+                for event in events.get(tool_id, [])
+            ],
+        )
+
 
-        if _table_exists(legacy, "tool_events"):
-            events = legacy.execute(
-                "SELECT event_type, person, note, created_at FROM tool_events WHERE tool_id = ? ORDER BY id ASC",
-                (row["id"],),
+def migrate_legacy_tools(
+    default_user_id: int | None = None,
+    *,
+    batch_size: int = LEGACY_MIGRATION_BATCH_SIZE,
+    progress: Callable[[int, int], None] | None = None,
+) -> int:
+    if not LEGACY_DB_PATH or not LEGACY_DB_PATH.exists():
+        return 0
+
+    conn = get_conn()
+    legacy = sqlite3.connect(str(LEGACY_DB_PATH))
+    legacy.row_factory = sqlite3.Row
+    try:
+        checkpoint = _legacy_checkpoint(conn)
+        if checkpoint is not None and checkpoint["completed_at"]:
+            return 0
+        if checkpoint is None and conn.execute("SELECT 1 FROM inventory_items LIMIT 1").fetchone():
+            return 0
+        if not _table_exists(legacy, "tools"):
+            return 0
+
+        total = int(legacy.execute("SELECT COUNT(*) FROM tools").fetchone()[0])
+        last_tool_id = int(checkpoint["last_tool_id"]) if checkpoint else 0
+        done = int(checkpoint["imported"]) if checkpoint else 0
+        if checkpoint is None:
+            conn.execute(
+                """
+                INSERT INTO legacy_migration_state(source, source_path, total, started_at, updated_at)
+                VALUES (?, ?, ?, datetime('now', 'localtime'), datetime('now', 'localtime'))
+                """,
+                (LEGACY_SOURCE, str(LEGACY_DB_PATH), total),
+            )
+            conn.commit()
+        location_map = {
+            row["name"]: row["id"]
+            for row in conn.execute("SELECT id, name FROM facilities WHERE category = ? ORDER BY id DESC", (LEGACY_FACILITY_CATEGORY,))
+        }
+        has_images = _table_exists(legacy, "tool_images")
+        has_events = _table_exists(legacy, "tool_events")
+        imported = 0
+        if progress:
+            progress(done, total)
+
+        while True:
+            tools = legacy.execute(
+                "SELECT * FROM tools WHERE id > ? ORDER BY id ASC LIMIT ?",
+                (last_tool_id, max(batch_size, 1)),
             ).fetchall()
-            for event in events:
-                reason_parts = [(event["person"] or "").strip(), (event["note"] or "").strip()]
-                reason = " | ".join([part for part in reason_parts if part])
+            if not tools:
+                break
+            batch_locations = dict(location_map)
+            try:
+                _migrate_legacy_batch(conn, legacy, tools, location_map, default_user_id, has_images, has_events)
+                last_tool_id = tools[-1]["id"]
                 conn.execute(
                     """
-                    INSERT INTO inventory_transactions(item_id, tx_type, quantity_delta, reason, actor_user_id, created_at)
-                    VALUES (?, ?, 0, ?, ?, ?)
+                    UPDATE legacy_migration_state
+                    SET last_tool_id = ?, imported = imported + ?, total = ?, updated_at = datetime('now', 'localtime')
+                    WHERE source = ?
                     """,
-                    (item_id, event["event_type"], reason, default_user_id, event["created_at"]),
+                    (last_tool_id, len(tools), total, LEGACY_SOURCE),
                 )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                location_map.clear()
+                location_map.update(batch_locations)
+                raise
+            imported += len(tools)
+            if progress:
+                progress(done + imported, total)
 
-    conn.commit()
-    legacy.close()
-    conn.close()
-    return imported
+        conn.execute(
+            "UPDATE legacy_migration_state SET completed_at = datetime('now', 'localtime'), updated_at = datetime('now', 'localtime') WHERE source = ?",
+            (LEGACY_SOURCE,),
+        )
+        conn.commit()
+        return imported
+    finally:
+        legacy.close()
+        conn.close()
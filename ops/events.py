@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+from collections import deque
+
+from ops.ui import status_badge
+
+EVENT_HISTORY_LIMIT = 200
+EVENT_KIND_PERMISSIONS = {
+    "complaint": "complaints:view",
+    "work_order": "work_orders:view",
+    "inventory": "inventory:view",
+}
+EVENT_SNAPSHOT_SQL = {
+    "complaint": "SELECT id, complaint_code AS code, title, status, priority FROM complaints WHERE id = ?",
+    "work_order": "SELECT id, work_code AS code, title, status, priority FROM work_orders WHERE id = ?",
+    "inventory": "SELECT id, item_code AS code, name AS title, status, quantity, min_quantity, unit FROM inventory_items WHERE id = ?",
+}
+LIVE_COUNTER_SQL = {
+    "open_complaints": "SELECT COUNT(*) AS count FROM complaints WHERE status NOT IN ('종결', '취소')",
+    "open_work": "SELECT COUNT(*) AS count FROM work_orders WHERE status NOT IN ('완료', '종결')",
+}
+CHANGE_LOG_KINDS = {"complaints": "complaint", "work_orders": "work_order", "inventory_items": "inventory"}
+CHANGE_LOG_ACTIONS = {"insert": "create", "update": "update", "delete": "delete"}
+RELAY_POLL_SECONDS = 1.0
+RELAY_BATCH_ROWS = 500
+COUNTER_INTERVAL_SECONDS = 2.0
+SUBSCRIBER_QUEUE_SIZE = 256
+
+
+class ChangeBroadcaster:
+    def __init__(self, history_limit: int = EVENT_HISTORY_LIMIT):
+        self._lock = threading.Lock()
+        self._history: deque[dict] = deque(maxlen=history_limit)
+        self._subscribers: dict[int, tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = {}
+        self._next_event_id = 1
+        self._next_token = 1
+
+    def publish(self, event_type: str, data: dict, event_id: int | None = None) -> dict:
+        with self._lock:
+            if event_id is None:
+                event_id = self._next_event_id
+                self._next_event_id += 1
+            event = {"id": event_id, "event": event_type, "data": data}
+            self._history.append(event)
+            subscribers = list(self._subscribers.items())
+        self._deliver(subscribers, event)
+        return event
+
+    def notify(self, event_type: str, data: dict) -> dict:
+        event = {"id": None, "event": event_type, "data": data}
+        with self._lock:
+            subscribers = list(self._subscribers.items())
+        self._deliver(subscribers, event)
+        return event
+
+    def _deliver(self, subscribers: list, event: dict) -> None:
+        for token, (loop, queue) in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._offer, token, queue, event)
+            except RuntimeError:
+                pass
+
+    def _offer(self, token: int, queue: asyncio.Queue, event: dict) -> None:
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.unsubscribe(token)
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(None)
+
+    def subscribe(self, last_event_id: int = 0) -> tuple[int, asyncio.Queue, list[dict]]:
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            token = self._next_token
+            self._next_token += 1
+            self._subscribers[token] = (loop, queue)
+            backlog = [event for event in self._history if last_event_id and event["id"] > last_event_id]
+        return token, queue, backlog
+
+    def unsubscribe(self, token: int) -> None:
+        with self._lock:
+            self._subscribers.pop(token, None)
+
+    def recent(self, limit: int = EVENT_HISTORY_LIMIT) -> list[dict]:
+        with self._lock:
+            return list(self._history)[-limit:]
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+
+BROADCASTER = ChangeBroadcaster()
+
+
+def format_sse(event: dict) -> str:
+    payload = json.dumps(event["data"], ensure_ascii=False, separators=(",", ":"))
+    event_id = f"id: {event['id']}\n" if event["id"] is not None else ""
+    return f"{event_id}event: {event['event']}\ndata: {payload}\n\n"
+
+
+def event_visible(event: dict, allowed_kinds: set[str]) -> bool:
+    kind = event["data"].get("kind")
+    return kind is None or kind in allowed_kinds
+
+
+def publish_on_commit(conn, kind: str, entity_id: int, action: str = "update") -> None:
+    pending = getattr(conn, "pending_changes", None)
+    if pending is None or kind not in EVENT_SNAPSHOT_SQL or not entity_id:
+        return
+    if not pending:
+        conn.after_commit.append(lambda: _flush_changes(conn))
+    pending.setdefault((kind, int(entity_id)), action)
+
+
+def _change_payload(conn, kind: str, entity_id: int, action: str) -> dict:
+    row = conn.execute(EVENT_SNAPSHOT_SQL[kind], (entity_id,)).fetchone()
+    if not row:
+        return {"kind": kind, "id": entity_id, "action": "delete"}
+    payload = {
+        "kind": kind,
+        "id": entity_id,
+        "action": action,
+        "code": row["code"],
+        "title": row["title"],
+        "status": row["status"],
+        "status_html": status_badge(row["status"]),
+    }
+    if kind == "inventory":
+        low = int(row["quantity"] or 0) <= int(row["min_quantity"] or 0)
+        payload["status"] = "부족" if low else row["status"]
+        payload["status_html"] = status_badge(payload["status"])
+        payload["quantity"] = f"{row['quantity']} {row['unit']}"
+        payload["low"] = low
+    else:
+        payload["priority"] = row["priority"]
+    return payload
+
+
+def live_counters(conn) -> dict[str, int]:
+    return {name: int(conn.execute(sql).fetchone()["count"]) for name, sql in LIVE_COUNTER_SQL.items()}
+
+
+def _flush_changes(conn) -> None:
+    pending, conn.pending_changes = conn.pending_changes, {}
+    if _relay is not None:
+        _relay.wake()
+        return
+    try:
+        _publish_changes(conn, {key: (action, None) for key, action in pending.items()})
+    except sqlite3.Error:
+        return
+
+
+def _publish_changes(conn, changes: dict) -> None:
+    ordered = sorted(changes.items(), key=lambda item: item[1][1] or 0)
+    payloads = [(_change_payload(conn, kind, entity_id, action), seq) for (kind, entity_id), (action, seq) in ordered]
+    for payload, seq in payloads:
+        BROADCASTER.publish("change", payload, seq)
+    COUNTERS.mark_dirty()
+
+
+class CounterTicker:
+    def __init__(self, interval: float = COUNTER_INTERVAL_SECONDS):
+        self.interval = interval
+        self._connect = None
+        self._dirty = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def pending(self) -> bool:
+        return self._dirty.is_set()
+
+    def mark_dirty(self) -> None:
+        self._dirty.set()
+
+    def tick(self, conn) -> dict[str, int] | None:
+        if not self._dirty.is_set():
+            return None
+        self._dirty.clear()
+        if not BROADCASTER.subscriber_count:
+            return None
+        counters = live_counters(conn)
+        BROADCASTER.notify("counters", {"counters": counters})
+        return counters
+
+    def start(self, connect) -> None:
+        if self._thread is not None:
+            return
+        self._connect = connect
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="ops-live-counters", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._dirty.set()
+        if self._thread is not None:
+            self._thread.join(self.interval * 2)
+            self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            if not self._dirty.wait(self.interval) or self._stop.is_set():
+                continue
+            try:
+                conn = self._connect()
+                try:
+                    self.tick(conn)
+                finally:
+                    conn.close()
+            except sqlite3.Error:
+                pass
+            self._stop.wait(self.interval)
+
+
+COUNTERS = CounterTicker()
+
+
+def start_counters(connect) -> CounterTicker:
+    COUNTERS.start(connect)
+    return COUNTERS
+
+
+class ChangeLogRelay:
+    def __init__(self, connect, poll_seconds: float = RELAY_POLL_SECONDS):
+        self._connect = connect
+        self.poll_seconds = poll_seconds
+        self.last_seq = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def prime(self, conn) -> None:
+        row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'change_log'").fetchone()
+        self.last_seq = int(row["seq"]) if row else 0
+
+    def poll(self, conn) -> int:
+        with self._lock:
+            rows = conn.execute(
+                "SELECT seq, table_name, row_id, operation FROM change_log WHERE seq > ? ORDER BY seq LIMIT ?",
+                (self.last_seq, RELAY_BATCH_ROWS),
+            ).fetchall()
+            if not rows:
+                return 0
+            changes: dict = {}
+            for row in rows:
+                kind = CHANGE_LOG_KINDS.get(row["table_name"])
+                if kind:
+                    key = (kind, int(row["row_id"]))
+                    action = changes[key][0] if key in changes else CHANGE_LOG_ACTIONS.get(row["operation"], "update")
+                    changes[key] = (action, int(row["seq"]))
+            if changes:
+                _publish_changes(conn, changes)
+            self.last_seq = int(rows[-1]["seq"])
+            return len(rows)
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def start(self) -> None:
+        conn = self._connect()
+        try:
+            self.prime(conn)
+        finally:
+            conn.close()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="ops-change-relay", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(self.poll_seconds * 2)
+            self._thread = None
+
+    def _loop(self) -> None:
+        conn = self._connect()
+        try:
+            while not self._stop.is_set():
+                self._wake.wait(self.poll_seconds)
+                self._wake.clear()
+                if self._stop.is_set():
+                    break
+                try:
+                    while self.poll(conn) >= RELAY_BATCH_ROWS:
+                        pass
+                except sqlite3.Error:
+                    continue
+        finally:
+            conn.close()
+
+
+_relay: ChangeLogRelay | None = None
+
+
+def start_relay(connect) -> ChangeLogRelay:
+    global _relay
+    if _relay is None:
+        _relay = ChangeLogRelay(connect)
+        _relay.start()
+    return _relay
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Iterable
+
+from fastapi import APIRouter
+from starlette._utils import get_route_path
+from starlette.routing import BaseRoute, Match, NoMatchFound, compile_path
+from starlette.types import Receive, Scope, Send
+
+from ops import metrics
+
+LAZY_ROUTES_ENABLED = str(os.getenv("OPS_LAZY_ROUTES", "1")).strip().lower() not in {"0", "false", "off", "no"}
+
+routes_logger = logging.getLogger("ops.routes")
+
+
+class LazyRouteGroup(BaseRoute):
+    def __init__(self, name: str):
+        self.name = name
+        self.loaded_seconds: float | None = None
+        self._pending: list[tuple[str, Callable[..., Any], list[str], dict[str, Any]]] = []
+        self._patterns: list[re.Pattern] = []
+        self._routes: list[BaseRoute] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._routes is not None
+
+    @property
+    def paths(self) -> list[str]:
+        return [path for path, _, _, _ in self._pending]
+
+    def _add(self, path: str, methods: list[str], kwargs: dict[str, Any]):
+        if self.loaded:
+            raise RuntimeError(f"route group {self.name} is already built")
+
+        def decorator(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+            self._pending.append((path, endpoint, methods, kwargs))
+            self._patterns.append(compile_path(path)[0])
+            return endpoint
+
+        return decorator
+
+    def get(self, path: str, **kwargs: Any):
+        return self._add(path, ["GET"], kwargs)
+
+    def post(self, path: str, **kwargs: Any):
+        return self._add(path, ["POST"], kwargs)
+
+    def load(self) -> list[BaseRoute]:
+        routes = self._routes
+        if routes is not None:
+            return routes
+        with self._lock:
+            if self._routes is None:
+                started = time.perf_counter()
+                router = APIRouter()
+                for path, endpoint, methods, kwargs in self._pending:
+                    router.add_api_route(path, endpoint, methods=methods, **kwargs)
+                self.loaded_seconds = time.perf_counter() - started
+                metrics.ROUTE_GROUP_LOAD_SECONDS.observe((self.name,), self.loaded_seconds)
+                routes_logger.info("route group %s built: %s routes in %.1f ms", self.name, len(router.routes), self.loaded_seconds * 1000)
+                self._routes = list(router.routes)
+            return self._routes
+
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+        if scope["type"] != "http":
+            return Match.NONE, {}
+        path = get_route_path(scope)
+        if not any(pattern.match(path) for pattern in self._patterns):
+            return Match.NONE, {}
+        partial: tuple[Match, Scope] | None = None
+        for route in self.load():
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                return match, child_scope
+            if match == Match.PARTIAL and partial is None:
+                partial = (match, child_scope)
+        return partial or (Match.NONE, {})
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await scope["route"].handle(scope, receive, send)
+
+    def url_path_for(self, name: str, /, **path_params: Any):
+        for route in self.load():
+            try:
+                return route.url_path_for(name, **path_params)
+            except NoMatchFound:
+                continue
+        raise NoMatchFound(name, path_params)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "pending"
+        return f"{type(self).__name__}(name={self.name!r}, routes={len(self._pending)}, {state})"
+
+
+def mount(routes: list[BaseRoute], name: str) -> LazyRouteGroup:
+    group = LazyRouteGroup(name)
+    routes.append(group)
+    return group
+
+
+def groups(routes: Iterable[BaseRoute]) -> list[LazyRouteGroup]:
+    return [route for route in routes if isinstance(route, LazyRouteGroup)]
+
+
+def expand(routes: Iterable[BaseRoute]) -> list[BaseRoute]:
+    expanded: list[BaseRoute] = []
+    for route in routes:
+        expanded.extend(route.load() if isinstance(route, LazyRouteGroup) else [route])
+    return expanded
+
+
+def load_all(routes: Iterable[BaseRoute]) -> float:
+    started = time.perf_counter()
+    for group in groups(routes):
+        group.load()
+    return time.perf_counter() - started
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+
+from ops.metrics import route_label
+
+MEMORY_BUDGET_MB = float(os.getenv("OPS_MEMORY_BUDGET_MB", "64") or 64)
+MEMORY_TRACE_FRAMES = 10
+MEMORY_TOP_SITES = 25
+MEMORY_KEEP_FILES = 50
+MEMORY_OVER_BUDGET_HISTORY = 100
+MEMORY_QUERY_FLAG = b"__memory=1"
+MEMORY_HEADER = b"x-ops-memory"
+memory_logger = logging.getLogger("ops.memory")
+
+_trace_lock = threading.Lock()
+_trace_users = 0
+_route_lock = threading.Lock()
+_route_stats: dict[str, list] = {}
+_over_budget: deque[dict] = deque(maxlen=MEMORY_OVER_BUDGET_HISTORY)
+job_tracing = str(os.getenv("OPS_MEMORY_TRACE_JOBS", "")).strip().lower() in {"1", "true", "on", "yes"}
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    class _ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    def _windows_memory() -> tuple[int, int]:
+        counters = _ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return 0, 0
+        return int(counters.WorkingSetSize), int(counters.PeakWorkingSetSize)
+
+
+def current_rss() -> int:
+    if sys.platform == "win32":
+        return _windows_memory()[0]
+    try:
+        with open("/proc/self/statm", "rb") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def peak_rss() -> int:
+    if sys.platform == "win32":
+        return _windows_memory()[1]
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+def _acquire_tracing() -> None:
+    global _trace_users
+    with _trace_lock:
+        if _trace_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(MEMORY_TRACE_FRAMES)
+        _trace_users += 1
+        tracemalloc.reset_peak()
+
+
+def _release_tracing() -> None:
+    global _trace_users
+    with _trace_lock:
+        _trace_users = max(_trace_users - 1, 0)
+        if _trace_users == 0:
+            tracemalloc.stop()
+
+
+def _snapshot():
+    return tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        )
+    )
+
+
+def report_name(label: str) -> str:
+    safe_label = re.sub(r"[^0-9A-Za-z_-]+", "-", label).strip("-")[:60] or "request"
+    now = time.time()
+    return f"memory-{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}{int(now * 1000) % 1000:03d}-{safe_label}.txt"
+
+
+def _over_budget_check(label: str, rss_growth: int, traced_peak: int, report: str = "") -> None:
+    budget = MEMORY_BUDGET_MB * 1024 * 1024
+    if budget <= 0 or max(rss_growth, traced_peak) < budget:
+        return
+    entry = {
+        "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "label": label,
+        "rss_growth": rss_growth,
+        "traced_peak": traced_peak,
+        "report": report,
+    }
+    with _route_lock:
+        _over_budget.append(entry)
+    memory_logger.warning(
+        "memory budget exceeded label=%s rss_growth=%.1fMB traced_peak=%.1fMB report=%s",
+        label,
+        rss_growth / 1048576,
+        traced_peak / 1048576,
+        report or "-",
+    )
+
+
+class TraceSession:
+    def __init__(self, label: str):
+        self.label = label
+        self.name = report_name(label)
+        self.rss_before = current_rss()
+        _acquire_tracing()
+        self.before = _snapshot()
+
+    def finish(self, output_dir: Path) -> tuple[str, int]:
+        try:
+            after = _snapshot()
+            _, traced_peak = tracemalloc.get_traced_memory()
+        finally:
+            _release_tracing()
+        rss_after = current_rss()
+        lines = [
+            f"# label: {self.label}",
+            f"# traced_peak_bytes: {traced_peak}",
+            f"# rss_before_bytes: {self.rss_before}",
+            f"# rss_after_bytes: {rss_after}",
+            f"# top {MEMORY_TOP_SITES} allocation sites by growth",
+        ]
+        for stat in after.compare_to(self.before, "lineno")[:MEMORY_TOP_SITES]:
+            frame = stat.traceback[0]
+            lines.append(f"{stat.size_diff:+12,d} B {stat.count_diff:+8,d} blocks  {frame.filename}:{frame.lineno}")
+        output_dir.mkdir(parents=True, exist_ok=True)
+        target = output_dir / self.name
+        tmp_path = target.with_name(f".{self.name}.tmp")
+        tmp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        tmp_path.replace(target)
+        for stale in list_reports(output_dir)[MEMORY_KEEP_FILES:]:
+            try:
+                (output_dir / stale["name"]).unlink()
+            except OSError:
+                pass
+        _over_budget_check(self.label, rss_after - self.rss_before, traced_peak, self.name)
+        return self.name, traced_peak
+
+
+@contextmanager
+def track(label: str, output_dir: Path):
+    if not job_tracing:
+        yield
+        return
+    session = TraceSession(label)
+    try:
+        yield
+    finally:
+        session.finish(output_dir)
+
+
+def list_reports(output_dir: Path) -> list[dict]:
+    if not output_dir.exists():
+        return []
+    items = []
+    for path in output_dir.glob("memory-*.txt"):
+        stat = path.stat()
+        items.append({"name": path.name, "size": stat.st_size, "modified": stat.st_mtime})
+    items.sort(key=lambda item: item["modified"], reverse=True)
+    return items
+
+
+def report_path(output_dir: Path, name: str) -> Path | None:
+    if not re.fullmatch(r"memory-[0-9A-Za-z_.-]+\.txt", name):
+        return None
+    path = output_dir / name
+    return path if path.is_file() else None
+
+
+def route_stats() -> list[dict]:
+    with _route_lock:
+        items = [(route, list(entry)) for route, entry in _route_stats.items()]
+    items.sort(key=lambda item: item[1][2], reverse=True)
+    return [
+        {"route": route, "requests": count, "max_rss": max_rss, "max_growth": max_growth, "max_traced_peak": max_traced}
+        for route, (count, max_rss, max_growth, max_traced) in items
+    ]
+
+
+def over_budget() -> list[dict]:
+    with _route_lock:
+        return list(reversed(_over_budget))
+
+
+def _record_route(route: str, rss_after: int, rss_growth: int, traced_peak: int) -> None:
+    with _route_lock:
+        entry = _route_stats.get(route)
+        if entry is None:
+            entry = _route_stats[route] = [0, 0, 0, 0]
+        entry[0] += 1
+        entry[1] = max(entry[1], rss_after)
+        entry[2] = max(entry[2], rss_growth)
+        entry[3] = max(entry[3], traced_peak)
+
+
+def _wants_trace(scope) -> bool:
+    if MEMORY_QUERY_FLAG in scope.get("query_string", b""):
+        return True
+    return any(key == MEMORY_HEADER for key, _ in scope.get("headers", []))
+
+
+class MemoryMiddleware:
+    def __init__(self, app, *, authorize, output_dir: Path):
+        self.app = app
+        self.authorize = authorize
+        self.output_dir = output_dir
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        session = None
+        if _wants_trace(scope) and await self.authorize(scope):
+            session = TraceSession(f"{scope.get('method', '')}-{scope.get('path', '')}")
+        send_message = send
+        if session is not None:
+
+            async def send_message(message):
+                if message["type"] == "http.response.start":
+                    message["headers"] = [*message.get("headers", []), (b"x-ops-memory", session.name.encode("latin-1"))]
+                await send(message)
+
+        rss_before = session.rss_before if session is not None else current_rss()
+        try:
+            await self.app(scope, receive, send_message)
+        finally:
+            traced_peak = 0
+            if session is not None:
+                _, traced_peak = session.finish(self.output_dir)
+            rss_after = current_rss()
+            route = f"{scope.get('method', '')} {route_label(scope)}"
+            _record_route(route, rss_after, rss_after - rss_before, traced_peak)
+            if session is None:
+                _over_budget_check(route, rss_after - rss_before, 0)
@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (512, 2048, 8192, 32768, 131072, 524288, 2097152)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+QUERY_LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+STARTED_AT = time.time()
+SLOW_QUERY_MS = float(os.getenv("OPS_SLOW_QUERY_MS", "200") or 200)
+STATEMENT_STATS_LIMIT = 500
+REQUEST_TRACE_LIMIT = 2000
+SLOW_QUERY_HISTORY = 100
+SQL_TEXT_LIMIT = 400
+slow_query_logger = logging.getLogger("ops.slow_query")
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(label_names: tuple[str, ...], labels: tuple, extra: str = "") -> str:
+    parts = [
+        f'{name}="' + str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for name, value in zip(label_names, labels)
+    ]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._lock = threading.Lock()
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, labels: tuple = (), amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, labels: tuple = ()) -> float:
+        with self._lock:
+            return self._values.get(labels, 0.0)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}" for labels, value in values]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, labels: tuple = (), value: float = 0.0) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+    def dec(self, labels: tuple = (), amount: float = 1.0) -> None:
+        self.inc(labels, -amount)
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...] = (), buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._values: dict[tuple, list] = {}
+
+    def observe(self, labels: tuple = (), value: float = 0.0) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = sorted((labels, [list(state[0]), state[1], state[2]]) for labels, state in self._values.items())
+        lines = []
+        for labels, (counts, total, count) in values:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, float("inf")), counts):
+                cumulative += bucket_count
+                le = _format_labels(self.label_names, labels, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, labels)} {count}")
+        return lines
+
+
+HTTP_REQUESTS = Counter("ops_http_requests_total", "HTTP requests by route and status.", ("method", "route", "status"))
+HTTP_LATENCY = Histogram("ops_http_request_duration_seconds", "HTTP request latency by route.", ("method", "route"))
+HTTP_RESPONSE_BYTES = Histogram(
+    "ops_http_response_size_bytes", "HTTP response body size by route.", ("method", "route"), SIZE_BUCKETS
+)
+HTTP_IN_FLIGHT = Gauge("ops_http_requests_in_flight", "HTTP requests currently being served.")
+REQUEST_QUERIES = Histogram(
+    "ops_http_request_sqlite_queries", "SQLite statements executed per request.", ("route",), QUERY_COUNT_BUCKETS
+)
+REQUEST_QUERY_SECONDS = Histogram(
+    "ops_http_request_sqlite_seconds", "Time spent in SQLite statements per request.", ("route",)
+)
+SQLITE_QUERIES = Counter("ops_sqlite_queries_total", "SQLite statements executed.")
+SQLITE_QUERY_SECONDS = Histogram(
+    "ops_sqlite_query_duration_seconds", "SQLite statement latency.", (), QUERY_LATENCY_BUCKETS
+)
+SQLITE_WRITE_LOCK_WAIT = Histogram(
+    "ops_sqlite_write_lock_wait_seconds",
+    "Latency of the statement that opens a write transaction, including busy waits for the write lock.",
+    (),
+    QUERY_LATENCY_BUCKETS,
+)
+WRITE_QUEUE_DEPTH = Gauge("ops_write_queue_depth", "Write units waiting for the single-writer thread.")
+WRITE_QUEUE_WAIT_SECONDS = Histogram(
+    "ops_write_queue_wait_seconds", "Time a write unit spent queued before its group started.", (), QUERY_LATENCY_BUCKETS
+)
+WRITE_QUEUE_GROUP_UNITS = Histogram(
+    "ops_write_queue_group_units", "Write units applied per group commit.", (), QUERY_COUNT_BUCKETS
+)
+WRITE_QUEUE_GROUP_SECONDS = Histogram(
+    "ops_write_queue_group_seconds", "Time to apply and commit one write group.", (), QUERY_LATENCY_BUCKETS
+)
+ROUTE_GROUP_LOAD_SECONDS = Histogram(
+    "ops_route_group_load_seconds", "Time to build a lazily mounted route group on its first request.", ("group",)
+)
+METRICS = (
+    HTTP_REQUESTS,
+    HTTP_LATENCY,
+    HTTP_RESPONSE_BYTES,
+    HTTP_IN_FLIGHT,
+    REQUEST_QUERIES,
+    REQUEST_QUERY_SECONDS,
+    SQLITE_QUERIES,
+    SQLITE_QUERY_SECONDS,
+    SQLITE_WRITE_LOCK_WAIT,
+    WRITE_QUEUE_DEPTH,
+    WRITE_QUEUE_WAIT_SECONDS,
+    WRITE_QUEUE_GROUP_UNITS,
+    WRITE_QUEUE_GROUP_SECONDS,
+    ROUTE_GROUP_LOAD_SECONDS,
+)
+
+
+class RequestStats:
+    __slots__ = ("queries", "query_seconds", "statements")
+
+    def __init__(self):
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.statements: list[list] = []
+
+
+CURRENT_REQUEST: ContextVar[RequestStats | None] = ContextVar("ops_current_request", default=None)
+_statement_lock = threading.Lock()
+_statement_stats: dict[str, list] = {}
+_slow_queries: deque[dict] = deque(maxlen=SLOW_QUERY_HISTORY)
+
+
+@lru_cache(maxsize=2048)
+def normalize_sql(sql: str) -> str:
+    text = re.sub(r"\s+", " ", sql).strip()
+    text = re.sub(r"\?(\s*,\s*\?)+", "?, …", text)
+    return text if len(text) <= SQL_TEXT_LIMIT else text[:SQL_TEXT_LIMIT] + " …"
+
+
+def record_query(sql: str, elapsed: float, *, opened_write: bool = False, rowcount: int = -1) -> list:
+    SQLITE_QUERIES.inc()
+    SQLITE_QUERY_SECONDS.observe((), elapsed)
+    if opened_write:
+        SQLITE_WRITE_LOCK_WAIT.observe((), elapsed)
+    trace = [normalize_sql(sql), elapsed, max(rowcount, 0)]
+    stats = CURRENT_REQUEST.get()
+    if stats is None:
+        _fold_statement(trace, "")
+        return trace
+    stats.queries += 1
+    stats.query_seconds += elapsed
+    if len(stats.statements) < REQUEST_TRACE_LIMIT:
+        stats.statements.append(trace)
+    else:
+        _fold_statement(trace, "")
+    return trace
+
+
+def _fold_statement(trace: list, route: str) -> None:
+    sql, elapsed, rows = trace
+    with _statement_lock:
+        entry = _statement_stats.get(sql)
+        if entry is None and len(_statement_stats) < STATEMENT_STATS_LIMIT:
+            entry = _statement_stats[sql] = [0, 0.0, 0.0, 0, route]
+        if entry is not None:
+            entry[0] += 1
+            entry[1] += elapsed
+            entry[2] = max(entry[2], elapsed)
+            entry[3] += rows
+            if route:
+                entry[4] = route
+        if elapsed * 1000 >= SLOW_QUERY_MS:
+            _slow_queries.append(
+                {"at": time.strftime("%Y-%m-%d %H:%M:%S"), "route": route, "ms": round(elapsed * 1000, 1), "rows": rows, "sql": sql}
+            )
+    if elapsed * 1000 >= SLOW_QUERY_MS:
+        slow_query_logger.warning("slow query %.1fms route=%s rows=%s sql=%s", elapsed * 1000, route or "-", rows, sql)
+
+
+def top_statements(limit: int = 50) -> list[dict]:
+    with _statement_lock:
+        items = [(sql, list(entry)) for sql, entry in _statement_stats.items()]
+    items.sort(key=lambda item: item[1][1], reverse=True)
+    return [
+        {"sql": sql, "calls": calls, "total_ms": total * 1000, "avg_ms": total * 1000 / calls, "max_ms": peak * 1000, "rows": rows, "route": route}
+        for sql, (calls, total, peak, rows, route) in items[:limit]
+        if calls
+    ]
+
+
+def slow_queries() -> list[dict]:
+    with _statement_lock:
+        return list(reversed(_slow_queries))
+
+
+def reset_statement_stats() -> None:
+    with _statement_lock:
+        _statement_stats.clear()
+        _slow_queries.clear()
+
+
+def route_label(scope) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path:
+        return path
+    root_path = scope.get("root_path", "")
+    if root_path:
+        return f"{root_path}/*"
+    return "unmatched"
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = CURRENT_REQUEST.set(stats)
+        status_code = 500
+        body_bytes = 0
+
+        async def send_with_metrics(message):
+            nonlocal status_code, body_bytes
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                total_ms = (time.perf_counter() - started) * 1000
+                db_ms = stats.query_seconds * 1000
+                timing = f"db;dur={db_ms:.1f}, render;dur={max(total_ms - db_ms, 0.0):.1f}, total;dur={total_ms:.1f}"
+                message["headers"] = [*message.get("headers", []), (b"server-timing", timing.encode("latin-1"))]
+            elif message["type"] == "http.response.body":
+                body_bytes += len(message.get("body", b""))
+            await send(message)
+
+        started = time.perf_counter()
+        HTTP_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_IN_FLIGHT.dec()
+            CURRENT_REQUEST.reset(token)
+            method = scope.get("method", "")
+            route = route_label(scope)
+            HTTP_REQUESTS.inc((method, route, str(status_code)))
+            HTTP_LATENCY.observe((method, route), elapsed)
+            HTTP_RESPONSE_BYTES.observe((method, route), body_bytes)
+            REQUEST_QUERIES.observe((route,), stats.queries)
+            REQUEST_QUERY_SECONDS.observe((route,), stats.query_seconds)
+            for trace in stats.statements:
+                _fold_statement(trace, f"{method} {route}")
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def render_metrics(*, db_path: Path, threadpool: tuple[int, int] | None = None, rss_bytes: int | None = None) -> str:
+    lines: list[str] = []
+    for metric in METRICS:
+        lines.append(f"# HELP {metric.name} {metric.help_text}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(metric.samples())
+    gauges = [
+        ("ops_process_uptime_seconds", "Seconds since the process started.", round(time.time() - STARTED_AT, 3)),
+        ("ops_process_id", "PID of the worker process that served this scrape.", os.getpid()),
+        ("ops_sqlite_db_size_bytes", "Size of the SQLite database file.", _file_size(db_path)),
+        ("ops_sqlite_wal_size_bytes", "Size of the SQLite write-ahead log.", _file_size(Path(f"{db_path}-wal"))),
+    ]
+    if threadpool is not None:
+        borrowed, total = threadpool
+        gauges.append(("ops_threadpool_busy_threads", "Worker threads currently running sync endpoints.", borrowed))
+        gauges.append(("ops_threadpool_max_threads", "Worker thread limit for sync endpoints.", total))
+    if rss_bytes:
+        gauges.append(("ops_process_resident_memory_bytes", "Resident set size of the server process.", rss_bytes))
+    for name, help_text, value in gauges:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
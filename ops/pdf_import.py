@@ -9,6 +9,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from io import BytesIO
 
+from ops.db import entity_code, entity_code_sql, next_id_sql
+
 SOURCE_TYPE = "pdf_report"
 STATUS_PATTERN = re.compile(r"^(접수|분류완료|배정완료|처리중|처리완료|회신완료|종결|보류|취소|재오픈)$")
 DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
@@ -58,7 +60,7 @@ class ParsedComplaintReport:
     warnings: list[str] = field(default_factory=list)
 
 
-def parse_complaints_pdf_bytes(data: bytes, source_name: str = "") -> ParsedComplaintReport:
+def extract_pdf_pages(data: bytes) -> list[list[str]]:
     try:
         from pypdf import PdfReader
     except ImportError as exc:
@@ -70,8 +72,12 @@ def parse_complaints_pdf_bytes(data: bytes, source_name: str = "") -> ParsedComp
         text = page.extract_text() or ""
         lines = [line.strip() for line in text.splitlines() if line.strip()]
         pages.append(lines)
+    return pages
+
+
+def parse_complaints_pdf_bytes(data: bytes, source_name: str = "") -> ParsedComplaintReport:
     return parse_complaints_pdf_pages(
-        pages,
+        extract_pdf_pages(data),
         source_name=source_name,
         source_fingerprint=hashlib.sha1(data).hexdigest(),
     )
@@ -464,15 +470,16 @@ def import_parsed_complaint_report(
             )
         else:
             cursor = conn.execute(
-                """
+                f"""
                 INSERT INTO complaints(
-                    complaint_code, batch_id, site_name, building_label, unit_number, channel, category_primary,
+                    id, complaint_code, batch_id, site_name, building_label, unit_number, channel, category_primary,
                     category_secondary, facility_id, unit_label, location_detail, requester_name, requester_phone,
                     requester_email, external_assignee_name, source_type, source_reference, title, description,
                     priority, status, response_due_at, resolved_at, closed_at, assignee_user_id, created_by,
                     updated_by, created_at, updated_at
                 )
-                VALUES ('', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, ?, ?, ?, ?)
+                SELECT next_id, {entity_code_sql("CP")}, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, ?, ?, ?, ?
+                FROM {next_id_sql("complaints")}
                 """,
                 (
                     complaint_payload["batch_id"],
@@ -505,7 +512,6 @@ def import_parsed_complaint_report(
                 ),
             )
             complaint_id = int(cursor.lastrowid)
-            _assign_code(conn, "complaints", "complaint_code", "CP", complaint_id)
             complaints_inserted += 1
             _record_import_update(conn, complaint_id, row, default_user_id, complaint_payload["updated_at"])
 
@@ -562,13 +568,14 @@ def import_parsed_complaint_report(
             _record_work_order_update(conn, work_id, row, default_user_id, work_payload["updated_at"], "PDF 재이관")
         else:
             cursor = conn.execute(
-                """
+                f"""
                 INSERT INTO work_orders(
-                    work_code, batch_id, complaint_id, external_assignee_name, source_type, source_reference, category,
+                    id, work_code, batch_id, complaint_id, external_assignee_name, source_type, source_reference, category,
                     title, facility_id, requester_name, priority, status, description, assignee_user_id, due_date,
                     completed_at, created_by, updated_by, created_at, updated_at
                 )
-                VALUES ('', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, ?, ?, ?, ?, ?, ?)
+                SELECT next_id, {entity_code_sql("WO")}, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, ?, ?, ?, ?, ?, ?
+                FROM {next_id_sql("work_orders")}
                 """,
                 (
                     work_payload["batch_id"],
@@ -592,7 +599,6 @@ def import_parsed_complaint_report(
                 ),
             )
             work_id = int(cursor.lastrowid)
-            _assign_code(conn, "work_orders", "work_code", "WO", work_id)
             work_orders_inserted += 1
             _record_work_order_update(conn, work_id, row, default_user_id, work_payload["updated_at"], "PDF 이관")
 
@@ -823,14 +829,15 @@ def _ensure_batch_row(
         return batch_id, batch_code, False
 
     cursor = conn.execute(
-        """
+        f"""
         INSERT INTO complaint_import_batches(
-            batch_code, source_type, source_name, source_fingerprint, site_name, report_title, document_type,
+            id, batch_code, source_type, source_name, source_fingerprint, site_name, report_title, document_type,
             recipient_name, submitter_name, contractor_name, project_name, report_date, report_generated_at,
             latest_received_at, total_complaints, household_count, open_count, closed_count, repeat_count,
             status_summary_json, building_summary_json, raw_payload, created_by, created_at, updated_at
         )
-        VALUES ('', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        SELECT next_id, {entity_code_sql("BATCH")}, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+        FROM {next_id_sql("complaint_import_batches")}
         """,
         (
             SOURCE_TYPE,
@@ -860,7 +867,7 @@ def _ensure_batch_row(
         ),
     )
     batch_id = int(cursor.lastrowid)
-    batch_code = _assign_code(conn, "complaint_import_batches", "batch_code", "BATCH", batch_id)
+    batch_code = entity_code("BATCH", batch_id)
     return batch_id, batch_code, True
 
 
@@ -899,12 +906,13 @@ def _ensure_facility_row(
         return facility_id, False
 
     cursor = conn.execute(
-        """
+        f"""
         INSERT INTO facilities(
-            facility_code, source_type, source_reference, category, name, building, floor, zone, status,
+            id, facility_code, source_type, source_reference, category, name, building, floor, zone, status,
             manager_user_id, note, created_by, updated_by, created_at, updated_at
         )
-        VALUES ('', ?, ?, ?, ?, ?, '', '', '운영중', NULL, ?, ?, ?, ?, ?)
+        SELECT next_id, {entity_code_sql("FAC")}, ?, ?, ?, ?, ?, '', '', '운영중', NULL, ?, ?, ?, ?, ?
+        FROM {next_id_sql("facilities")}
         """,
         (
             SOURCE_TYPE,
@@ -920,7 +928,6 @@ def _ensure_facility_row(
         ),
     )
     facility_id = int(cursor.lastrowid)
-    _assign_code(conn, "facilities", "facility_code", "FAC", facility_id)
     return facility_id, True
 
 
@@ -1051,12 +1058,6 @@ def _record_work_order_update(
     )
 
 
-def _assign_code(conn: sqlite3.Connection, table: str, field: str, prefix: str, row_id: int) -> str:
-    code = f"{prefix}-{row_id:04d}"
-    conn.execute(f"UPDATE {table} SET {field} = ? WHERE id = ?", (code, row_id))
-    return code
-
-
 def _map_primary_category(source_category: str, description: str) -> str:
     joined = f"{source_category} {description}".strip()
     if any(keyword in joined for keyword in ("누수", "루버", "기계", "보일러", "연통")):
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+PROFILE_SAMPLE_INTERVAL = 0.005
+PROFILE_MAX_WINDOW_SECONDS = 120
+PROFILE_KEEP_FILES = 50
+PROFILE_QUERY_FLAG = b"__profile=1"
+PROFILE_HEADER = b"x-ops-profile"
+IDLE_FRAME_FILES = {"threading.py", "selectors.py", "queue.py"}
+
+_active_lock = threading.Lock()
+_active: SamplingProfiler | None = None
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})".replace(";", ":")
+
+
+def _collapse(frame) -> str:
+    if Path(frame.f_code.co_filename).name in IDLE_FRAME_FILES:
+        return ""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class SamplingProfiler:
+    def __init__(self, interval: float = PROFILE_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self.started_at = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name="ops-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Counter[str]:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.samples
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = _collapse(frame)
+                if stack:
+                    self.samples[stack] += 1
+
+
+def _acquire(profiler: SamplingProfiler) -> bool:
+    global _active
+    with _active_lock:
+        if _active is not None:
+            return False
+        _active = profiler
+    profiler.start()
+    return True
+
+
+def _release(profiler: SamplingProfiler) -> Counter[str]:
+    global _active
+    samples = profiler.stop()
+    with _active_lock:
+        if _active is profiler:
+            _active = None
+    return samples
+
+
+def is_running() -> bool:
+    with _active_lock:
+        return _active is not None
+
+
+def profile_name(label: str) -> str:
+    safe_label = re.sub(r"[^0-9A-Za-z_-]+", "-", label).strip("-")[:60] or "request"
+    now = time.time()
+    return f"profile-{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}{int(now * 1000) % 1000:03d}-{safe_label}.collapsed"
+
+
+def write_profile(output_dir: Path, name: str, samples: Counter[str]) -> str:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    target = output_dir / name
+    tmp_path = target.with_name(f".{name}.tmp")
+    tmp_path.write_text("".join(f"{stack} {count}\n" for stack, count in samples.most_common()), encoding="utf-8")
+    tmp_path.replace(target)
+    for stale in list_profiles(output_dir)[PROFILE_KEEP_FILES:]:
+        try:
+            (output_dir / stale["name"]).unlink()
+        except OSError:
+            pass
+    return name
+
+
+def list_profiles(output_dir: Path) -> list[dict]:
+    if not output_dir.exists():
+        return []
+    items = []
+    for path in output_dir.glob("profile-*.collapsed"):
+        stat = path.stat()
+        items.append({"name": path.name, "size": stat.st_size, "modified": stat.st_mtime})
+    items.sort(key=lambda item: item["modified"], reverse=True)
+    return items
+
+
+def profile_path(output_dir: Path, name: str) -> Path | None:
+    if not re.fullmatch(r"profile-[0-9A-Za-z_.-]+\.collapsed", name):
+        return None
+    path = output_dir / name
+    return path if path.is_file() else None
+
+
+def start_window(output_dir: Path, seconds: int, label: str = "window") -> bool:
+    seconds = min(max(int(seconds), 1), PROFILE_MAX_WINDOW_SECONDS)
+    profiler = SamplingProfiler()
+    if not _acquire(profiler):
+        return False
+
+    name = profile_name(f"{label}-{seconds}s")
+
+    def finish() -> None:
+        write_profile(output_dir, name, _release(profiler))
+
+    timer = threading.Timer(seconds, finish)
+    timer.daemon = True
+    timer.start()
+    return True
+
+
+def _wants_profile(scope) -> bool:
+    if PROFILE_QUERY_FLAG in scope.get("query_string", b""):
+        return True
+    return any(key == PROFILE_HEADER for key, _ in scope.get("headers", []))
+
+
+class ProfilerMiddleware:
+    def __init__(self, app, *, authorize, output_dir: Path):
+        self.app = app
+        self.authorize = authorize
+        self.output_dir = output_dir
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not _wants_profile(scope) or not await self.authorize(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = SamplingProfiler()
+        if not _acquire(profiler):
+            await self.app(scope, receive, send)
+            return
+
+        name = profile_name(f"{scope.get('method', '')}-{scope.get('path', '')}")
+
+        async def send_with_profile(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), (b"x-ops-profile", name.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            write_profile(self.output_dir, name, _release(profiler))
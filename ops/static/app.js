@@ -0,0 +1,239 @@
+(() => {
+  let deferredInstallPrompt = null;
+  const installButton = document.getElementById("install-app-btn");
+  const iosTip = document.getElementById("ios-install-tip");
+  const iosDismiss = document.getElementById("ios-install-dismiss");
+  const isIos = /iphone|ipad|ipod/i.test(window.navigator.userAgent);
+  const isStandalone = window.matchMedia("(display-mode: standalone)").matches || window.navigator.standalone === true;
+
+  if ("serviceWorker" in navigator) {
+    const flushOutbox = () => {
+      navigator.serviceWorker.ready.then((registration) => {
+        if (registration.active) {
+          registration.active.postMessage({ type: "flush-outbox" });
+        }
+      });
+    };
+    window.addEventListener("load", () => {
+      navigator.serviceWorker.register("/sw.js").then(flushOutbox).catch((error) => console.warn("sw register failed", error));
+    });
+    window.addEventListener("online", flushOutbox);
+    navigator.serviceWorker.addEventListener("message", (event) => {
+      if (!event.data || event.data.type !== "outbox-replayed") {
+        return;
+      }
+      const notice = document.createElement("div");
+      notice.className = event.data.failed ? "flash error" : "flash ok";
+      if (event.data.failed) {
+        notice.textContent = `서버 오류로 오프라인 업데이트 전송이 중단되었습니다. 전송 ${event.data.sent}건, 대기 ${event.data.pending}건은 기기에 남아 다시 시도합니다.`;
+      } else {
+        notice.textContent = event.data.pending
+          ? `오프라인 업데이트 ${event.data.sent}건을 전송했습니다. (대기 ${event.data.pending}건)`
+          : `오프라인 업데이트 ${event.data.sent}건을 전송했습니다.`;
+      }
+      const nav = document.querySelector(".nav-bar");
+      if (nav) {
+        nav.after(notice);
+      }
+    });
+  }
+
+  window.addEventListener("beforeinstallprompt", (event) => {
+    event.preventDefault();
+    deferredInstallPrompt = event;
+    if (installButton) {
+      installButton.hidden = false;
+    }
+  });
+
+  window.addEventListener("appinstalled", () => {
+    deferredInstallPrompt = null;
+    if (installButton) {
+      installButton.hidden = true;
+    }
+  });
+
+  if (installButton) {
+    installButton.addEventListener("click", async () => {
+      if (!deferredInstallPrompt) {
+        if (isIos && !isStandalone && iosTip) {
+          iosTip.hidden = false;
+        }
+        return;
+      }
+      deferredInstallPrompt.prompt();
+      await deferredInstallPrompt.userChoice;
+      deferredInstallPrompt = null;
+      installButton.hidden = true;
+    });
+  }
+
+  if (iosDismiss) {
+    iosDismiss.addEventListener("click", () => {
+      if (iosTip) {
+        iosTip.hidden = true;
+      }
+    });
+  }
+
+  if (isIos && !isStandalone && iosTip) {
+    iosTip.hidden = false;
+  }
+
+  const renderLookupResults = (field, items) => {
+    const results = field.querySelector(".lookup-results");
+    results.innerHTML = "";
+    const options = [{ value: "", label: field.dataset.blankLabel || "미지정" }].concat(items);
+    options.forEach((item) => {
+      const option = document.createElement("button");
+      option.type = "button";
+      option.className = "lookup-option";
+      option.textContent = item.label;
+      option.addEventListener("mousedown", (event) => event.preventDefault());
+      option.addEventListener("click", () => {
+        field.querySelector("input[type=hidden]").value = item.value;
+        field.querySelector(".lookup-input").value = item.value ? item.label : "";
+        results.hidden = true;
+      });
+      results.appendChild(option);
+    });
+    results.hidden = false;
+  };
+  document.querySelectorAll(".lookup-field[data-lookup-kind]").forEach((field) => {
+    const input = field.querySelector(".lookup-input");
+    const hidden = field.querySelector("input[type=hidden]");
+    const results = field.querySelector(".lookup-results");
+    let lookupTimer = null;
+    let lookupSeq = 0;
+    const search = () => {
+      const seq = ++lookupSeq;
+      fetch("/api/lookup/" + encodeURIComponent(field.dataset.lookupKind) + "?q=" + encodeURIComponent(input.value.trim()), {
+        credentials: "same-origin",
+        headers: { Accept: "application/json" },
+      })
+        .then((response) => (response.ok ? response.json() : Promise.reject(response.status)))
+        .then((payload) => {
+          if (seq === lookupSeq) {
+            renderLookupResults(field, payload.items || []);
+          }
+        })
+        .catch(() => {});
+    };
+    input.addEventListener("input", () => {
+      if (!input.value.trim()) {
+        hidden.value = "";
+      }
+      window.clearTimeout(lookupTimer);
+      lookupTimer = window.setTimeout(search, 200);
+    });
+    input.addEventListener("focus", search);
+    input.addEventListener("blur", () => {
+      results.hidden = true;
+    });
+  });
+
+  const lazyAttachments = document.querySelectorAll(".attachment-lazy[data-attachment-id]");
+  if (lazyAttachments.length) {
+    const pending = new Map();
+    let flushTimer = null;
+    const flush = () => {
+      flushTimer = null;
+      pending.forEach((nodes, entityType) => {
+        pending.delete(entityType);
+        const ids = Array.from(nodes.keys());
+        for (let start = 0; start < ids.length; start += 50) {
+          const chunk = ids.slice(start, start + 50);
+          fetch("/attachments/batch?entity_type=" + encodeURIComponent(entityType) + "&ids=" + chunk.join(","), {
+            credentials: "same-origin",
+            headers: { Accept: "application/json" },
+          })
+            .then((response) => (response.ok ? response.json() : Promise.reject(response.status)))
+            .then((payload) => {
+              chunk.forEach((id) => {
+                const html = payload.items && payload.items[id];
+                nodes.get(id).forEach((node) => {
+                  node.innerHTML = html || "<div class='muted'>첨부 없음</div>";
+                });
+              });
+            })
+            .catch(() => {
+              chunk.forEach((id) => nodes.get(id).forEach((node) => {
+                node.innerHTML = "<div class='muted'>첨부를 불러오지 못했습니다.</div>";
+              }));
+            });
+        }
+      });
+    };
+    const enqueue = (node) => {
+      const entityType = node.dataset.attachmentType;
+      const entityId = node.dataset.attachmentId;
+      if (!pending.has(entityType)) {
+        pending.set(entityType, new Map());
+      }
+      const nodes = pending.get(entityType);
+      if (!nodes.has(entityId)) {
+        nodes.set(entityId, []);
+      }
+      nodes.get(entityId).push(node);
+      if (!flushTimer) {
+        flushTimer = window.setTimeout(flush, 60);
+      }
+    };
+    if ("IntersectionObserver" in window) {
+      const observer = new IntersectionObserver((entries) => {
+        entries.forEach((entry) => {
+          if (entry.isIntersecting) {
+            observer.unobserve(entry.target);
+            enqueue(entry.target);
+          }
+        });
+      }, { rootMargin: "200px 0px" });
+      lazyAttachments.forEach((node) => observer.observe(node));
+    } else {
+      lazyAttachments.forEach(enqueue);
+    }
+  }
+
+  const liveNotice = document.querySelector("[data-live-feed]");
+  if (liveNotice && "EventSource" in window) {
+    const liveKinds = new Set(liveNotice.dataset.liveFeed.split(",").filter(Boolean));
+    const noticeText = liveNotice.querySelector(".live-notice-text");
+    let unseen = 0;
+    const source = new EventSource("/events/stream");
+    source.addEventListener("change", (message) => {
+      const change = JSON.parse(message.data);
+      const row = document.querySelector(`[data-live-key="${change.kind}:${change.id}"]`);
+      if (row) {
+        if (change.action === "delete") {
+          row.classList.add("live-removed");
+          return;
+        }
+        row.querySelectorAll("[data-live-field]").forEach((field) => {
+          const key = field.dataset.liveField;
+          if (key === "status" && change.status_html) {
+            field.innerHTML = change.status_html;
+          } else if (change[key] !== undefined) {
+            field.textContent = change[key];
+          }
+        });
+        row.classList.add("live-updated");
+        return;
+      }
+      if (liveKinds.has(change.kind) && change.action !== "delete") {
+        unseen += 1;
+        noticeText.textContent = `새 변경 사항 ${unseen}건이 있습니다.`;
+        liveNotice.hidden = false;
+      }
+    });
+    source.addEventListener("counters", (message) => {
+      const counters = JSON.parse(message.data).counters || {};
+      Object.entries(counters).forEach(([key, value]) => {
+        document.querySelectorAll(`[data-live-counter="${key}"]`).forEach((node) => {
+          node.textContent = value;
+        });
+      });
+    });
+    liveNotice.querySelector("[data-live-reload]").addEventListener("click", () => window.location.reload());
+    window.addEventListener("pagehide", () => source.close());
+  }
+})();
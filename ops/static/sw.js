@@ -0,0 +1,229 @@
+const PAGE_CACHE_NAME = `${CACHE_NAME}-pages`;
+const CACHED_AT_HEADER = "X-SW-Cached-At";
+const OUTBOX_DB_NAME = "facility-ops-outbox";
+const OUTBOX_STORE = "requests";
+const OUTBOX_SYNC_TAG = "facility-ops-outbox";
+const outboxRoutes = OUTBOX_ROUTES.map((pattern) => new RegExp(pattern));
+
+self.addEventListener("install", (event) => {
+  event.waitUntil(
+    caches.open(CACHE_NAME).then((cache) => cache.addAll(APP_SHELL)).then(() => self.skipWaiting())
+  );
+});
+
+self.addEventListener("activate", (event) => {
+  event.waitUntil(
+    caches.keys().then((keys) =>
+      Promise.all(
+        keys.map((key) => {
+          if (key !== CACHE_NAME && key !== PAGE_CACHE_NAME) {
+            return caches.delete(key);
+          }
+          return Promise.resolve();
+        })
+      )
+    ).then(() => self.clients.claim())
+  );
+});
+
+const purgePages = () => caches.delete(PAGE_CACHE_NAME);
+
+const isLoginRedirect = (response) => response.redirected && new URL(response.url).pathname === "/login";
+
+const storePage = async (request, response) => {
+  if (isLoginRedirect(response)) {
+    await purgePages();
+    return;
+  }
+  const cacheControl = response.headers.get("Cache-Control") || "";
+  if (!response.ok || response.type !== "basic" || response.redirected || cacheControl.includes("no-store")) {
+    return;
+  }
+  const headers = new Headers(response.headers);
+  headers.set(CACHED_AT_HEADER, String(Date.now()));
+  const body = await response.blob();
+  const cache = await caches.open(PAGE_CACHE_NAME);
+  await cache.put(request, new Response(body, { status: response.status, statusText: response.statusText, headers }));
+};
+
+const offlineFallback = async () => (await caches.match("/login")) || Response.error();
+
+const staleWhileRevalidate = async (event, request, ttlSeconds) => {
+  const cache = await caches.open(PAGE_CACHE_NAME);
+  const cached = await cache.match(request);
+  const refresh = fetch(request).then((response) => {
+    event.waitUntil(storePage(request, response.clone()));
+    return response;
+  });
+  if (cached) {
+    const ageSeconds = (Date.now() - Number(cached.headers.get(CACHED_AT_HEADER) || 0)) / 1000;
+    if (ageSeconds < ttlSeconds) {
+      event.waitUntil(refresh.catch(() => null));
+      return cached;
+    }
+  }
+  try {
+    return await refresh;
+  } catch (error) {
+    return cached || offlineFallback();
+  }
+};
+
+const outboxRequest = (mode, action) =>
+  new Promise((resolve, reject) => {
+    const open = indexedDB.open(OUTBOX_DB_NAME, 1);
+    open.onupgradeneeded = () => open.result.createObjectStore(OUTBOX_STORE, { keyPath: "id", autoIncrement: true });
+    open.onerror = () => reject(open.error);
+    open.onsuccess = () => {
+      const db = open.result;
+      const tx = db.transaction(OUTBOX_STORE, mode);
+      const request = action(tx.objectStore(OUTBOX_STORE));
+      tx.oncomplete = () => {
+        db.close();
+        resolve(request.result);
+      };
+      tx.onerror = tx.onabort = () => {
+        db.close();
+        reject(tx.error);
+      };
+    };
+  });
+
+const notifyClients = async (message) => {
+  const windows = await self.clients.matchAll({ type: "window", includeUncontrolled: true });
+  windows.forEach((client) => client.postMessage(message));
+};
+
+const queuedPage = (backHref) => `<!doctype html>
+<html lang="ko">
+<head>
+  <meta charset="utf-8"/>
+  <meta name="viewport" content="width=device-width, initial-scale=1"/>
+  <title>오프라인 저장</title>
+  <link rel="stylesheet" href="${APP_CSS}"/>
+</head>
+<body>
+  <div class="shell">
+    <section class="panel">
+      <h2>오프라인 저장됨</h2>
+      <div class="muted">네트워크 연결이 없어 업데이트를 기기에 보관했습니다. 연결이 복구되면 자동으로 전송됩니다.</div>
+      <div class="row-actions" style="margin-top:16px;"><a class="btn primary" href="${backHref}">돌아가기</a></div>
+    </section>
+  </div>
+</body>
+</html>`;
+
+const queueOrSend = async (event, request) => {
+  const copy = request.clone();
+  try {
+    const response = await fetch(request);
+    event.waitUntil(purgePages());
+    return response;
+  } catch (error) {
+    const form = await copy.formData();
+    const fields = [];
+    form.forEach((value, name) => fields.push([name, value]));
+    await outboxRequest("readwrite", (store) => store.add({ url: request.url, fields, queuedAt: Date.now() }));
+    if (self.registration.sync) {
+      await self.registration.sync.register(OUTBOX_SYNC_TAG).catch(() => null);
+    }
+    const backHref = request.referrer && new URL(request.referrer).origin === self.location.origin ? request.referrer : "/";
+    return new Response(queuedPage(backHref), { status: 202, headers: { "Content-Type": "text/html; charset=utf-8" } });
+  }
+};
+
+const replayOutbox = async () => {
+  const entries = await outboxRequest("readonly", (store) => store.getAll());
+  let sent = 0;
+  let failed = false;
+  for (const entry of entries) {
+    const body = new FormData();
+    entry.fields.forEach(([name, value]) => {
+      if (value instanceof Blob) {
+        body.append(name, value, value.name || "");
+      } else {
+        body.append(name, value);
+      }
+    });
+    let response;
+    try {
+      response = await fetch(entry.url, { method: "POST", body, credentials: "same-origin" });
+    } catch (error) {
+      break;
+    }
+    if (isLoginRedirect(response)) {
+      break;
+    }
+    if (!response.ok) {
+      failed = true;
+      break;
+    }
+    await outboxRequest("readwrite", (store) => store.delete(entry.id));
+    sent += 1;
+  }
+  if (sent) {
+    await purgePages();
+  }
+  if (sent || failed) {
+    await notifyClients({ type: "outbox-replayed", sent, failed, pending: entries.length - sent });
+  }
+  if (failed) {
+    throw new Error("outbox replay stopped on a server error");
+  }
+};
+
+self.addEventListener("sync", (event) => {
+  if (event.tag === OUTBOX_SYNC_TAG) {
+    event.waitUntil(replayOutbox());
+  }
+});
+
+self.addEventListener("message", (event) => {
+  if (event.data && event.data.type === "flush-outbox") {
+    event.waitUntil(replayOutbox().catch(() => null));
+  }
+});
+
+self.addEventListener("fetch", (event) => {
+  const request = event.request;
+  const url = new URL(request.url);
+  if (url.origin !== self.location.origin) {
+    return;
+  }
+
+  if (request.method !== "GET") {
+    if (request.method === "POST" && outboxRoutes.some((pattern) => pattern.test(url.pathname))) {
+      event.respondWith(queueOrSend(event, request));
+      return;
+    }
+    event.waitUntil(purgePages());
+    return;
+  }
+
+  if (request.mode === "navigate") {
+    const ttlSeconds = PAGE_TTLS[url.pathname];
+    if (ttlSeconds && !url.searchParams.has("msg")) {
+      event.respondWith(staleWhileRevalidate(event, request, ttlSeconds));
+      return;
+    }
+    event.respondWith(fetch(request).catch(offlineFallback));
+    return;
+  }
+
+  if (url.pathname.startsWith("/assets/") || url.pathname === "/manifest.webmanifest") {
+    event.respondWith(
+      caches.match(request).then((cached) => {
+        if (cached) {
+          return cached;
+        }
+        return fetch(request).then((response) => {
+          if (response.ok) {
+            const copy = response.clone();
+            caches.open(CACHE_NAME).then((cache) => cache.put(request, copy));
+          }
+          return response;
+        });
+      })
+    );
+  }
+});
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from typing import Iterable
+
+from ops import db as ops_db
+
+TABLE_STATS_MAX_AGE_SECONDS = max(int(os.getenv("OPS_TABLE_STATS_MAX_AGE", "300") or 300), 0)
+TABLE_STATS_MIN_REFRESH_SECONDS = 30
+
+stats_logger = logging.getLogger("ops.table_stats")
+_refresh_lock = threading.Lock()
+_refresh_thread: threading.Thread | None = None
+
+
+def refresh(conn: sqlite3.Connection, table_names: Iterable[str]) -> dict[str, int]:
+    names = list(table_names)
+    versions = ops_db.table_versions(conn, names)
+    counts = {name: int(conn.execute(f"SELECT COUNT(*) AS count FROM {name}").fetchone()["count"]) for name in names}
+    conn.executemany(
+        """
+        INSERT INTO table_stats(table_name, row_count, version, refreshed_at)
+        VALUES (?, ?, ?, datetime('now', 'localtime'))
+        ON CONFLICT(table_name) DO UPDATE SET
+            row_count = excluded.row_count,
+            version = excluded.version,
+            refreshed_at = excluded.refreshed_at
+        """,
+        [(name, counts[name], versions.get(name)) for name in names],
+    )
+    return counts
+
+
+def _stat1_estimates(conn: sqlite3.Connection, names: list[str]) -> dict[str, int]:
+    if not ops_db._table_exists(conn, "sqlite_stat1"):
+        return {}
+    placeholders = ",".join(["?"] * len(names))
+    estimates: dict[str, int] = {}
+    for row in conn.execute(f"SELECT tbl, stat FROM sqlite_stat1 WHERE tbl IN ({placeholders})", names).fetchall():
+        head = str(row["stat"] or "").split(" ", 1)[0]
+        if head.isdigit():
+            estimates[row["tbl"]] = max(estimates.get(row["tbl"], 0), int(head))
+    return estimates
+
+
+def read(conn: sqlite3.Connection, table_names: Iterable[str]) -> dict[str, dict]:
+    names = list(table_names)
+    if not names:
+        return {}
+    placeholders = ",".join(["?"] * len(names))
+    rows = conn.execute(
+        f"""
+        SELECT s.table_name, s.row_count, s.version, s.refreshed_at, v.version AS current_version,
+               CAST((julianday('now', 'localtime') - julianday(s.refreshed_at)) * 86400 AS INTEGER) AS age_seconds
+        FROM table_stats s
+        LEFT JOIN table_versions v ON v.table_name = s.table_name
+        WHERE s.table_name IN ({placeholders})
+        """,
+        names,
+    ).fetchall()
+    cached = {row["table_name"]: row for row in rows}
+    estimates = _stat1_estimates(conn, [name for name in names if name not in cached])
+    stats = {}
+    for name in names:
+        row = cached.get(name)
+        if row is None:
+            stats[name] = {"count": estimates.get(name), "exact": False, "refreshed_at": "", "stale": True}
+            continue
+        age = int(row["age_seconds"] or 0)
+        if row["current_version"] is None:
+            exact = age < TABLE_STATS_MAX_AGE_SECONDS
+        else:
+            exact = row["version"] == row["current_version"]
+        stats[name] = {
+            "count": int(row["row_count"]),
+            "exact": exact,
+            "refreshed_at": row["refreshed_at"],
+            "stale": not exact and age >= TABLE_STATS_MIN_REFRESH_SECONDS,
+        }
+    return stats
+
+
+def _refresh_in_background(table_names: list[str]) -> None:
+    global _refresh_thread
+    try:
+        conn = ops_db.get_conn()
+        try:
+            refresh(conn, table_names)
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        stats_logger.exception("table stats refresh failed for %s", ", ".join(table_names))
+    finally:
+        with _refresh_lock:
+            _refresh_thread = None
+
+
+def schedule_refresh(table_names: Iterable[str]) -> threading.Thread | None:
+    global _refresh_thread
+    names = list(table_names)
+    if not names:
+        return None
+    with _refresh_lock:
+        if _refresh_thread is not None:
+            return None
+        _refresh_thread = threading.Thread(target=_refresh_in_background, args=(names,), name="ops-table-stats", daemon=True)
+        _refresh_thread.start()
+        return _refresh_thread
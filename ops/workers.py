@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import os
+
+
+def worker_count(raw: str | None = None) -> int:
+    value = str(os.getenv("OPS_WORKERS", "1") if raw is None else raw).strip().lower()
+    if value == "auto":
+        return max(os.cpu_count() or 1, 1)
+    try:
+        return max(int(value or 1), 1)
+    except ValueError:
+        return 1
+
+
+if __name__ == "__main__":
+    print(worker_count())
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import contextvars
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable
+
+import anyio
+
+from ops import db as ops_db, metrics
+
+WRITE_QUEUE_ENABLED = str(os.getenv("OPS_WRITE_QUEUE", "")).strip().lower() in {"1", "true", "on", "yes"}
+WRITE_GROUP_MAX_UNITS = max(int(os.getenv("OPS_WRITE_GROUP_MAX_UNITS", "32") or 32), 1)
+WRITE_GROUP_WAIT_SECONDS = float(os.getenv("OPS_WRITE_GROUP_WAIT_MS", "2") or 2) / 1000
+WRITE_QUEUE_STOP_TIMEOUT = 10.0
+
+writer_logger = logging.getLogger("ops.writer")
+_STOP = object()
+_writer: WriteQueue | None = None
+_writer_lock = threading.Lock()
+
+WriteUnit = Callable[[sqlite3.Connection], Any]
+
+
+class WriteQueue:
+    def __init__(self, *, max_units: int = WRITE_GROUP_MAX_UNITS, wait_seconds: float = WRITE_GROUP_WAIT_SECONDS):
+        self.max_units = max_units
+        self.wait_seconds = wait_seconds
+        self.groups = 0
+        self.units = 0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._thread = threading.Thread(target=self._loop, name="ops-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = WRITE_QUEUE_STOP_TIMEOUT) -> None:
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                metrics.WRITE_QUEUE_DEPTH.dec()
+                item[2].set_exception(RuntimeError("write queue stopped"))
+
+    def submit(self, unit: WriteUnit) -> Future:
+        if not self.running:
+            raise RuntimeError("write queue is not running")
+        future: Future = Future()
+        metrics.WRITE_QUEUE_DEPTH.inc()
+        self._queue.put((unit, contextvars.copy_context(), future, time.perf_counter()))
+        return future
+
+    def _collect(self, first) -> tuple[list, bool]:
+        group = [first]
+        deadline = time.perf_counter() + self.wait_seconds
+        while len(group) < self.max_units:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return group, True
+            group.append(item)
+        return group, False
+
+    def _loop(self) -> None:
+        conn = ops_db.get_conn()
+        try:
+            stopping = False
+            while not stopping:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                group, stopping = self._collect(item)
+                metrics.WRITE_QUEUE_DEPTH.dec(amount=len(group))
+                try:
+                    self._apply(conn, group)
+                except Exception as exc:
+                    writer_logger.exception("write group of %s units failed", len(group))
+                    if conn.in_transaction:
+                        conn.rollback()
+                    for _, _, future, _ in group:
+                        if not future.done():
+                            future.set_exception(exc)
+        finally:
+            conn.close()
+
+    def _apply(self, conn: sqlite3.Connection, group: list) -> None:
+        started = time.perf_counter()
+        outcomes: list[tuple[Future, Any, BaseException | None]] = []
+        conn.execute("BEGIN IMMEDIATE")
+        for unit, context, future, queued_at in group:
+            metrics.WRITE_QUEUE_WAIT_SECONDS.observe(value=started - queued_at)
+            if not future.set_running_or_notify_cancel():
+                continue
+            callbacks = len(conn.after_commit)
+            pending = dict(conn.pending_changes)
+            conn.execute("SAVEPOINT write_unit")
+            try:
+                result = context.run(unit, conn)
+            except Exception as exc:
+                conn.execute("ROLLBACK TO write_unit")
+                conn.execute("RELEASE write_unit")
+                del conn.after_commit[callbacks:]
+                conn.pending_changes = pending
+                outcomes.append((future, None, exc))
+            else:
+                conn.execute("RELEASE write_unit")
+                outcomes.append((future, result, None))
+        conn.commit()
+        self.groups += 1
+        self.units += len(outcomes)
+        metrics.WRITE_QUEUE_GROUP_UNITS.observe(value=len(outcomes))
+        metrics.WRITE_QUEUE_GROUP_SECONDS.observe(value=time.perf_counter() - started)
+        for future, result, exc in outcomes:
+            if exc is None:
+                future.set_result(result)
+            else:
+                future.set_exception(exc)
+
+
+def _run_direct(unit: WriteUnit):
+    conn = ops_db.get_conn()
+    try:
+        result = unit(conn)
+        conn.commit()
+        return result
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def start() -> WriteQueue:
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = WriteQueue()
+            atexit.register(stop)
+        _writer.start()
+        return _writer
+
+
+def stop() -> None:
+    with _writer_lock:
+        if _writer is not None:
+            _writer.stop()
+
+
+def active() -> WriteQueue | None:
+    return _writer if _writer is not None and _writer.running else None
+
+
+def run(unit: WriteUnit):
+    writer = active()
+    if writer is None:
+        return _run_direct(unit)
+    return writer.submit(unit).result()
+
+
+async def run_async(unit: WriteUnit):
+    writer = active()
+    if writer is None:
+        return await anyio.to_thread.run_sync(_run_direct, unit)
+    return await asyncio.wrap_future(writer.submit(unit))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import multiprocessing
 import os
 import socket
 import sys
@@ -9,6 +10,8 @@ from pathlib import Path
 
 import uvicorn
 
+from ops.workers import worker_count
+
 
 def _runtime_root() -> Path:
     if getattr(sys, "frozen", False):
@@ -93,6 +96,13 @@ def main() -> None:
     os.environ.setdefault("OPS_UPLOAD_DIR", str(data_root / "uploads"))
     os.environ.setdefault("OPS_COOKIE_SECURE", "true" if scheme == "https" else "false")
     os.chdir(runtime_root)
+    workers = worker_count()
+    os.environ["OPS_WORKERS"] = str(workers)
+
+    from ops import bootstrap
+
+    schema_steps = bootstrap.describe(bootstrap.run())
+    os.environ[bootstrap.BOOTSTRAP_DONE_ENV] = "1"
 
     print("시설 운영 시스템 서버를 시작합니다.")
     print(f"실행 위치: {runtime_root}")
@@ -102,6 +112,9 @@ def main() -> None:
         print(f"HTTPS 개인키: {key_path}")
     else:
         print("HTTPS 인증서가 없어 HTTP 모드로 실행합니다.")
+    print(f"워커 프로세스: {workers}개")
+    for line in schema_steps:
+        print(line)
     print("접속 주소:")
     for ip in _local_ips():
         print(f"  {scheme}://{ip}:{port}")
@@ -114,10 +127,12 @@ def main() -> None:
         host="0.0.0.0",
         port=port,
         log_level="info",
+        workers=workers,
         ssl_certfile=str(cert_path) if cert_path else None,
         ssl_keyfile=str(key_path) if key_path else None,
     )
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
@@ -1,24 +1,46 @@
 from __future__ import annotations
 
+import asyncio
+import base64
 import os
+import hashlib
 import json
+import logging
+import re
+import secrets
 import sqlite3
 import uuid
 from io import BytesIO
+from logging.handlers import RotatingFileHandler
 from collections import Counter
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Iterable, List
-from urllib.parse import urlencode
+from urllib.parse import quote, urlencode
 
+import anyio
 from fastapi import FastAPI, File, Form, Request, UploadFile
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.openapi.utils import get_openapi
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-
-from ops import auth, db as ops_db, pdf_import
-from ops.db import get_conn, init_db, migrate_legacy_tools
+from starlette.concurrency import run_in_threadpool
+
+from ops import auth, bootstrap, db as ops_db, events, lazy_routes, memory, metrics, pdf_import, profiler, table_stats, writer
+from ops.assets import (
+    ASSET_BUILD_DIR,
+    ASSET_VERSION,
+    STATIC_DIR,
+    FingerprintedStaticFiles,
+    asset_url,
+    asset_urls,
+    assets_ready,
+    emit_assets,
+)
+from ops.db import get_conn
 from ops.ui import (
     attachment_gallery,
+    attachment_placeholder,
     attachment_selector,
     empty_state,
     esc,
@@ -26,6 +48,9 @@ from ops.ui import (
     fmt_datetime,
     info_box,
     layout,
+    layout_shell,
+    live_feed_notice,
+    lookup_field,
     metric_card,
     page_header,
     render_options,
@@ -35,29 +60,82 @@ from ops.ui import (
 BASE_DIR = Path(__file__).resolve().parent
 ASSETS_DIR = BASE_DIR / "assets"
 ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+ASSET_BUILD_DIR.mkdir(parents=True, exist_ok=True)
 UPLOAD_DIR = Path(os.getenv("OPS_UPLOAD_DIR", str(BASE_DIR / "uploads")))
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 COOKIE_SECURE = str(os.getenv("OPS_COOKIE_SECURE", "")).strip().lower() in {"1", "true", "on", "yes"}
-PWA_CACHE_VERSION = "facility-ops-v1"
+PWA_CACHE_VERSION = f"facility-ops-{ASSET_VERSION}"
+METRICS_TOKEN = os.getenv("OPS_METRICS_TOKEN", "").strip()
+METRICS_PUBLIC = str(os.getenv("OPS_METRICS_PUBLIC", "")).strip().lower() in {"1", "true", "on", "yes"}
+SQL_STATS_TOP_N = 50
+SLOW_QUERY_LOG_PATH = ops_db.DB_PATH.parent / "slow_queries.log"
+PROFILE_DIR = ops_db.DB_PATH.parent / "profiles"
+MEMORY_DIR = ops_db.DB_PATH.parent / "memory"
+MEMORY_BUDGET_LOG_PATH = ops_db.DB_PATH.parent / "memory_budget.log"
+PWA_SERVICE_WORKER_SOURCE = (STATIC_DIR / "sw.js").read_text(encoding="utf-8")
+PWA_ICON_PATHS = ("/assets/pwa/icon-192.png", "/assets/pwa/icon-512.png", "/assets/pwa/apple-touch-icon.png")
+PWA_PAGE_TTLS = {
+    "/": 60,
+    "/complaints": 60,
+    "/work-orders": 60,
+    "/inventory": 300,
+    "/office-records": 300,
+    "/reports": 300,
+    "/facilities": 600,
+    "/contacts": 600,
+}
+PWA_OUTBOX_ROUTES = (r"^/work-orders/update/\d+$", r"^/complaints/update/\d+$")
+
+
+async def _profiler_authorize(scope) -> bool:
+    user = await run_in_threadpool(auth.get_user_by_session, Request(scope).cookies.get(auth.SESSION_COOKIE))
+    return bool(user) and auth.has_permission(user["role"], "db:raw:view")
+
 
 app = FastAPI(title="시설 운영 시스템")
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+app.add_middleware(profiler.ProfilerMiddleware, authorize=_profiler_authorize, output_dir=PROFILE_DIR)
+app.add_middleware(memory.MemoryMiddleware, authorize=_profiler_authorize, output_dir=MEMORY_DIR)
+app.add_middleware(metrics.MetricsMiddleware)
+app.mount("/assets/build", FingerprintedStaticFiles(directory=str(ASSET_BUILD_DIR)), name="asset_build")
 app.mount("/assets", StaticFiles(directory=str(ASSETS_DIR)), name="assets")
 app.mount("/uploads", StaticFiles(directory=str(UPLOAD_DIR)), name="uploads")
+auth_routes = lazy_routes.mount(app.router.routes, "auth")
+facility_routes = lazy_routes.mount(app.router.routes, "facilities")
+contact_routes = lazy_routes.mount(app.router.routes, "contacts")
+office_record_routes = lazy_routes.mount(app.router.routes, "office_records")
+inventory_routes = lazy_routes.mount(app.router.routes, "inventory")
+work_order_routes = lazy_routes.mount(app.router.routes, "work_orders")
+complaint_routes = lazy_routes.mount(app.router.routes, "complaints")
+report_routes = lazy_routes.mount(app.router.routes, "reports")
+admin_routes = lazy_routes.mount(app.router.routes, "admin")
 
 
-def _bootstrap() -> None:
-    init_db()
-    auth.ensure_admin_user()
-    conn = get_conn()
-    admin_user = conn.execute(
-        "SELECT id FROM users WHERE username = ?",
-        (auth.DEFAULT_ADMIN_USERNAME,),
-    ).fetchone()
-    conn.close()
-    migrate_legacy_tools(admin_user["id"] if admin_user else None)
+def _openapi() -> dict:
+    if not app.openapi_schema:
+        app.openapi_schema = get_openapi(title=app.title, version=app.version, routes=lazy_routes.expand(app.routes))
+    return app.openapi_schema
+
+
+app.openapi = _openapi
+
+_slow_query_handler = RotatingFileHandler(SLOW_QUERY_LOG_PATH, maxBytes=1_000_000, backupCount=3, encoding="utf-8", delay=True)
+_slow_query_handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+metrics.slow_query_logger.addHandler(_slow_query_handler)
+_memory_budget_handler = RotatingFileHandler(MEMORY_BUDGET_LOG_PATH, maxBytes=1_000_000, backupCount=3, encoding="utf-8", delay=True)
+_memory_budget_handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+memory.memory_logger.addHandler(_memory_budget_handler)
 
 
-_bootstrap()
+if not bootstrap.already_done():
+    bootstrap.run()
+if not assets_ready(ASSET_BUILD_DIR):
+    emit_assets(ASSET_BUILD_DIR, sweep=False)
+bootstrap.start_legacy_migration()
+if writer.WRITE_QUEUE_ENABLED:
+    writer.start()
+events.start_relay(get_conn)
+events.start_counters(get_conn)
 
 
 def _now_text() -> str:
@@ -85,6 +163,74 @@ ENTITY_ATTACHMENT_LIMIT_META = {
     "inventory": ("첨부 이미지는", "장"),
     "office_record": ("첨부 파일과 이미지는", "개"),
 }
+ATTACHMENT_ENTITY_PERMISSIONS = {
+    "facility": "facilities:view",
+    "inventory": "inventory:view",
+    "work_order": "work_orders:view",
+    "complaint": "complaints:view",
+    "office_record": "office_records:view",
+}
+ATTACHMENT_LINK_ONLY_ENTITIES = {"office_record"}
+ATTACHMENT_BATCH_LIMIT = 100
+LIST_STREAM_CHUNK_ROWS = 200
+LIVE_FEED_HEARTBEAT_SECONDS = 20
+SYNC_BATCH_LIMIT = 500
+SYNC_SOURCES = {
+    "work_orders": {
+        "permission": "work_orders:view",
+        "table": "work_orders",
+        "select_sql": """
+            SELECT id, work_code, title, category, priority, status, description, due_date, complaint_id, facility_id,
+                   (SELECT name FROM facilities WHERE facilities.id = work_orders.facility_id) AS facility_name, updated_at
+            FROM work_orders
+        """,
+        "scope_sql": "status NOT IN ('완료', '종결') AND assignee_user_id = ?",
+        "scoped_to_user": True,
+    },
+    "complaints": {
+        "permission": "complaints:view",
+        "table": "complaints",
+        "select_sql": """
+            SELECT id, complaint_code, title, priority, status, description, unit_label, location_detail,
+                   requester_name, requester_phone, response_due_at, facility_id, updated_at
+            FROM complaints
+        """,
+        "scope_sql": "status NOT IN ('종결', '취소') AND assignee_user_id = ?",
+        "scoped_to_user": True,
+    },
+    "inventory": {
+        "permission": "inventory:view",
+        "table": "inventory_items",
+        "select_sql": """
+            SELECT id, item_code, name, category, quantity, min_quantity, unit, location, status, updated_at
+            FROM inventory_items
+        """,
+        "scope_sql": "1 = 1",
+        "scoped_to_user": False,
+    },
+}
+LIVE_FEED_RETRY_MS = 5000
+PAGE_ETAG_TABLES = {
+    "dashboard": ops_db.VERSIONED_TABLES,
+    "reports": ops_db.VERSIONED_TABLES,
+    "complaints": (
+        "users",
+        "facilities",
+        "complaints",
+        "complaint_updates",
+        "complaint_feedback",
+        "complaint_response_templates",
+        "work_orders",
+        "attachments",
+    ),
+    "work_orders": ("users", "facilities", "complaints", "work_orders", "work_order_updates", "attachments"),
+    "api_complaints": ("users", "facilities", "complaints", "complaint_feedback", "work_orders"),
+    "api_work_orders": ("users", "facilities", "complaints", "work_orders"),
+    "api_inventory": ("inventory_items",),
+    "api_facilities": ("users", "facilities"),
+}
+API_PAGE_LIMIT = 50
+API_MAX_PAGE_LIMIT = 200
 COMPLAINT_CLOSED_STATUSES = {"종결", "취소"}
 COMPLAINT_SLA_DAYS = {"긴급": 0, "높음": 1, "보통": 3, "낮음": 5}
 COMPLAINT_REPEAT_WINDOW_DAYS = 90
@@ -119,6 +265,71 @@ def _flash_from_request(request: Request) -> tuple[str, str]:
     return request.query_params.get("msg", ""), request.query_params.get("level", "info")
 
 
+def _page_etag(request: Request, user, page: str) -> str:
+    conn = get_conn()
+    versions = ops_db.table_versions(conn, PAGE_ETAG_TABLES[page])
+    conn.close()
+    payload = json.dumps(
+        [
+            page,
+            user["id"],
+            user["role"],
+            _today_text(),
+            ASSET_VERSION,
+            sorted(request.query_params.multi_items()),
+            sorted(versions.items()),
+        ],
+        ensure_ascii=False,
+    )
+    return 'W/"' + hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def _etag_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match", "")
+    if not header:
+        return False
+    candidates = {value.strip() for value in header.split(",")}
+    return "*" in candidates or etag in candidates or etag.removeprefix("W/") in candidates
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=_etag_headers(etag))
+
+
+def _stream_list_page(
+    *,
+    title: str,
+    user,
+    flash_message: str,
+    flash_level: str,
+    before_rows: str,
+    conn,
+    cursor,
+    first_rows: list,
+    render_row,
+    after_rows: str,
+    headers: dict[str, str] | None = None,
+) -> StreamingResponse:
+    head, tail = layout_shell(title=title, user=user, flash_message=flash_message, flash_level=flash_level)
+
+    def generate():
+        try:
+            yield head + before_rows
+            rows = first_rows
+            while rows:
+                yield "".join(render_row(row) for row in rows)
+                rows = cursor.fetchmany(LIST_STREAM_CHUNK_ROWS)
+            yield after_rows + tail
+        finally:
+            conn.close()
+
+    return StreamingResponse(generate(), media_type="text/html; charset=utf-8", headers=headers)
+
+
 @app.get("/manifest.webmanifest")
 def pwa_manifest():
     return JSONResponse(
@@ -161,89 +372,19 @@ def pwa_manifest():
 
 @app.get("/sw.js")
 def pwa_service_worker():
-    script = f"""
-const CACHE_NAME = "{PWA_CACHE_VERSION}";
-const APP_SHELL = [
-  "/login",
-  "/manifest.webmanifest",
-  "/assets/pwa/icon-192.png",
-  "/assets/pwa/icon-512.png",
-  "/assets/pwa/apple-touch-icon.png"
-];
-
-self.addEventListener("install", (event) => {{
-  event.waitUntil(
-    caches.open(CACHE_NAME).then((cache) => cache.addAll(APP_SHELL)).then(() => self.skipWaiting())
-  );
-}});
-
-self.addEventListener("activate", (event) => {{
-  event.waitUntil(
-    caches.keys().then((keys) =>
-      Promise.all(
-        keys.map((key) => {{
-          if (key !== CACHE_NAME) {{
-            return caches.delete(key);
-          }}
-          return Promise.resolve();
-        }})
-      )
-    ).then(() => self.clients.claim())
-  );
-}});
-
-self.addEventListener("fetch", (event) => {{
-  const request = event.request;
-  if (request.method !== "GET") {{
-    return;
-  }}
-
-  const url = new URL(request.url);
-  if (url.origin !== self.location.origin) {{
-    return;
-  }}
-
-  if (request.mode === "navigate") {{
-    event.respondWith(
-      fetch(request)
-        .then((response) => {{
-          const copy = response.clone();
-          caches.open(CACHE_NAME).then((cache) => cache.put(request, copy));
-          return response;
-        }})
-        .catch(async () => (await caches.match(request)) || (await caches.match("/login")))
-    );
-    return;
-  }}
-
-  if (url.pathname.startsWith("/assets/") || url.pathname === "/manifest.webmanifest") {{
-    event.respondWith(
-      caches.match(request).then((cached) => {{
-        if (cached) {{
-          return cached;
-        }}
-        return fetch(request).then((response) => {{
-          const copy = response.clone();
-          caches.open(CACHE_NAME).then((cache) => cache.put(request, copy));
-          return response;
-        }});
-      }})
-    );
-    return;
-  }}
-
-  event.respondWith(
-    fetch(request)
-      .then((response) => {{
-        const copy = response.clone();
-        caches.open(CACHE_NAME).then((cache) => cache.put(request, copy));
-        return response;
-      }})
-      .catch(() => caches.match(request))
-  );
-}});
-""".strip()
-    return Response(content=script, media_type="application/javascript")
+    config = {
+        "CACHE_NAME": PWA_CACHE_VERSION,
+        "APP_SHELL": ["/login", "/manifest.webmanifest", *asset_urls(), *PWA_ICON_PATHS],
+        "APP_CSS": asset_url("app.css"),
+        "PAGE_TTLS": PWA_PAGE_TTLS,
+        "OUTBOX_ROUTES": list(PWA_OUTBOX_ROUTES),
+    }
+    header = "".join(f"const {name} = {json.dumps(value, ensure_ascii=False)};\n" for name, value in config.items())
+    return Response(
+        content=header + PWA_SERVICE_WORKER_SOURCE,
+        media_type="application/javascript",
+        headers={"Cache-Control": "no-cache"},
+    )
 
 
 def _admin_bootstrap_message() -> str:
@@ -414,6 +555,15 @@ def _authorize(request: Request, permission: str | None = None):
     return user, None
 
 
+def _authorize_api(request: Request, permission: str | None = None):
+    user = auth.get_user_by_session(request.cookies.get(auth.SESSION_COOKIE))
+    if not user:
+        return None, JSONResponse(status_code=401, content={"ok": False, "detail": "로그인이 필요합니다."})
+    if permission and not auth.has_permission(user["role"], permission):
+        return None, JSONResponse(status_code=403, content={"ok": False, "detail": "접근 권한이 부족합니다."})
+    return user, None
+
+
 def _upload_file(file: UploadFile) -> str | None:
     filename = (file.filename or "").strip()
     if not filename:
@@ -501,18 +651,57 @@ def _delete_selected_attachments(conn, entity_type: str, entity_id: int, attachm
     return len(delete_ids)
 
 
-def _save_attachments(conn, entity_type: str, entity_id: int, files: Iterable[UploadFile], user_id: int | None) -> None:
+def _stage_uploads(files: Iterable[UploadFile]) -> list[tuple[str, str]]:
+    staged = []
     for file in _selected_uploads(files):
         saved_name = _upload_file(file)
-        if not saved_name:
-            continue
-        conn.execute(
-            """
-            INSERT INTO attachments(entity_type, entity_id, file_path, original_name, created_by, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (entity_type, entity_id, saved_name, file.filename or saved_name, user_id, _now_text()),
-        )
+        if saved_name:
+            staged.append((saved_name, file.filename or saved_name))
+    return staged
+
+
+def _insert_attachments(conn, entity_type: str, entity_id: int, staged: list[tuple[str, str]], user_id: int | None) -> None:
+    if not staged:
+        return
+    now_text = _now_text()
+    conn.executemany(
+        """
+        INSERT INTO attachments(entity_type, entity_id, file_path, original_name, created_by, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        [(entity_type, entity_id, saved_name, original_name, user_id, now_text) for saved_name, original_name in staged],
+    )
+
+
+def _discard_uploads(staged: list[tuple[str, str]]) -> None:
+    for saved_name, _ in staged:
+        try:
+            (UPLOAD_DIR / saved_name).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _save_attachments(conn, entity_type: str, entity_id: int, files: Iterable[UploadFile], user_id: int | None) -> None:
+    _insert_attachments(conn, entity_type, entity_id, _stage_uploads(files), user_id)
+
+
+def _run_with_uploads(unit, files: Iterable[UploadFile]):
+    staged = _stage_uploads(files)
+    attached = False
+
+    def attach(conn, entity_type: str, entity_id: int, user_id: int | None) -> None:
+        nonlocal attached
+        _insert_attachments(conn, entity_type, entity_id, staged, user_id)
+        attached = True
+
+    try:
+        response = writer.run(lambda conn: unit(conn, attach))
+    except BaseException:
+        _discard_uploads(staged)
+        raise
+    if not attached:
+        _discard_uploads(staged)
+    return response
 
 
 def _attachment_map(conn, entity_type: str, entity_ids: list[int]) -> dict[int, list]:
@@ -566,11 +755,8 @@ def _post_action_button(path: str, label: str, confirm_message: str | None = Non
     )
 
 
-def _facility_options(conn) -> list[tuple[str, str]]:
-    rows = conn.execute(
-        "SELECT id, facility_code, name FROM facilities ORDER BY name ASC, id ASC"
-    ).fetchall()
-    return [(str(row["id"]), f"{row['facility_code']} · {row['name']}") for row in rows]
+def _facility_option_label(row) -> str:
+    return f"{row['facility_code']} · {row['name']}"
 
 
 def _user_options(conn, *, include_viewers: bool = True) -> list[tuple[str, str]]:
@@ -626,38 +812,100 @@ def _contact_target_default(row, *, prefix: str = "") -> str:
     return f"{summary} ({contact_type})".strip() if summary and contact_type else summary
 
 
-def _contact_options(conn) -> list[tuple[str, str]]:
-    rows = conn.execute(
-        """
-        SELECT *
-        FROM contacts
-        ORDER BY CASE WHEN status = '활성' THEN 0 WHEN status = '보류' THEN 1 ELSE 2 END,
-                 contact_type ASC, organization ASC, name ASC, id ASC
-        """
-    ).fetchall()
-    options = []
-    for row in rows:
-        summary = _contact_summary(row) or row["name"]
-        meta = _contact_meta(row)
-        label = f"{row['contact_type']} · {summary}"
-        if meta:
-            label += f" / {meta}"
-        if row["status"] != "활성":
-            label += f" ({row['status']})"
-        options.append((str(row["id"]), label))
-    return options
-
-
-def _complaint_options(conn) -> list[tuple[str, str]]:
-    rows = conn.execute(
-        """
-        SELECT id, complaint_code, title, status
-        FROM complaints
-        ORDER BY CASE WHEN status IN ('종결', '취소') THEN 2 WHEN status = '회신완료' THEN 1 ELSE 0 END,
-                 updated_at DESC, id DESC
-        """
-    ).fetchall()
-    return [(str(row["id"]), f"{row['complaint_code']} · {row['title']} ({row['status']})") for row in rows]
+def _contact_option_label(row) -> str:
+    summary = _contact_summary(row) or row["name"]
+    meta = _contact_meta(row)
+    label = f"{row['contact_type']} · {summary}"
+    if meta:
+        label += f" / {meta}"
+    if row["status"] != "활성":
+        label += f" ({row['status']})"
+    return label
+
+
+def _complaint_option_label(row) -> str:
+    return f"{row['complaint_code']} · {row['title']} ({row['status']})"
+
+
+LOOKUP_SOURCES = {
+    "facilities": {
+        "permission": "facilities:view",
+        "table": "facilities",
+        "columns": "id, facility_code, name",
+        "prefix_columns": ["facility_code", "name"],
+        "contains_columns": ["name", "building", "zone"],
+        "order_sql": "name ASC, id ASC",
+        "label": _facility_option_label,
+    },
+    "contacts": {
+        "permission": "contacts:view",
+        "table": "contacts",
+        "columns": "*",
+        "prefix_columns": ["contact_code", "organization", "name", "phone"],
+        "contains_columns": ["organization", "name", "department"],
+        "order_sql": (
+            "CASE WHEN status = '활성' THEN 0 WHEN status = '보류' THEN 1 ELSE 2 END, "
+            "contact_type ASC, organization ASC, name ASC, id ASC"
+        ),
+        "label": _contact_option_label,
+    },
+    "complaints": {
+        "permission": "complaints:view",
+        "table": "complaints",
+        "columns": "id, complaint_code, title, status",
+        "prefix_columns": ["complaint_code", "title"],
+        "contains_columns": ["title", "requester_name", "location_detail"],
+        "order_sql": "updated_at DESC, id DESC",
+        "label": _complaint_option_label,
+    },
+}
+LOOKUP_LIMIT = 20
+LOOKUP_MAX_LIMIT = 50
+
+
+def _lookup_options(conn, kind: str, q: str = "", *, limit: int = LOOKUP_LIMIT) -> list[tuple[str, str]]:
+    source = LOOKUP_SOURCES[kind]
+    q = q.strip()
+    select_sql = f"SELECT {source['columns']} FROM {source['table']}"
+    if not q:
+        rows = conn.execute(f"{select_sql} ORDER BY {source['order_sql']} LIMIT ?", (limit,)).fetchall()
+        return [(str(row["id"]), source["label"](row)) for row in rows]
+
+    rows = []
+    seen: set[int] = set()
+    for column in source["prefix_columns"]:
+        if len(rows) >= limit:
+            break
+        for row in conn.execute(
+            f"{select_sql} WHERE {column} >= ? AND {column} < ? ORDER BY {column} ASC, id ASC LIMIT ?",
+            (q, q + "\U0010ffff", limit),
+        ).fetchall():
+            if row["id"] not in seen and len(rows) < limit:
+                seen.add(row["id"])
+                rows.append(row)
+    if len(rows) < limit and len(q) >= 2:
+        pattern = "%" + q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        contains_sql = " OR ".join(f"{column} LIKE ? ESCAPE '\\'" for column in source["contains_columns"])
+        for row in conn.execute(
+            f"{select_sql} WHERE ({contains_sql}) ORDER BY {source['order_sql']} LIMIT ?",
+            [*([pattern] * len(source["contains_columns"])), limit + len(seen)],
+        ).fetchall():
+            if row["id"] not in seen and len(rows) < limit:
+                seen.add(row["id"])
+                rows.append(row)
+    return [(str(row["id"]), source["label"](row)) for row in rows]
+
+
+def _lookup_selected(conn, kind: str, value) -> tuple[str, str] | None:
+    entity_id = _parse_int(value, 0)
+    if not entity_id:
+        return None
+    source = LOOKUP_SOURCES[kind]
+    row = conn.execute(
+        f"SELECT {source['columns']} FROM {source['table']} WHERE id = ?",
+        (entity_id,),
+    ).fetchone()
+    return (str(row["id"]), source["label"](row)) if row else None
 
 
 def _badge(value: str, tone: str = "neutral") -> str:
@@ -777,6 +1025,50 @@ def _complaint_template_rows(conn, category_primary: str):
     ).fetchall()
 
 
+def _keyset_sql(where_sql: str, params: list, prefix: str, after: tuple[str, int] | None, limit: int) -> tuple[str, list, str]:
+    if after:
+        clause = f"({prefix}updated_at, {prefix}id) < (?, ?)"
+        where_sql = f"{where_sql} AND {clause}" if where_sql else f"WHERE {clause}"
+        params = [*params, after[0], after[1]]
+    return where_sql, params, f"ORDER BY {prefix}updated_at DESC, {prefix}id DESC LIMIT {int(limit)}"
+
+
+def _select_columns(prefix: str, computed: dict[str, str], fields: Iterable[str] | None) -> str:
+    if fields is None:
+        return ", ".join([f"{prefix}*", *(f"{expr} AS {name}" for name, expr in computed.items())])
+    return ", ".join(f"{computed[field]} AS {field}" if field in computed else f"{prefix}{field}" for field in fields)
+
+
+COMPLAINT_LIST_COLUMNS = {
+    "facility_name": "f.name",
+    "assignee_name": "COALESCE(u.full_name, c.external_assignee_name, '')",
+    "work_count": "(SELECT COUNT(*) FROM work_orders w WHERE w.complaint_id = c.id)",
+    "feedback_rating": "cf.rating",
+    "feedback_follow_up_at": "cf.follow_up_at",
+    "repeat_count": f"""(
+                 SELECT COUNT(*)
+                 FROM complaints c2
+                 WHERE c2.id != c.id
+                   AND c.requester_phone != ''
+                   AND c2.requester_phone = c.requester_phone
+                   AND c2.created_at >= datetime('now', '-{COMPLAINT_REPEAT_WINDOW_DAYS} days')
+                   AND (
+                     (c.facility_id IS NOT NULL AND c2.facility_id = c.facility_id)
+                     OR (c.unit_label != '' AND c2.unit_label = c.unit_label)
+                     OR (c.location_detail != '' AND c2.location_detail = c.location_detail)
+                     OR (c.category_primary != '' AND c2.category_primary = c.category_primary)
+                   )
+               )""",
+}
+WORK_ORDER_LIST_COLUMNS = {
+    "facility_name": "f.name",
+    "assignee_name": "COALESCE(u.full_name, w.external_assignee_name, '')",
+    "complaint_code": "c.complaint_code",
+    "complaint_title": "c.title",
+}
+FACILITY_LIST_COLUMNS = {"manager_name": "u.full_name"}
+
+
 def _complaint_filter_sql(
     q: str = "",
     status: str = "",
@@ -822,38 +1114,42 @@ def _fetch_complaint_rows(
     priority: str = "",
     site_name: str = "",
     building_label: str = "",
+):
+    return _complaint_rows_cursor(conn, q, status, channel, priority, site_name, building_label).fetchall()
+
+
+def _complaint_rows_cursor(
+    conn,
+    q: str = "",
+    status: str = "",
+    channel: str = "",
+    priority: str = "",
+    site_name: str = "",
+    building_label: str = "",
+    *,
+    after: tuple[str, int] | None = None,
+    limit: int = 0,
+    fields: Iterable[str] | None = None,
 ):
     where_sql, params = _complaint_filter_sql(q, status, channel, priority, site_name, building_label)
+    order_sql = """
+        ORDER BY CASE c.priority WHEN '긴급' THEN 1 WHEN '높음' THEN 2 WHEN '보통' THEN 3 ELSE 4 END,
+                 c.updated_at DESC, c.id DESC
+    """
+    if limit:
+        where_sql, params, order_sql = _keyset_sql(where_sql, params, "c.", after, limit)
     return conn.execute(
         f"""
-        SELECT c.*, f.name AS facility_name, COALESCE(u.full_name, c.external_assignee_name, '') AS assignee_name, COUNT(DISTINCT w.id) AS work_count,
-               cf.rating AS feedback_rating, cf.follow_up_at AS feedback_follow_up_at,
-               (
-                 SELECT COUNT(*)
-                 FROM complaints c2
-                 WHERE c2.id != c.id
-                   AND c.requester_phone != ''
-                   AND c2.requester_phone = c.requester_phone
-                   AND c2.created_at >= datetime('now', '-{COMPLAINT_REPEAT_WINDOW_DAYS} days')
-                   AND (
-                     (c.facility_id IS NOT NULL AND c2.facility_id = c.facility_id)
-                     OR (c.unit_label != '' AND c2.unit_label = c.unit_label)
-                     OR (c.location_detail != '' AND c2.location_detail = c.location_detail)
-                     OR (c.category_primary != '' AND c2.category_primary = c.category_primary)
-                   )
-               ) AS repeat_count
+        SELECT {_select_columns("c.", COMPLAINT_LIST_COLUMNS, fields)}
         FROM complaints c
         LEFT JOIN facilities f ON f.id = c.facility_id
         LEFT JOIN users u ON u.id = c.assignee_user_id
-        LEFT JOIN work_orders w ON w.complaint_id = c.id
         LEFT JOIN complaint_feedback cf ON cf.complaint_id = c.id
         {where_sql}
-        GROUP BY c.id
-        ORDER BY CASE c.priority WHEN '긴급' THEN 1 WHEN '높음' THEN 2 WHEN '보통' THEN 3 ELSE 4 END,
-                 c.updated_at DESC, c.id DESC
+        {order_sql}
         """,
         params,
-    ).fetchall()
+    )
 
 
 def _build_complaints_pdf(
@@ -1110,6 +1406,10 @@ DB_CODE_FIELDS = {
     "complaint_response_templates": ("template_code", "CT"),
     "work_orders": ("work_code", "WO"),
 }
+DB_PAGE_SIZE = 100
+DB_MAX_PAGE_SIZE = 500
+DB_FILTER_SLOTS = 3
+DB_FILTER_OPS = {"eq": "같음", "prefix": "앞부분 일치"}
 _DB_OMIT = object()
 
 
@@ -1121,6 +1421,103 @@ def _db_columns(conn, table: str):
     return conn.execute(f"PRAGMA table_info({_db_safe_table(table)})").fetchall()
 
 
+def _db_indexed_columns(conn, table: str) -> set[str]:
+    indexed = {"id"}
+    for index in conn.execute(f"PRAGMA index_list({_db_safe_table(table)})").fetchall():
+        if index["partial"]:
+            continue
+        first = conn.execute(f"PRAGMA index_info('{index['name']}')").fetchone()
+        if first and first["name"]:
+            indexed.add(first["name"])
+    return indexed
+
+
+def _db_text_range_columns(conn, table: str, columns) -> set[str]:
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (_db_safe_table(table),)).fetchone()
+    table_sql = str(row["sql"] or "") if row else ""
+    range_columns = set()
+    for column in columns:
+        declared = (column["type"] or "").upper()
+        if "INT" in declared or not any(token in declared for token in ("CHAR", "CLOB", "TEXT")):
+            continue
+        definition = re.search(rf"[(,]\s*[\"`\[]?{re.escape(column['name'])}[\"`\]]?\s+([^,]*)", table_sql, re.IGNORECASE)
+        collation = re.search(r"\bCOLLATE\s+[\"']?(\w+)", definition.group(1), re.IGNORECASE) if definition else None
+        if collation is None or collation.group(1).upper() == "BINARY":
+            range_columns.add(column["name"])
+    return range_columns
+
+
+def _db_parse_filters(columns, params) -> list[tuple[str, str, str]]:
+    names = {column["name"] for column in columns}
+    filters = []
+    for name, op, value in zip(params.getlist("fc"), params.getlist("fo"), params.getlist("fv")):
+        value = value.strip()
+        if name in names and op in DB_FILTER_OPS and value:
+            filters.append((name, op, value))
+    return filters[:DB_FILTER_SLOTS]
+
+
+def _db_prefix_bound(prefix: str) -> str | None:
+    code_point = ord(prefix[-1]) + 1
+    if code_point > 0x10FFFF or 0xD800 <= code_point <= 0xDFFF:
+        return None
+    return prefix[:-1] + chr(code_point)
+
+
+def _db_filter_sql(columns, filters: list[tuple[str, str, str]], range_columns: set[str]) -> tuple[list[str], list]:
+    column_types = {column["name"]: (column["type"] or "").upper() for column in columns}
+    where: list[str] = []
+    params: list = []
+    for name, op, value in filters:
+        if "INT" in column_types[name]:
+            if op != "eq":
+                raise ValueError(f"{name} 는 숫자 컬럼이라 '{DB_FILTER_OPS[op]}' 조건을 쓸 수 없습니다. '같음'으로 조회해 주세요.")
+            try:
+                params.append(int(value))
+            except ValueError as exc:
+                raise ValueError(f"{name} 는 숫자여야 합니다.") from exc
+            where.append(f"{name} = ?")
+        elif op == "prefix":
+            upper = _db_prefix_bound(value) if name in range_columns else None
+            if upper is None:
+                where.append(f"substr({name}, 1, ?) = ?")
+                params.extend([len(value), value])
+            else:
+                where.append(f"{name} >= ? AND {name} < ?")
+                params.extend([value, upper])
+        else:
+            where.append(f"{name} = ?")
+            params.append(value)
+    return where, params
+
+
+def _db_rows_cursor(conn, table: str, where: list[str], params: list, *, before: int = 0, after: int = 0, limit: int = DB_PAGE_SIZE):
+    clauses = list(where)
+    values = list(params)
+    if before:
+        clauses.append("id < ?")
+        values.append(before)
+    elif after:
+        clauses.append("id > ?")
+        values.append(after)
+    where_sql = "WHERE " + " AND ".join(clauses) if clauses else ""
+    direction = "ASC" if after and not before else "DESC"
+    return conn.execute(
+        f"SELECT * FROM {_db_safe_table(table)} {where_sql} ORDER BY id {direction} LIMIT {int(limit)}",
+        values,
+    )
+
+
+def _db_view_query(table: str, filters: list[tuple[str, str, str]], limit: int, **cursor: int) -> str:
+    pairs: list[tuple[str, object]] = [("table", table)]
+    for name, op, value in filters:
+        pairs.extend([("fc", name), ("fo", op), ("fv", value)])
+    if limit != DB_PAGE_SIZE:
+        pairs.append(("limit", limit))
+    pairs.extend((key, value) for key, value in cursor.items() if value)
+    return urlencode(pairs)
+
+
 def _db_default_text(default_value) -> str:
     if default_value is None:
         return ""
@@ -1207,10 +1604,53 @@ def _db_cell_preview(value) -> str:
     return esc(text or "-")
 
 
-def _db_render_rows(table: str, columns, rows) -> str:
+def _db_render_filters(table: str, columns, indexed: set[str], filters: list[tuple[str, str, str]], limit: int) -> str:
+    slots = list(filters) + [("", "eq", "")] * (DB_FILTER_SLOTS - len(filters))
+    slot_html = []
+    for name, op, value in slots:
+        column_options = "<option value=''>컬럼 선택</option>" + "".join(
+            f"<option value='{esc(column['name'])}'{' selected' if column['name'] == name else ''}>"
+            f"{esc(column['name'])}{' · 인덱스' if column['name'] in indexed else ''}</option>"
+            for column in columns
+        )
+        op_options = "".join(
+            f"<option value='{key}'{' selected' if key == op else ''}>{esc(label)}</option>" for key, label in DB_FILTER_OPS.items()
+        )
+        slot_html.append(
+            f"<div class='row-actions'><select name='fc'>{column_options}</select><select name='fo'>{op_options}</select>"
+            f"<input name='fv' value='{esc(value)}' placeholder='값'></div>"
+        )
+    return (
+        "<form method='get' action='/admin/database' class='stack' style='margin-bottom:12px;'>"
+        f"<input type='hidden' name='table' value='{esc(table)}'>"
+        + "".join(slot_html)
+        + "<div class='row-actions'>"
+        + f"<label>페이지당 <input type='number' name='limit' min='1' max='{DB_MAX_PAGE_SIZE}' value='{limit}' style='width:90px;'></label>"
+        + "<button class='btn primary' type='submit'>조회</button>"
+        + f"<a class='btn secondary' href='/admin/database?table={esc(table)}'>필터 초기화</a>"
+        + "</div>"
+        + "<p class='muted'>'인덱스' 표시 컬럼으로 거르면 큰 테이블에서도 빠르게 조회됩니다. 숫자 컬럼은 '같음'만 쓸 수 있습니다.</p>"
+        + "</form>"
+    )
+
+
+def _db_render_pager(table: str, filters: list[tuple[str, str, str]], limit: int, rows, *, newer_after: int, older_before: int, paged: bool) -> str:
+    links = []
+    if paged:
+        links.append(f"<a class='btn secondary' href='/admin/database?{esc(_db_view_query(table, filters, limit))}'>최신</a>")
+    if newer_after:
+        links.append(f"<a class='btn secondary' href='/admin/database?{esc(_db_view_query(table, filters, limit, after=newer_after))}'>이전 페이지</a>")
+    if older_before:
+        links.append(f"<a class='btn secondary' href='/admin/database?{esc(_db_view_query(table, filters, limit, before=older_before))}'>다음 페이지</a>")
+    summary = f"id {rows[0]['id']} ~ {rows[-1]['id']} · {len(rows)}행" if rows else "0행"
+    return f"<div class='row-actions' style='margin:12px 0;'>{''.join(links)}<span class='muted'>{esc(summary)}</span></div>"
+
+
+def _db_render_rows(table: str, columns, rows, *, toolbar: str = "", pager: str = "", view_query: str = "") -> str:
     headers = "".join(f"<th>{esc(column['name'])}</th>" for column in columns)
     if not rows:
-        return "<section class='panel'><h2>행 목록</h2>" + empty_state("표시할 행이 없습니다.") + "</section>"
+        return "<section class='panel'><h2>행 목록</h2>" + toolbar + empty_state("표시할 행이 없습니다.") + pager + "</section>"
+    view_query = view_query or urlencode({"table": table})
 
     form_id = f"db-bulk-form-{table}"
     row_html = []
@@ -1224,7 +1664,7 @@ def _db_render_rows(table: str, columns, rows) -> str:
             for column in columns
         )
         actions = (
-            f"<a class='btn secondary' href='/admin/database?table={esc(table)}&edit={row['id']}'>수정</a>"
+            f"<a class='btn secondary' href='/admin/database?{esc(view_query)}&amp;edit={row['id']}'>수정</a>"
             + f"<button class='btn warn' type='submit' name='row_id' value='{esc(row['id'])}' "
             + "formaction='/admin/database/delete' formmethod='post' formnovalidate "
             + "onclick=\"return confirm('이 행을 삭제하시겠습니까?');\">삭제</button>"
@@ -1234,7 +1674,10 @@ def _db_render_rows(table: str, columns, rows) -> str:
         )
 
     return (
-        "<section class='panel'><h2>행 목록</h2><div style='overflow:auto;'>"
+        "<section class='panel'><h2>행 목록</h2>"
+        + toolbar
+        + pager
+        + "<div style='overflow:auto;'>"
         f"<form id='{esc(form_id)}' method='post' action='/admin/database/delete-selected' class='stack'>"
         f"<input type='hidden' name='table' value='{esc(table)}'>"
         + "<div class='row-actions' style='margin-bottom:12px;'>"
@@ -1254,7 +1697,9 @@ def _db_render_rows(table: str, columns, rows) -> str:
         + "<script>(function(){const form=document.getElementById('"
         + esc(form_id)
         + "');if(!form)return;const master=form.querySelector('[data-db-select-all]');if(!master)return;master.addEventListener('change',()=>{form.querySelectorAll('[data-db-row]').forEach((box)=>{box.checked=master.checked;});});form.querySelectorAll('[data-db-row]').forEach((box)=>{box.addEventListener('change',()=>{const items=[...form.querySelectorAll('[data-db-row]')];master.checked=items.length>0&&items.every((item)=>item.checked);});});})();</script>"
-        + "</div></section>"
+        + "</div>"
+        + pager
+        + "</section>"
     )
 
 
@@ -1292,15 +1737,23 @@ def _db_delete_rows(conn, table: str, row_ids: list[int], current_user_id: int)
     return len(delete_ids), blocked_count, missing_count, file_paths
 
 
-def _db_table_cards(conn, selected_table: str) -> str:
+def _db_count_text(stat: dict | None) -> str:
+    count = (stat or {}).get("count")
+    if count is None:
+        return "집계 중"
+    return str(count) if stat["exact"] else f"≈{count}"
+
+
+def _db_table_cards(stats: dict[str, dict], selected_table: str) -> str:
     cards = []
     for table in DB_MANAGED_TABLES:
-        count = conn.execute(f"SELECT COUNT(*) AS count FROM {table}").fetchone()["count"]
+        stat = stats.get(table) or {}
         tone = "primary" if table == selected_table else "secondary"
+        basis = f"{stat['refreshed_at']} 집계" if stat.get("refreshed_at") else "통계 추정치"
         cards.append(
             "<div class='panel'>"
             f"<div class='split'><strong>{esc(DB_TABLE_LABELS[table])}</strong><span class='muted'>{esc(table)}</span></div>"
-            f"<div class='metric-value' style='font-size:28px; margin-top:10px;'>{count}</div>"
+            f"<div class='metric-value' style='font-size:28px; margin-top:10px;' title='{esc(basis)}'>{esc(_db_count_text(stat))}</div>"
             f"<div class='row-actions' style='margin-top:12px;'><a class='btn {tone}' href='/admin/database?table={esc(table)}'>열기</a></div>"
             "</div>"
         )
@@ -1575,9 +2028,11 @@ def _record_complaint_update(
         """,
         (complaint_id, update_type.strip(), status_from.strip(), status_to.strip(), message.strip(), is_public_note, actor_user_id, _now_text()),
     )
+    events.publish_on_commit(conn, "complaint", complaint_id, "create" if update_type.strip() == "접수" else "update")
 
 
 def _sync_complaint_for_work_order(conn, complaint_id: int | None, work_order_id: int, work_code: str, actor_user_id: int | None, assignee_user_id: int | None) -> None:
+    events.publish_on_commit(conn, "work_order", work_order_id)
     if not complaint_id:
         return
     complaint = conn.execute("SELECT * FROM complaints WHERE id = ?", (complaint_id,)).fetchone()
@@ -1610,7 +2065,7 @@ def _sync_complaint_for_work_order(conn, complaint_id: int | None, work_order_id
     )
 
 
-@app.get("/login", response_class=HTMLResponse)
+@auth_routes.get("/login", response_class=HTMLResponse)
 def login_page(request: Request):
     redirect = _redirect_if_logged_in(request)
     if redirect:
@@ -1673,7 +2128,7 @@ def login_page(request: Request):
     return HTMLResponse(layout(title="로그인", body=body, flash_message=flash_message, flash_level=flash_level))
 
 
-@app.post("/login")
+@auth_routes.post("/login")
 def login_submit(username: str = Form(...), password: str = Form(...)):
     conn = get_conn()
     user = conn.execute(
@@ -1697,7 +2152,7 @@ def login_submit(username: str = Form(...), password: str = Form(...)):
     return response
 
 
-@app.post("/logout")
+@auth_routes.post("/logout")
 def logout(request: Request):
     auth.invalidate_session(request.cookies.get(auth.SESSION_COOKIE))
     response = _with_flash("/login", "로그아웃되었습니다.", "info")
@@ -1705,7 +2160,7 @@ def logout(request: Request):
     return response
 
 
-@app.get("/register", response_class=HTMLResponse)
+@auth_routes.get("/register", response_class=HTMLResponse)
 def register_page(request: Request):
     redirect = _redirect_if_logged_in(request)
     if redirect:
@@ -1728,7 +2183,7 @@ def register_page(request: Request):
     )
 
 
-@app.post("/register")
+@auth_routes.post("/register")
 def register_submit(
     request: Request,
     username: str = Form(...),
@@ -1801,7 +2256,7 @@ def register_submit(
         return _with_flash("/register", f"회원가입 요청에 실패했습니다: {exc}", "error")
 
 
-@app.get("/account/username", response_class=HTMLResponse)
+@auth_routes.get("/account/username", response_class=HTMLResponse)
 def account_username_page(request: Request):
     redirect = _redirect_if_logged_in(request)
     if redirect:
@@ -1824,7 +2279,7 @@ def account_username_page(request: Request):
     )
 
 
-@app.post("/account/username", response_class=HTMLResponse)
+@auth_routes.post("/account/username", response_class=HTMLResponse)
 def account_username_submit(
     request: Request,
     full_name: str = Form(...),
@@ -1885,7 +2340,7 @@ def account_username_submit(
     )
 
 
-@app.get("/account/password", response_class=HTMLResponse)
+@auth_routes.get("/account/password", response_class=HTMLResponse)
 def account_password_page(request: Request):
     redirect = _redirect_if_logged_in(request)
     if redirect:
@@ -1908,7 +2363,7 @@ def account_password_page(request: Request):
     )
 
 
-@app.post("/account/password")
+@auth_routes.post("/account/password")
 def account_password_submit(
     request: Request,
     username: str = Form(...),
@@ -1960,6 +2415,9 @@ def dashboard(request: Request):
     user, error = _authorize(request, "dashboard:view")
     if error:
         return error
+    etag = _page_etag(request, user, "dashboard")
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
 
     conn = get_conn()
     total_facilities = conn.execute("SELECT COUNT(*) AS count FROM facilities").fetchone()["count"]
@@ -2146,9 +2604,9 @@ def dashboard(request: Request):
         "<section class='metrics'>"
         + metric_card("시설", total_facilities, f"운영중 {active_facilities}개")
         + metric_card("재고 항목", total_items, f"부족 경고 {low_stock}건")
-        + metric_card("진행 민원", open_complaints, f"회신 지연 {overdue_complaints}건")
+        + metric_card("진행 민원", open_complaints, f"회신 지연 {overdue_complaints}건", live_key="open_complaints")
         + metric_card("반복 민원", repeat_open_complaints, f"최근 {COMPLAINT_REPEAT_WINDOW_DAYS}일 기준")
-        + metric_card("미완료 작업", open_work, f"지연 {overdue_work}건")
+        + metric_card("미완료 작업", open_work, f"지연 {overdue_work}건", live_key="open_work")
         + metric_card("행정업무", open_office_records, f"기한 초과 {overdue_office_records}건")
         + metric_card("연락처", total_contacts, f"활성 {active_contacts}건 / 연계 {linked_contacts}건")
         + metric_card("활성 사용자", active_users, f"오늘 완료 {today_completed}건")
@@ -2326,6 +2784,7 @@ def dashboard(request: Request):
                 "<a class='btn secondary' href='/reports'>운영 보고서</a>"
             ),
         )
+        + live_feed_notice("complaint,work_order")
         + metrics
         + "<div class='layout-2'>"
         + "<div class='stack'>"
@@ -2346,21 +2805,195 @@ def dashboard(request: Request):
         + tx_table
         + "</div></div>"
     )
-    return HTMLResponse(layout(title="대시보드", body=body, user=user, flash_message=flash_message, flash_level=flash_level))
+    return HTMLResponse(
+        layout(title="대시보드", body=body, user=user, flash_message=flash_message, flash_level=flash_level),
+        headers=_etag_headers(etag),
+    )
 
 
-@app.get("/facilities", response_class=HTMLResponse)
-def facilities_page(request: Request):
-    user, error = _authorize(request, "facilities:view")
+@app.get("/attachments/batch")
+def attachments_batch(request: Request):
+    entity_type = request.query_params.get("entity_type", "").strip()
+    permission = ATTACHMENT_ENTITY_PERMISSIONS.get(entity_type)
+    if not permission:
+        return JSONResponse(status_code=400, content={"ok": False, "detail": "지원하지 않는 첨부 대상입니다."})
+    user, error = _authorize_api(request, permission)
     if error:
         return error
 
-    can_edit = auth.has_permission(user["role"], "facilities:edit")
-    q = request.query_params.get("q", "").strip()
-    status = request.query_params.get("status", "").strip()
-    edit_id = _parse_int(request.query_params.get("edit", ""), 0)
+    entity_ids = _parse_id_list(request.query_params.get("ids", "").split(","))[:ATTACHMENT_BATCH_LIMIT]
+    conn = get_conn()
+    attachments = _attachment_map(conn, entity_type, entity_ids)
+    conn.close()
+
+    prefer_links = entity_type in ATTACHMENT_LINK_ONLY_ENTITIES
+    return JSONResponse(
+        {
+            "ok": True,
+            "entity_type": entity_type,
+            "items": {
+                str(entity_id): attachment_gallery(rows, prefer_links=prefer_links)
+                for entity_id, rows in attachments.items()
+            },
+        },
+        headers={"Cache-Control": "private, no-cache"},
+    )
+
+
+@app.get("/api/lookup/{kind}")
+def lookup_api(request: Request, kind: str):
+    source = LOOKUP_SOURCES.get(kind)
+    if not source:
+        return JSONResponse(status_code=404, content={"ok": False, "detail": "지원하지 않는 검색 대상입니다."})
+    user, error = _authorize_api(request, source["permission"])
+    if error:
+        return error
+
+    limit = min(max(_parse_int(request.query_params.get("limit", ""), LOOKUP_LIMIT), 1), LOOKUP_MAX_LIMIT)
+    conn = get_conn()
+    options = _lookup_options(conn, kind, request.query_params.get("q", ""), limit=limit)
+    conn.close()
+    return JSONResponse(
+        {"ok": True, "kind": kind, "items": [{"value": value, "label": label} for value, label in options]},
+        headers={"Cache-Control": "private, no-cache"},
+    )
+
+
+def _sync_rows(
+    conn, source: dict, user, ids: list[int] | None = None, *, after: int = 0, limit: int = 0
+) -> tuple[list[str], list[list]]:
+    params: list = [user["id"]] if source["scoped_to_user"] else []
+    where = source["scope_sql"]
+    if ids is not None:
+        where += f" AND id IN ({','.join(['?'] * len(ids))})"
+        params.extend(ids)
+    if after:
+        where += " AND id > ?"
+        params.append(after)
+    limit_sql = f" LIMIT {int(limit)}" if limit else ""
+    cursor = conn.execute(f"{source['select_sql']} WHERE {where} ORDER BY id{limit_sql}", params)
+    columns = [column[0] for column in cursor.description]
+    return columns, [list(row) for row in cursor.fetchall()]
+
+
+def _parse_sync_snapshot(value: str, names) -> tuple[str, int] | None:
+    name, _, after = value.partition(":")
+    if name not in names:
+        return None
+    return name, max(_parse_int(after, 0), 0)
+
+
+def _sync_snapshot_page(conn, sources: dict, user, start: tuple[str, int] | None, limit: int) -> tuple[dict, str]:
+    names = list(sources)
+    position, after = (names.index(start[0]), start[1]) if start else (0, 0)
+    changes = {}
+    remaining = limit
+    for name in names[position:]:
+        columns, rows = _sync_rows(conn, sources[name], user, after=after, limit=remaining + 1)
+        if len(rows) > remaining:
+            rows = rows[:remaining]
+            if rows:
+                changes[name] = {"columns": columns, "rows": rows, "deleted": []}
+            return changes, f"{name}:{rows[-1][0] if rows else after}"
+        changes[name] = {"columns": columns, "rows": rows, "deleted": []}
+        remaining -= len(rows)
+        after = 0
+    return changes, ""
+
+
+@app.get("/api/sync")
+def sync_api(request: Request):
+    user, error = _authorize_api(request, "dashboard:view")
+    if error:
+        return error
+
+    since = _parse_int(request.query_params.get("since", ""), 0)
+    limit = min(max(_parse_int(request.query_params.get("limit", ""), SYNC_BATCH_LIMIT), 1), SYNC_BATCH_LIMIT)
+    sources = {name: source for name, source in SYNC_SOURCES.items() if auth.has_permission(user["role"], source["permission"])}
+    snapshot_start = _parse_sync_snapshot(request.query_params.get("snapshot", ""), sources)
 
     conn = get_conn()
+    oldest_seq, head_seq = ops_db.change_log_bounds(conn)
+    reset = since <= 0 or since > head_seq or since < oldest_seq - 1
+    changes = {}
+    has_more = False
+    snapshot = ""
+    if reset or snapshot_start:
+        cursor = head_seq if reset else since
+        changes, snapshot = _sync_snapshot_page(conn, sources, user, None if reset else snapshot_start, limit)
+        has_more = bool(snapshot)
+    else:
+        entries = conn.execute(
+            "SELECT seq, table_name, row_id FROM change_log WHERE seq > ? ORDER BY seq LIMIT ?",
+            (since, limit + 1),
+        ).fetchall()
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+        cursor = entries[-1]["seq"] if entries else since
+        changed: dict[str, set[int]] = {}
+        for entry in entries:
+            changed.setdefault(entry["table_name"], set()).add(int(entry["row_id"]))
+        for name, source in sources.items():
+            ids = sorted(changed.get(source["table"], ()))
+            if not ids:
+                continue
+            columns, rows = _sync_rows(conn, source, user, ids)
+            present = {row[0] for row in rows}
+            changes[name] = {"columns": columns, "rows": rows, "deleted": [row_id for row_id in ids if row_id not in present]}
+    conn.close()
+    return JSONResponse(
+        {"ok": True, "cursor": cursor, "reset": reset, "has_more": has_more, "snapshot": snapshot, "changes": changes},
+        headers={"Cache-Control": "private, no-store"},
+    )
+
+
+@app.get("/events/stream")
+async def events_stream(request: Request):
+    user, error = await run_in_threadpool(_authorize_api, request, "dashboard:view")
+    if error:
+        return error
+
+    allowed_kinds = {
+        kind for kind, permission in events.EVENT_KIND_PERMISSIONS.items() if auth.has_permission(user["role"], permission)
+    }
+    last_event_id = _parse_int(request.headers.get("last-event-id", ""), 0)
+    token, queue, backlog = events.BROADCASTER.subscribe(last_event_id)
+
+    async def stream():
+        try:
+            yield f"retry: {LIVE_FEED_RETRY_MS}\n\n"
+            for event in backlog:
+                if events.event_visible(event, allowed_kinds):
+                    yield events.format_sse(event)
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=LIVE_FEED_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if event is None:
+                    break
+                if events.event_visible(event, allowed_kinds):
+                    yield events.format_sse(event)
+        finally:
+            events.BROADCASTER.unsubscribe(token)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _facility_rows_cursor(
+    conn,
+    q: str = "",
+    status: str = "",
+    *,
+    after: tuple[str, int] | None = None,
+    limit: int = 0,
+    fields: Iterable[str] | None = None,
+):
     where = []
     params: list = []
     if q:
@@ -2372,23 +3005,41 @@ def facilities_page(request: Request):
         where.append("f.status = ?")
         params.append(status)
     where_sql = "WHERE " + " AND ".join(where) if where else ""
+    order_sql = "ORDER BY f.updated_at DESC, f.id DESC"
+    if limit:
+        where_sql, params, order_sql = _keyset_sql(where_sql, params, "f.", after, limit)
 
-    rows = conn.execute(
+    return conn.execute(
         f"""
-        SELECT f.*, u.full_name AS manager_name
+        SELECT {_select_columns("f.", FACILITY_LIST_COLUMNS, fields)}
         FROM facilities f
         LEFT JOIN users u ON u.id = f.manager_user_id
         {where_sql}
-        ORDER BY f.updated_at DESC, f.id DESC
+        {order_sql}
         """,
         params,
-    ).fetchall()
-    attachments = _attachment_map(conn, "facility", [row["id"] for row in rows])
-    edit_row = None
-    if edit_id:
-        edit_row = conn.execute("SELECT * FROM facilities WHERE id = ?", (edit_id,)).fetchone()
-    manager_options = _user_options(conn)
-    conn.close()
+    )
+
+
+@facility_routes.get("/facilities", response_class=HTMLResponse)
+def facilities_page(request: Request):
+    user, error = _authorize(request, "facilities:view")
+    if error:
+        return error
+
+    can_edit = auth.has_permission(user["role"], "facilities:edit")
+    q = request.query_params.get("q", "").strip()
+    status = request.query_params.get("status", "").strip()
+    edit_id = _parse_int(request.query_params.get("edit", ""), 0)
+
+    conn = get_conn()
+    rows = _facility_rows_cursor(conn, q, status).fetchall()
+    attachments = _attachment_map(conn, "facility", [edit_id] if edit_id else [])
+    edit_row = None
+    if edit_id:
+        edit_row = conn.execute("SELECT * FROM facilities WHERE id = ?", (edit_id,)).fetchone()
+    manager_options = _user_options(conn)
+    conn.close()
 
     status_options = ["운영중", "점검필요", "보수중", "사용중지"]
     category_options = ["전기", "기계", "소방", "건축", "공용", "기타", "레거시 위치"]
@@ -2468,7 +3119,7 @@ def facilities_page(request: Request):
                     status=status_badge(row["status"]),
                     manager=esc(row["manager_name"] or "미지정"),
                     updated=esc(fmt_datetime(row["updated_at"])),
-                    attachments=attachment_gallery(attachments.get(row["id"], [])),
+                    attachments=attachment_placeholder("facility", row["id"]),
                     actions=actions,
                 )
             )
@@ -2500,7 +3151,7 @@ def facilities_page(request: Request):
     return HTMLResponse(layout(title="시설 관리", body=body, user=user, flash_message=flash_message, flash_level=flash_level))
 
 
-@app.post("/facilities/attachments/delete/{facility_id}")
+@facility_routes.post("/facilities/attachments/delete/{facility_id}")
 def facilities_delete_attachments(
     request: Request,
     facility_id: int,
@@ -2527,7 +3178,7 @@ def facilities_delete_attachments(
     return _with_flash(f"/facilities?edit={facility_id}", f"선택한 첨부 {deleted_count}건이 삭제되었습니다.", "ok")
 
 
-@app.post("/facilities/save")
+@facility_routes.post("/facilities/save")
 def facilities_save(
     request: Request,
     facility_id: str = Form(""),
@@ -2582,12 +3233,13 @@ def facilities_save(
         return _with_flash(f"/facilities?edit={facility_id_i}", "시설 정보가 수정되었습니다.", "ok")
 
     cursor = conn.execute(
-        """
+        f"""
         INSERT INTO facilities(
-            facility_code, category, name, building, floor, zone, status, manager_user_id, note,
+            id, facility_code, category, name, building, floor, zone, status, manager_user_id, note,
             created_by, updated_by, created_at, updated_at
         )
-        VALUES ('', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        SELECT next_id, {ops_db.entity_code_sql("FAC")}, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+        FROM {ops_db.next_id_sql("facilities")}
         """,
         (
             category.strip(),
@@ -2605,14 +3257,13 @@ def facilities_save(
         ),
     )
     facility_id_i = cursor.lastrowid
-    conn.execute("UPDATE facilities SET facility_code = ? WHERE id = ?", (f"FAC-{facility_id_i:04d}", facility_id_i))
     _save_attachments(conn, "facility", facility_id_i, files, user["id"])
     conn.commit()
     conn.close()
     return _with_flash(f"/facilities?edit={facility_id_i}", "시설이 등록되었습니다.", "ok")
 
 
-@app.post("/facilities/delete/{facility_id}")
+@facility_routes.post("/facilities/delete/{facility_id}")
 def facilities_delete(request: Request, facility_id: int):
     user, error = _authorize(request, "facilities:edit")
     if error:
@@ -2626,7 +3277,7 @@ def facilities_delete(request: Request, facility_id: int):
     return _with_flash("/facilities", "시설이 삭제되었습니다.", "ok")
 
 
-@app.get("/contacts", response_class=HTMLResponse)
+@contact_routes.get("/contacts", response_class=HTMLResponse)
 def contacts_page(request: Request):
     user, error = _authorize(request, "contacts:view")
     if error:
@@ -2853,7 +3504,7 @@ def contacts_page(request: Request):
     return HTMLResponse(layout(title="연락처 관리", body=body, user=user, flash_message=flash_message, flash_level=flash_level))
 
 
-@app.post("/contacts/save")
+@contact_routes.post("/contacts/save")
 def contacts_save(
     request: Request,
     contact_id: str = Form(""),
@@ -2914,12 +3565,13 @@ def contacts_save(
         return _with_flash("/contacts", "연락처를 등록할 권한이 없습니다.", "error")
 
     cursor = conn.execute(
-        """
+        f"""
         INSERT INTO contacts(
-            contact_code, contact_type, name, organization, department, position, phone, email, address, status, note,
+            id, contact_code, contact_type, name, organization, department, position, phone, email, address, status, note,
             created_by, updated_by, created_at, updated_at
         )
-        VALUES ('', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        SELECT next_id, {ops_db.entity_code_sql("CNT")}, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+        FROM {ops_db.next_id_sql("contacts")}
         """,
         (
             contact_type.strip(),
@@ -2939,13 +3591,12 @@ def contacts_save(
         ),
     )
     contact_id_i = cursor.lastrowid
-    conn.execute("UPDATE contacts SET contact_code = ? WHERE id = ?", (f"CNT-{contact_id_i:04d}", contact_id_i))
     conn.commit()
     conn.close()
     return _with_flash(f"/contacts?edit={contact_id_i}", "연락처가 등록되었습니다.", "ok")
 
 
-@app.post("/contacts/delete/{contact_id}")
+@contact_routes.post("/contacts/delete/{contact_id}")
 def contacts_delete(request: Request, contact_id: int):
     user, error = _authorize(request, "contacts:view")
     if error:
@@ -2968,7 +3619,7 @@ def contacts_delete(request: Request, contact_id: int):
     return _with_flash("/contacts", "연락처가 삭제되었습니다.", "ok")
 
 
-@app.get("/office-records", response_class=HTMLResponse)
+@office_record_routes.get("/office-records", response_class=HTMLResponse)
 def office_records_page(request: Request):
     user, error = _authorize(request, "office_records:view")
     if error:
@@ -3017,7 +3668,7 @@ def office_records_page(request: Request):
         """,
         params,
     ).fetchall()
-    attachments = _attachment_map(conn, "office_record", [row["id"] for row in rows])
+    attachments = _attachment_map(conn, "office_record", [edit_id] if edit_id else [])
     edit_row = (
         conn.execute(
             """
@@ -3051,8 +3702,8 @@ def office_records_page(request: Request):
         if edit_id
         else []
     )
-    facility_options = _facility_options(conn)
-    contact_options = _contact_options(conn)
+    facility_selected = _lookup_selected(conn, "facilities", edit_row["facility_id"] if edit_row else None)
+    contact_selected = _lookup_selected(conn, "contacts", edit_row["contact_id"] if edit_row else None)
     owner_options = _user_options(conn, include_viewers=False)
     conn.close()
 
@@ -3116,8 +3767,8 @@ def office_records_page(request: Request):
                 + f"<div><label>업무 구분</label><select name='record_type'>{render_options(OFFICE_RECORD_TYPE_OPTIONS, edit_row['record_type'] if edit_row else '', blank_label='선택')}</select></div>"
                 + f"<div><label>제목</label><input name='title' value='{esc(edit_row['title'] if edit_row else '')}' required></div>"
                 + "<div class='grid two'>"
-                + f"<div><label>연결 시설</label><select name='facility_id'>{render_options(facility_options, str(edit_row['facility_id'] or '') if edit_row else '', blank_label='미지정')}</select></div>"
-                + f"<div><label>연결 연락처</label><select name='contact_id'>{render_options(contact_options, str(edit_row['contact_id'] or '') if edit_row else '', blank_label='미지정')}</select><div class='muted'>선택하면 행정업무 상세에서 연락처 정보를 바로 확인할 수 있습니다.</div></div>"
+                + f"<div><label>연결 시설</label>{lookup_field('facility_id', 'facilities', facility_selected)}</div>"
+                + f"<div><label>연결 연락처</label>{lookup_field('contact_id', 'contacts', contact_selected)}<div class='muted'>선택하면 행정업무 상세에서 연락처 정보를 바로 확인할 수 있습니다.</div></div>"
                 + "</div>"
                 + "<div class='grid two'>"
                 + f"<div><label>대상 / 수신처</label><input name='target_name' value='{esc(edit_row['target_name'] if edit_row else '')}' placeholder='비우면 연결 연락처명으로 자동 입력'></div>"
@@ -3234,7 +3885,7 @@ def office_records_page(request: Request):
                     owner=esc(row["owner_name"] or "미지정"),
                     due=esc(fmt_date(row["due_date"])),
                     due_badge=_office_record_due_badge(row),
-                    attachments=attachment_gallery(attachments.get(row["id"], []), prefer_links=True),
+                    attachments=attachment_placeholder("office_record", row["id"]),
                     actions="".join(row_actions),
                 )
             )
@@ -3268,7 +3919,7 @@ def office_records_page(request: Request):
     return HTMLResponse(layout(title="행정업무 관리", body=body, user=user, flash_message=flash_message, flash_level=flash_level))
 
 
-@app.post("/office-records/attachments/delete/{record_id}")
+@office_record_routes.post("/office-records/attachments/delete/{record_id}")
 def office_records_delete_attachments(
     request: Request,
     record_id: int,
@@ -3298,7 +3949,7 @@ def office_records_delete_attachments(
     return _with_flash(f"/office-records?edit={record_id}", f"선택한 첨부 {deleted_count}건이 삭제되었습니다.", "ok")
 
 
-@app.post("/office-records/save")
+@office_record_routes.post("/office-records/save")
 def office_records_save(
     request: Request,
     record_id: str = Form(""),
@@ -3382,12 +4033,13 @@ def office_records_save(
         return _with_flash("/office-records", "행정업무를 등록할 권한이 없습니다.", "error")
 
     cursor = conn.execute(
-        """
+        f"""
         INSERT INTO office_records(
-            record_code, record_type, title, facility_id, contact_id, target_name, priority, status, description,
+            id, record_code, record_type, title, facility_id, contact_id, target_name, priority, status, description,
             owner_user_id, due_date, completed_at, created_by, updated_by, created_at, updated_at
         )
-        VALUES ('', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        SELECT next_id, {ops_db.entity_code_sql("ADM")}, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+        FROM {ops_db.next_id_sql("office_records")}
         """,
         (
             record_type.strip(),
@@ -3408,8 +4060,7 @@ def office_records_save(
         ),
     )
     record_id_i = cursor.lastrowid
-    record_code = f"ADM-{record_id_i:04d}"
-    conn.execute("UPDATE office_records SET record_code = ? WHERE id = ?", (record_code, record_id_i))
+    record_code = ops_db.entity_code("ADM", record_id_i)
     conn.execute(
         """
         INSERT INTO office_record_updates(office_record_id, update_type, body, actor_user_id, created_at)
@@ -3423,7 +4074,7 @@ def office_records_save(
     return _with_flash(f"/office-records?edit={record_id_i}", "행정업무가 등록되었습니다.", "ok")
 
 
-@app.post("/office-records/update/{record_id}")
+@office_record_routes.post("/office-records/update/{record_id}")
 def office_records_update(
     request: Request,
     record_id: int,
@@ -3473,7 +4124,7 @@ def office_records_update(
     return _with_flash(f"/office-records?edit={record_id}", "행정업무 업데이트가 저장되었습니다.", "ok")
 
 
-@app.post("/office-records/delete/{record_id}")
+@office_record_routes.post("/office-records/delete/{record_id}")
 def office_records_delete(request: Request, record_id: int):
     user, error = _authorize(request, "office_records:view")
     if error:
@@ -3494,21 +4145,17 @@ def office_records_delete(request: Request, record_id: int):
     return _with_flash("/office-records", "행정업무가 삭제되었습니다.", "ok")
 
 
-@app.get("/inventory", response_class=HTMLResponse)
-def inventory_page(request: Request):
-    user, error = _authorize(request, "inventory:view")
-    if error:
-        return error
-
-    can_edit = auth.has_permission(user["role"], "inventory:edit")
-    can_tx = auth.has_permission(user["role"], "inventory:transact")
-    q = request.query_params.get("q", "").strip()
-    status = request.query_params.get("status", "").strip()
-    category = request.query_params.get("category", "").strip()
-    low_only = request.query_params.get("low_only", "").strip() == "1"
-    edit_id = _parse_int(request.query_params.get("edit", ""), 0)
-
-    conn = get_conn()
+def _inventory_rows_cursor(
+    conn,
+    q: str = "",
+    status: str = "",
+    category: str = "",
+    low_only: bool = False,
+    *,
+    after: tuple[str, int] | None = None,
+    limit: int = 0,
+    fields: Iterable[str] | None = None,
+):
     where = []
     params: list = []
     if q:
@@ -3523,17 +4170,38 @@ def inventory_page(request: Request):
     if low_only:
         where.append("quantity <= min_quantity")
     where_sql = "WHERE " + " AND ".join(where) if where else ""
+    order_sql = "ORDER BY (quantity <= min_quantity) DESC, updated_at DESC, id DESC"
+    if limit:
+        where_sql, params, order_sql = _keyset_sql(where_sql, params, "", after, limit)
 
-    items = conn.execute(
+    return conn.execute(
         f"""
-        SELECT *
+        SELECT {_select_columns("", {}, fields)}
         FROM inventory_items
         {where_sql}
-        ORDER BY (quantity <= min_quantity) DESC, updated_at DESC, id DESC
+        {order_sql}
         """,
         params,
-    ).fetchall()
-    attachments = _attachment_map(conn, "inventory", [row["id"] for row in items])
+    )
+
+
+@inventory_routes.get("/inventory", response_class=HTMLResponse)
+def inventory_page(request: Request):
+    user, error = _authorize(request, "inventory:view")
+    if error:
+        return error
+
+    can_edit = auth.has_permission(user["role"], "inventory:edit")
+    can_tx = auth.has_permission(user["role"], "inventory:transact")
+    q = request.query_params.get("q", "").strip()
+    status = request.query_params.get("status", "").strip()
+    category = request.query_params.get("category", "").strip()
+    low_only = request.query_params.get("low_only", "").strip() == "1"
+    edit_id = _parse_int(request.query_params.get("edit", ""), 0)
+
+    conn = get_conn()
+    items = _inventory_rows_cursor(conn, q, status, category, low_only).fetchall()
+    attachments = _attachment_map(conn, "inventory", [edit_id] if edit_id else [])
     edit_row = conn.execute("SELECT * FROM inventory_items WHERE id = ?", (edit_id,)).fetchone() if edit_id else None
     tx_rows = (
         conn.execute(
@@ -3663,17 +4331,18 @@ def inventory_page(request: Request):
                 actions.append("<span class='muted'>조회</span>")
             rows_html.append(
                 """
-                <tr>
+                <tr data-live-key='inventory:{item_id}'>
                   <td>{code}</td>
                   <td><strong>{name}</strong><div class='muted'>{spec}</div></td>
                   <td>{category}</td>
-                  <td>{qty}<div class='muted'>최소 {min_qty}</div></td>
-                  <td>{status}</td>
+                  <td><span data-live-field='quantity'>{qty}</span><div class='muted'>최소 {min_qty}</div></td>
+                  <td data-live-field='status'>{status}</td>
                   <td>{location}</td>
                   <td>{attachments}</td>
                   <td>{actions}</td>
                 </tr>
                 """.format(
+                    item_id=row["id"],
                     code=esc(row["item_code"]),
                     name=esc(row["name"]),
                     spec=esc(row["specification"] or "-"),
@@ -3682,7 +4351,7 @@ def inventory_page(request: Request):
                     min_qty=esc(f"{row['min_quantity']} {row['unit']}"),
                     status=status_badge("부족" if row["quantity"] <= row["min_quantity"] else row["status"]),
                     location=esc(row["location"] or "-"),
-                    attachments=attachment_gallery(attachments.get(row["id"], [])),
+                    attachments=attachment_placeholder("inventory", row["id"]),
                     actions="".join(actions),
                 )
             )
@@ -3708,6 +4377,7 @@ def inventory_page(request: Request):
             "재고 관리",
             "재고 품목과 수불 이력을 분리해, 단순 숫자 수정이 아니라 변화 내역이 남는 구조로 전환했습니다.",
         )
+        + live_feed_notice("inventory")
         + "<div class='layout-2'>"
         + form_html
         + list_html
@@ -3716,7 +4386,7 @@ def inventory_page(request: Request):
     return HTMLResponse(layout(title="재고 관리", body=body, user=user, flash_message=flash_message, flash_level=flash_level))
 
 
-@app.post("/inventory/attachments/delete/{item_id}")
+@inventory_routes.post("/inventory/attachments/delete/{item_id}")
 def inventory_delete_attachments(
     request: Request,
     item_id: int,
@@ -3743,7 +4413,7 @@ def inventory_delete_attachments(
     return _with_flash(f"/inventory?edit={item_id}", f"선택한 첨부 {deleted_count}건이 삭제되었습니다.", "ok")
 
 
-@app.post("/inventory/save")
+@inventory_routes.post("/inventory/save")
 def inventory_save(
     request: Request,
     item_id: str = Form(""),
@@ -3810,12 +4480,13 @@ def inventory_save(
         return _with_flash(f"/inventory?edit={item_id_i}", "재고 품목이 수정되었습니다.", "ok")
 
     cursor = conn.execute(
-        """
+        f"""
         INSERT INTO inventory_items(
-            item_code, category, name, specification, quantity, unit, location, status, min_quantity,
+            id, item_code, category, name, specification, quantity, unit, location, status, min_quantity,
             purchase_date, purchase_amount, note, created_by, updated_by, created_at, updated_at
         )
-        VALUES ('', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        SELECT next_id, {ops_db.entity_code_sql("INV")}, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+        FROM {ops_db.next_id_sql("inventory_items")}
         """,
         (
             category.strip(),
@@ -3836,7 +4507,6 @@ def inventory_save(
         ),
     )
     item_id_i = cursor.lastrowid
-    conn.execute("UPDATE inventory_items SET item_code = ? WHERE id = ?", (f"INV-{item_id_i:04d}", item_id_i))
     if quantity_i:
         conn.execute(
             """
@@ -3851,7 +4521,7 @@ def inventory_save(
     return _with_flash(f"/inventory?edit={item_id_i}", "재고 품목이 등록되었습니다.", "ok")
 
 
-@app.post("/inventory/tx/{item_id}")
+@inventory_routes.post("/inventory/tx/{item_id}")
 def inventory_transaction(
     request: Request,
     item_id: int,
@@ -3874,42 +4544,41 @@ def inventory_transaction(
     else:
         delta = raw_qty
 
-    conn = get_conn()
-    item = conn.execute("SELECT * FROM inventory_items WHERE id = ?", (item_id,)).fetchone()
-    if not item:
-        conn.close()
-        return _with_flash("/inventory", "재고 품목을 찾을 수 없습니다.", "error")
+    def apply(conn):
+        item = conn.execute("SELECT * FROM inventory_items WHERE id = ?", (item_id,)).fetchone()
+        if not item:
+            return _with_flash("/inventory", "재고 품목을 찾을 수 없습니다.", "error")
 
-    new_qty = int(item["quantity"] or 0) + delta
-    if new_qty < 0:
-        conn.close()
-        return _with_flash(f"/inventory?edit={item_id}", "재고가 음수가 될 수 없습니다.", "error")
+        new_qty = int(item["quantity"] or 0) + delta
+        if new_qty < 0:
+            return _with_flash(f"/inventory?edit={item_id}", "재고가 음수가 될 수 없습니다.", "error")
 
-    derived_status = item["status"]
-    if derived_status in {"정상", "부족"}:
-        derived_status = "부족" if new_qty <= int(item["min_quantity"] or 0) else "정상"
+        derived_status = item["status"]
+        if derived_status in {"정상", "부족"}:
+            derived_status = "부족" if new_qty <= int(item["min_quantity"] or 0) else "정상"
 
-    conn.execute(
-        """
-        UPDATE inventory_items
-        SET quantity = ?, status = ?, updated_by = ?, updated_at = ?
-        WHERE id = ?
-        """,
-        (new_qty, derived_status, user["id"], _now_text(), item_id),
-    )
-    conn.execute(
-        """
-        INSERT INTO inventory_transactions(item_id, tx_type, quantity_delta, reason, actor_user_id, created_at)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        (item_id, tx_type.strip(), delta, reason.strip(), user["id"], _now_text()),
-    )
-    conn.commit()
-    conn.close()
-    return _with_flash(f"/inventory?edit={item_id}", "수불 이력이 반영되었습니다.", "ok")
+        conn.execute(
+            """
+            UPDATE inventory_items
+            SET quantity = ?, status = ?, updated_by = ?, updated_at = ?
+            WHERE id = ?
+            """,
+            (new_qty, derived_status, user["id"], _now_text(), item_id),
+        )
+        conn.execute(
+            """
+            INSERT INTO inventory_transactions(item_id, tx_type, quantity_delta, reason, actor_user_id, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (item_id, tx_type.strip(), delta, reason.strip(), user["id"], _now_text()),
+        )
+        events.publish_on_commit(conn, "inventory", item_id)
+        return _with_flash(f"/inventory?edit={item_id}", "수불 이력이 반영되었습니다.", "ok")
 
+    return writer.run(apply)
 
-@app.post("/inventory/delete/{item_id}")
+
+@inventory_routes.post("/inventory/delete/{item_id}")
 def inventory_delete(request: Request, item_id: int):
     user, error = _authorize(request, "inventory:edit")
     if error:
@@ -3923,20 +4592,16 @@ def inventory_delete(request: Request, item_id: int):
     return _with_flash("/inventory", "재고 품목이 삭제되었습니다.", "ok")
 
 
-@app.get("/work-orders", response_class=HTMLResponse)
-def work_orders_page(request: Request):
-    user, error = _authorize(request, "work_orders:view")
-    if error:
-        return error
-
-    can_create = auth.has_permission(user["role"], "work_orders:create")
-    q = request.query_params.get("q", "").strip()
-    status = request.query_params.get("status", "").strip()
-    priority = request.query_params.get("priority", "").strip()
-    edit_id = _parse_int(request.query_params.get("edit", ""), 0)
-    complaint_prefill_id = _parse_int(request.query_params.get("complaint_id", ""), 0) if not edit_id else 0
-
-    conn = get_conn()
+def _work_order_rows_cursor(
+    conn,
+    q: str = "",
+    status: str = "",
+    priority: str = "",
+    *,
+    after: tuple[str, int] | None = None,
+    limit: int = 0,
+    fields: Iterable[str] | None = None,
+):
     where = []
     params: list = []
     if q:
@@ -3949,21 +4614,86 @@ def work_orders_page(request: Request):
         where.append("w.priority = ?")
         params.append(priority)
     where_sql = "WHERE " + " AND ".join(where) if where else ""
+    order_sql = """
+        ORDER BY CASE w.priority WHEN '긴급' THEN 1 WHEN '높음' THEN 2 WHEN '보통' THEN 3 ELSE 4 END,
+                 w.updated_at DESC, w.id DESC
+    """
+    if limit:
+        where_sql, params, order_sql = _keyset_sql(where_sql, params, "w.", after, limit)
 
-    orders = conn.execute(
+    return conn.execute(
         f"""
-        SELECT w.*, f.name AS facility_name, COALESCE(u.full_name, w.external_assignee_name, '') AS assignee_name, c.complaint_code, c.title AS complaint_title
+        SELECT {_select_columns("w.", WORK_ORDER_LIST_COLUMNS, fields)}
         FROM work_orders w
         LEFT JOIN facilities f ON f.id = w.facility_id
         LEFT JOIN users u ON u.id = w.assignee_user_id
         LEFT JOIN complaints c ON c.id = w.complaint_id
         {where_sql}
-        ORDER BY CASE w.priority WHEN '긴급' THEN 1 WHEN '높음' THEN 2 WHEN '보통' THEN 3 ELSE 4 END,
-                 w.updated_at DESC, w.id DESC
+        {order_sql}
         """,
         params,
-    ).fetchall()
-    attachments = _attachment_map(conn, "work_order", [row["id"] for row in orders])
+    )
+
+
+def _work_order_list_row(user, row) -> str:
+    due_text = fmt_date(row["due_date"])
+    overdue = row["due_date"] and row["due_date"] < _today_text() and row["status"] not in {"완료", "종결"}
+    due_badge = status_badge("지연" if overdue else ("완료" if row["status"] in {"완료", "종결"} else "정상"))
+    row_actions = []
+    if _can_manage_work_order(user, row):
+        row_actions.append(f"<a class='btn secondary' href='/work-orders?edit={row['id']}'>수정</a>")
+    elif _can_update_work_order(user, row):
+        row_actions.append(f"<a class='btn secondary' href='/work-orders?edit={row['id']}'>업데이트</a>")
+    else:
+        row_actions.append("<span class='muted'>조회</span>")
+    return (
+        """
+        <tr data-live-key='work_order:{work_order_id}'>
+          <td>{code}</td>
+          <td><strong>{title}</strong><div class='muted'>{category}</div><div class='muted'>{complaint}</div><div class='muted'>{description}</div></td>
+          <td>{facility}</td>
+          <td>{priority}<div style='margin-top:6px' data-live-field='status'>{status}</div></td>
+          <td>{assignee}<div class='muted'>기한 {due}</div><div style='margin-top:6px'>{due_badge}</div></td>
+          <td>{attachments}</td>
+          <td>{actions}</td>
+        </tr>
+        """.format(
+            work_order_id=row["id"],
+            code=esc(row["work_code"]),
+            title=esc(row["title"]),
+            category=esc(row["category"] or "-"),
+            complaint=esc(f"민원 {row['complaint_code']} · {row['complaint_title']}" if row["complaint_code"] else "민원 미연결"),
+            description=esc((row["description"] or "")[:80] + ("..." if len(row["description"] or "") > 80 else "")),
+            facility=esc(row["facility_name"] or "시설 미지정"),
+            priority=status_badge(row["priority"]),
+            status=status_badge(row["status"]),
+            assignee=esc(row["assignee_name"] or "미배정"),
+            due=esc(due_text),
+            due_badge=due_badge,
+            attachments=attachment_placeholder("work_order", row["id"]),
+            actions="".join(row_actions),
+        )
+    )
+
+
+@work_order_routes.get("/work-orders", response_class=HTMLResponse)
+def work_orders_page(request: Request):
+    user, error = _authorize(request, "work_orders:view")
+    if error:
+        return error
+    etag = _page_etag(request, user, "work_orders")
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+
+    can_create = auth.has_permission(user["role"], "work_orders:create")
+    q = request.query_params.get("q", "").strip()
+    status = request.query_params.get("status", "").strip()
+    priority = request.query_params.get("priority", "").strip()
+    edit_id = _parse_int(request.query_params.get("edit", ""), 0)
+    complaint_prefill_id = _parse_int(request.query_params.get("complaint_id", ""), 0) if not edit_id else 0
+
+    conn = get_conn()
+    attachments = _attachment_map(conn, "work_order", [edit_id] if edit_id else [])
     edit_row = conn.execute("SELECT * FROM work_orders WHERE id = ?", (edit_id,)).fetchone() if edit_id else None
     complaint_prefill = (
         conn.execute("SELECT * FROM complaints WHERE id = ?", (complaint_prefill_id,)).fetchone()
@@ -3985,9 +4715,17 @@ def work_orders_page(request: Request):
         if edit_id
         else []
     )
-    facility_options = _facility_options(conn)
+    facility_selected = _lookup_selected(
+        conn,
+        "facilities",
+        edit_row["facility_id"] if edit_row else complaint_prefill["facility_id"] if complaint_prefill else None,
+    )
+    complaint_selected = _lookup_selected(
+        conn,
+        "complaints",
+        edit_row["complaint_id"] if edit_row else complaint_prefill["id"] if complaint_prefill else None,
+    )
     assignee_options = _user_options(conn, include_viewers=False)
-    complaint_options = _complaint_options(conn)
     conn.close()
 
     can_manage_edit_row = _can_manage_work_order(user, edit_row)
@@ -4021,7 +4759,7 @@ def work_orders_page(request: Request):
                     if edit_row
                     else ""
                 )
-                + f"<div><label>연결 민원</label><select name='complaint_id'>{render_options(complaint_options, str(edit_row['complaint_id'] or '') if edit_row else str(complaint_prefill['id']) if complaint_prefill else '', blank_label='미연결')}</select></div>"
+                + f"<div><label>연결 민원</label>{lookup_field('complaint_id', 'complaints', complaint_selected, blank_label='미연결')}</div>"
                 + (
                     f"<div class='muted' style='padding:8px 0 2px;'>민원 프리필: {esc(complaint_prefill['complaint_code'])} 민원에서 제목, 시설, 요청자, 우선도가 기본값으로 채워졌습니다.</div>"
                     if complaint_prefill and not edit_row
@@ -4029,7 +4767,7 @@ def work_orders_page(request: Request):
                 )
                 + f"<div><label>분류</label><select name='category'>{render_options(category_options, edit_row['category'] if edit_row else '', blank_label='선택')}</select></div>"
                 + f"<div><label>작업 제목</label><input name='title' value='{esc(edit_row['title'] if edit_row else complaint_prefill['title'] if complaint_prefill else '')}' required></div>"
-                + f"<div><label>대상 시설</label><select name='facility_id'>{render_options(facility_options, str(edit_row['facility_id'] or '') if edit_row else str(complaint_prefill['facility_id'] or '') if complaint_prefill else '', blank_label='미지정')}</select></div>"
+                + f"<div><label>대상 시설</label>{lookup_field('facility_id', 'facilities', facility_selected)}</div>"
                 + "<div class='grid two'>"
                 + f"<div><label>요청자</label><input name='requester_name' value='{esc(edit_row['requester_name'] if edit_row else complaint_prefill['requester_name'] if complaint_prefill else '')}'></div>"
                 + f"<div><label>담당자</label><select name='assignee_user_id'>{render_options(assignee_options, str(edit_row['assignee_user_id'] or '') if edit_row else str(complaint_prefill['assignee_user_id'] or '') if complaint_prefill else '', blank_label='미지정')}</select></div>"
@@ -4094,76 +4832,63 @@ def work_orders_page(request: Request):
     else:
         form_html = info_box("읽기 전용", "현재 계정은 작업지시 조회만 가능합니다. 등록과 수정은 작업자 이상 권한이 필요합니다.")
 
-    if orders:
-        rows_html = []
-        for row in orders:
-            due_text = fmt_date(row["due_date"])
-            overdue = row["due_date"] and row["due_date"] < _today_text() and row["status"] not in {"완료", "종결"}
-            due_badge = status_badge("지연" if overdue else ("완료" if row["status"] in {"완료", "종결"} else "정상"))
-            row_actions = []
-            if _can_manage_work_order(user, row):
-                row_actions.append(f"<a class='btn secondary' href='/work-orders?edit={row['id']}'>수정</a>")
-            elif _can_update_work_order(user, row):
-                row_actions.append(f"<a class='btn secondary' href='/work-orders?edit={row['id']}'>업데이트</a>")
-            else:
-                row_actions.append("<span class='muted'>조회</span>")
-            rows_html.append(
-                """
-                <tr>
-                  <td>{code}</td>
-                  <td><strong>{title}</strong><div class='muted'>{category}</div><div class='muted'>{complaint}</div><div class='muted'>{description}</div></td>
-                  <td>{facility}</td>
-                  <td>{priority}<div style='margin-top:6px'>{status}</div></td>
-                  <td>{assignee}<div class='muted'>기한 {due}</div><div style='margin-top:6px'>{due_badge}</div></td>
-                  <td>{attachments}</td>
-                  <td>{actions}</td>
-                </tr>
-                """.format(
-                    code=esc(row["work_code"]),
-                    title=esc(row["title"]),
-                    category=esc(row["category"] or "-"),
-                    complaint=esc(f"민원 {row['complaint_code']} · {row['complaint_title']}" if row["complaint_code"] else "민원 미연결"),
-                    description=esc((row["description"] or "")[:80] + ("..." if len(row["description"] or "") > 80 else "")),
-                    facility=esc(row["facility_name"] or "시설 미지정"),
-                    priority=status_badge(row["priority"]),
-                    status=status_badge(row["status"]),
-                    assignee=esc(row["assignee_name"] or "미배정"),
-                    due=esc(due_text),
-                    due_badge=due_badge,
-                    attachments=attachment_gallery(attachments.get(row["id"], [])),
-                    actions="".join(row_actions),
-                )
+    stream_conn = get_conn(check_same_thread=False)
+    try:
+        work_order_cursor = _work_order_rows_cursor(stream_conn, q, status, priority)
+        first_rows = work_order_cursor.fetchmany(LIST_STREAM_CHUNK_ROWS)
+        if first_rows:
+            list_html = (
+                "<section class='panel'><div class='split'><div><h2>작업지시 목록</h2><p class='muted'>우선도와 상태를 기준으로 지연 작업을 우선 확인합니다.</p></div>"
+                "<form class='inline-form' method='get' action='/work-orders'>"
+                f"<input name='q' value='{esc(q)}' placeholder='번호, 제목, 내용, 요청자 검색'>"
+                f"<select name='status'>{render_options(status_options, status, blank_label='전체 상태')}</select>"
+                f"<select name='priority'>{render_options(priority_options, priority, blank_label='전체 우선도')}</select>"
+                "<button class='btn secondary' type='submit'>검색</button>"
+                "</form></div>"
+                "<table><thead><tr><th>번호</th><th>작업</th><th>시설</th><th>우선도/상태</th><th>담당/기한</th><th>첨부</th><th>관리</th></tr></thead>"
+                "<tbody>"
             )
-        list_html = (
-            "<section class='panel'><div class='split'><div><h2>작업지시 목록</h2><p class='muted'>우선도와 상태를 기준으로 지연 작업을 우선 확인합니다.</p></div>"
-            "<form class='inline-form' method='get' action='/work-orders'>"
-            f"<input name='q' value='{esc(q)}' placeholder='번호, 제목, 내용, 요청자 검색'>"
-            f"<select name='status'>{render_options(status_options, status, blank_label='전체 상태')}</select>"
-            f"<select name='priority'>{render_options(priority_options, priority, blank_label='전체 우선도')}</select>"
-            "<button class='btn secondary' type='submit'>검색</button>"
-            "</form></div>"
-            "<table><thead><tr><th>번호</th><th>작업</th><th>시설</th><th>우선도/상태</th><th>담당/기한</th><th>첨부</th><th>관리</th></tr></thead>"
-            f"<tbody>{''.join(rows_html)}</tbody></table></section>"
-        )
-    else:
-        list_html = "<section class='panel'><h2>작업지시 목록</h2>" + empty_state("조건에 맞는 작업지시가 없습니다.") + "</section>"
+        else:
+            stream_conn.close()
+            list_html = "<section class='panel'><h2>작업지시 목록</h2>" + empty_state("조건에 맞는 작업지시가 없습니다.") + "</section>"
 
-    flash_message, flash_level = _flash_from_request(request)
-    body = (
-        page_header(
-            "Work Orders",
-            "작업지시 관리",
-            "작업 요청, 배정, 진행 업데이트, 완료 기록을 한 엔티티로 관리합니다.",
+        flash_message, flash_level = _flash_from_request(request)
+        body = (
+            page_header(
+                "Work Orders",
+                "작업지시 관리",
+                "작업 요청, 배정, 진행 업데이트, 완료 기록을 한 엔티티로 관리합니다.",
+            )
+            + live_feed_notice("work_order")
+            + "<div class='layout-2'>"
+            + form_html
+            + list_html
         )
-        + "<div class='layout-2'>"
-        + form_html
-        + list_html
-        + "</div>"
-    )
-    return HTMLResponse(layout(title="작업지시 관리", body=body, user=user, flash_message=flash_message, flash_level=flash_level))
+        if not first_rows:
+            body += "</div>"
+            return HTMLResponse(
+                layout(title="작업지시 관리", body=body, user=user, flash_message=flash_message, flash_level=flash_level),
+                headers=_etag_headers(etag),
+            )
+        return _stream_list_page(
+            title="작업지시 관리",
+            user=user,
+            flash_message=flash_message,
+            flash_level=flash_level,
+            before_rows=body,
+            conn=stream_conn,
+            cursor=work_order_cursor,
+            first_rows=first_rows,
+            render_row=lambda row: _work_order_list_row(user, row),
+            after_rows="</tbody></table></section></div>",
+            headers=_etag_headers(etag),
+        )
+    except Exception:
+        stream_conn.close()
+        raise
 
 
-@app.post("/work-orders/save")
+@work_order_routes.post("/work-orders/save")
 def work_orders_save(
     request: Request,
     work_order_id: str = Form(""),
@@ -4240,12 +4965,13 @@ def work_orders_save(
         return _with_flash("/work-orders", "작업지시를 등록할 권한이 없습니다.", "error")
 
     cursor = conn.execute(
-        """
+        f"""
         INSERT INTO work_orders(
-            work_code, complaint_id, category, title, facility_id, requester_name, priority, status, description,
+            id, work_code, complaint_id, category, title, facility_id, requester_name, priority, status, description,
             assignee_user_id, due_date, completed_at, created_by, updated_by, created_at, updated_at
         )
-        VALUES ('', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        SELECT next_id, {ops_db.entity_code_sql("WO")}, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+        FROM {ops_db.next_id_sql("work_orders")}
         """,
         (
             complaint_id_i,
@@ -4266,8 +4992,7 @@ def work_orders_save(
         ),
     )
     work_order_id_i = cursor.lastrowid
-    work_code = f"WO-{work_order_id_i:04d}"
-    conn.execute("UPDATE work_orders SET work_code = ? WHERE id = ?", (work_code, work_order_id_i))
+    work_code = ops_db.entity_code("WO", work_order_id_i)
     conn.execute(
         """
         INSERT INTO work_order_updates(work_order_id, update_type, body, actor_user_id, created_at)
@@ -4275,6 +5000,7 @@ def work_orders_save(
         """,
         (work_order_id_i, "작업지시가 생성되었습니다.", user["id"], _now_text()),
     )
+    events.publish_on_commit(conn, "work_order", work_order_id_i, "create")
     _sync_complaint_for_work_order(conn, complaint_id_i, work_order_id_i, work_code, user["id"], assignee_id_i)
     _save_attachments(conn, "work_order", work_order_id_i, files, user["id"])
     conn.commit()
@@ -4282,7 +5008,7 @@ def work_orders_save(
     return _with_flash(f"/work-orders?edit={work_order_id_i}", "작업지시가 등록되었습니다.", "ok")
 
 
-@app.post("/work-orders/update/{work_order_id}")
+@work_order_routes.post("/work-orders/update/{work_order_id}")
 def work_orders_update(
     request: Request,
     work_order_id: int,
@@ -4295,44 +5021,43 @@ def work_orders_update(
     if error:
         return error
 
-    conn = get_conn()
-    order = conn.execute("SELECT * FROM work_orders WHERE id = ?", (work_order_id,)).fetchone()
-    if not order:
-        conn.close()
-        return _with_flash("/work-orders", "작업지시를 찾을 수 없습니다.", "error")
-    if not _can_update_work_order(user, order):
-        conn.close()
-        return _with_flash(f"/work-orders?edit={work_order_id}", "이 작업지시를 업데이트할 권한이 없습니다.", "error")
+    def apply(conn, attach):
+        order = conn.execute("SELECT * FROM work_orders WHERE id = ?", (work_order_id,)).fetchone()
+        if not order:
+            return _with_flash("/work-orders", "작업지시를 찾을 수 없습니다.", "error")
+        if not _can_update_work_order(user, order):
+            return _with_flash(f"/work-orders?edit={work_order_id}", "이 작업지시를 업데이트할 권한이 없습니다.", "error")
 
-    new_status = status.strip() or order["status"]
-    completed_at = order["completed_at"]
-    if new_status in {"완료", "종결"} and not completed_at:
-        completed_at = _now_text()
-    elif new_status not in {"완료", "종결"}:
-        completed_at = ""
+        new_status = status.strip() or order["status"]
+        completed_at = order["completed_at"]
+        if new_status in {"완료", "종결"} and not completed_at:
+            completed_at = _now_text()
+        elif new_status not in {"완료", "종결"}:
+            completed_at = ""
 
-    conn.execute(
-        """
-        UPDATE work_orders
-        SET status = ?, completed_at = ?, updated_by = ?, updated_at = ?
-        WHERE id = ?
-        """,
-        (new_status, completed_at, user["id"], _now_text(), work_order_id),
-    )
-    conn.execute(
-        """
-        INSERT INTO work_order_updates(work_order_id, update_type, body, actor_user_id, created_at)
-        VALUES (?, ?, ?, ?, ?)
-        """,
-        (work_order_id, update_type.strip(), body.strip(), user["id"], _now_text()),
-    )
-    _save_attachments(conn, "work_order", work_order_id, files, user["id"])
-    conn.commit()
-    conn.close()
-    return _with_flash(f"/work-orders?edit={work_order_id}", "작업 업데이트가 저장되었습니다.", "ok")
+        conn.execute(
+            """
+            UPDATE work_orders
+            SET status = ?, completed_at = ?, updated_by = ?, updated_at = ?
+            WHERE id = ?
+            """,
+            (new_status, completed_at, user["id"], _now_text(), work_order_id),
+        )
+        conn.execute(
+            """
+            INSERT INTO work_order_updates(work_order_id, update_type, body, actor_user_id, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (work_order_id, update_type.strip(), body.strip(), user["id"], _now_text()),
+        )
+        events.publish_on_commit(conn, "work_order", work_order_id)
+        attach(conn, "work_order", work_order_id, user["id"])
+        return _with_flash(f"/work-orders?edit={work_order_id}", "작업 업데이트가 저장되었습니다.", "ok")
 
+    return _run_with_uploads(apply, files)
 
-@app.post("/work-orders/delete/{work_order_id}")
+
+@work_order_routes.post("/work-orders/delete/{work_order_id}")
 def work_orders_delete(request: Request, work_order_id: int):
     user, error = _authorize(request, "work_orders:view")
     if error:
@@ -4353,11 +5078,58 @@ def work_orders_delete(request: Request, work_order_id: int):
     return _with_flash("/work-orders", "작업지시가 삭제되었습니다.", "ok")
 
 
-@app.get("/complaints", response_class=HTMLResponse)
+def _complaint_list_row(user, row) -> str:
+    due_text = fmt_date(row["response_due_at"])
+    row_actions = []
+    if _can_manage_complaint(user, row):
+        row_actions.append(f"<a class='btn secondary' href='/complaints?edit={row['id']}'>수정</a>")
+    elif _can_update_complaint(user, row):
+        row_actions.append(f"<a class='btn secondary' href='/complaints?edit={row['id']}'>업데이트</a>")
+    else:
+        row_actions.append("<span class='muted'>조회</span>")
+    repeat_badge = _badge(f"반복 {row['repeat_count']}건", "danger") if int(row["repeat_count"] or 0) else ""
+    feedback_badge = _complaint_feedback_badge(row["feedback_rating"]) if row["feedback_rating"] else ""
+    return (
+        """
+        <tr data-live-key='complaint:{complaint_id}'>
+          <td>{code}</td>
+          <td><strong>{title}</strong><div class='muted'>{channel} · {category}</div><div class='muted'>{requester}</div></td>
+          <td>{location}<div class='muted'>{facility}</div></td>
+          <td>{priority}<div style='margin-top:6px' data-live-field='status'>{status}</div><div style='margin-top:6px'>{sla}</div></td>
+          <td>{assignee}<div class='muted'>회신 목표 {due}</div><div style='margin-top:6px'>{repeat_badge} {feedback_badge}</div></td>
+          <td>{work_count}건</td>
+          <td>{actions}</td>
+        </tr>
+        """.format(
+            complaint_id=row["id"],
+            code=esc(row["complaint_code"]),
+            title=esc(row["title"]),
+            channel=esc(row["channel"]),
+            category=esc(row["category_primary"] or "-"),
+            requester=esc(f"{row['requester_name'] or '-'} / {row['requester_phone'] or '-'}"),
+            location=esc(row["unit_label"] or row["location_detail"] or "-"),
+            facility=esc(" / ".join(part for part in [row["site_name"] or "", row["facility_name"] or "시설 미지정"] if part)),
+            priority=status_badge(row["priority"]),
+            status=status_badge(row["status"]),
+            sla=_complaint_sla_badge(row),
+            assignee=esc(row["assignee_name"] or "미배정"),
+            due=esc(due_text),
+            repeat_badge=repeat_badge,
+            feedback_badge=feedback_badge,
+            work_count=esc(row["work_count"]),
+            actions="".join(row_actions),
+        )
+    )
+
+
+@complaint_routes.get("/complaints", response_class=HTMLResponse)
 def complaints_page(request: Request):
     user, error = _authorize(request, "complaints:view")
     if error:
         return error
+    etag = _page_etag(request, user, "complaints")
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
 
     can_create = auth.has_permission(user["role"], "complaints:create")
     q = request.query_params.get("q", "").strip()
@@ -4369,8 +5141,7 @@ def complaints_page(request: Request):
     edit_id = _parse_int(request.query_params.get("edit", ""), 0)
 
     conn = get_conn()
-    complaints = _fetch_complaint_rows(conn, q, status, channel, priority, site_name, building_label)
-    attachments = _attachment_map(conn, "complaint", [row["id"] for row in complaints])
+    attachments = _attachment_map(conn, "complaint", [edit_id] if edit_id else [])
     edit_row = (
         conn.execute(
             """
@@ -4433,7 +5204,7 @@ def complaints_page(request: Request):
     )
     repeat_rows = _complaint_repeat_candidates(conn, edit_row, limit=6) if edit_row else []
     template_rows = _complaint_template_rows(conn, edit_row["category_primary"] if edit_row else "")
-    facility_options = _facility_options(conn)
+    facility_selected = _lookup_selected(conn, "facilities", edit_row["facility_id"] if edit_row else None)
     assignee_options = _user_options(conn, include_viewers=False)
     site_options = [
         (str(row["site_name"]), str(row["site_name"]))
@@ -4507,7 +5278,7 @@ def complaints_page(request: Request):
                 )
                 + "<div class='grid two'>"
                 + f"<div><label>접수 채널</label><select name='channel'>{render_options(COMPLAINT_CHANNEL_OPTIONS, edit_row['channel'] if edit_row else '전화')}</select></div>"
-                + f"<div><label>대상 시설</label><select name='facility_id'>{render_options(facility_options, str(edit_row['facility_id'] or '') if edit_row else '', blank_label='미지정')}</select></div>"
+                + f"<div><label>대상 시설</label>{lookup_field('facility_id', 'facilities', facility_selected)}</div>"
                 + "</div>"
                 + "<div class='grid two'>"
                 + f"<div><label>1차 분류</label><select name='category_primary'>{render_options(COMPLAINT_CATEGORY_OPTIONS, edit_row['category_primary'] if edit_row else '', blank_label='선택')}</select></div>"
@@ -4747,84 +5518,68 @@ def complaints_page(request: Request):
     ]
     pdf_href = "/complaints/pdf" + (f"?{urlencode(pdf_params)}" if pdf_params else "")
 
-    if complaints:
-        rows_html = []
-        for row in complaints:
-            due_text = fmt_date(row["response_due_at"])
-            row_actions = []
-            if _can_manage_complaint(user, row):
-                row_actions.append(f"<a class='btn secondary' href='/complaints?edit={row['id']}'>수정</a>")
-            elif _can_update_complaint(user, row):
-                row_actions.append(f"<a class='btn secondary' href='/complaints?edit={row['id']}'>업데이트</a>")
-            else:
-                row_actions.append("<span class='muted'>조회</span>")
-            repeat_badge = _badge(f"반복 {row['repeat_count']}건", "danger") if int(row["repeat_count"] or 0) else ""
-            feedback_badge = _complaint_feedback_badge(row["feedback_rating"]) if row["feedback_rating"] else ""
-            rows_html.append(
-                """
-                <tr>
-                  <td>{code}</td>
-                  <td><strong>{title}</strong><div class='muted'>{channel} · {category}</div><div class='muted'>{requester}</div></td>
-                  <td>{location}<div class='muted'>{facility}</div></td>
-                  <td>{priority}<div style='margin-top:6px'>{status}</div><div style='margin-top:6px'>{sla}</div></td>
-                  <td>{assignee}<div class='muted'>회신 목표 {due}</div><div style='margin-top:6px'>{repeat_badge} {feedback_badge}</div></td>
-                  <td>{work_count}건</td>
-                  <td>{actions}</td>
-                </tr>
-                """.format(
-                    code=esc(row["complaint_code"]),
-                    title=esc(row["title"]),
-                    channel=esc(row["channel"]),
-                    category=esc(row["category_primary"] or "-"),
-                    requester=esc(f"{row['requester_name'] or '-'} / {row['requester_phone'] or '-'}"),
-                    location=esc(row["unit_label"] or row["location_detail"] or "-"),
-                    facility=esc(" / ".join(part for part in [row["site_name"] or "", row["facility_name"] or "시설 미지정"] if part)),
-                    priority=status_badge(row["priority"]),
-                    status=status_badge(row["status"]),
-                    sla=_complaint_sla_badge(row),
-                    assignee=esc(row["assignee_name"] or "미배정"),
-                    due=esc(due_text),
-                    repeat_badge=repeat_badge,
-                    feedback_badge=feedback_badge,
-                    work_count=esc(row["work_count"]),
-                    actions="".join(row_actions),
-                )
+    stream_conn = get_conn(check_same_thread=False)
+    try:
+        complaint_cursor = _complaint_rows_cursor(stream_conn, q, status, channel, priority, site_name, building_label)
+        first_rows = complaint_cursor.fetchmany(LIST_STREAM_CHUNK_ROWS)
+        if first_rows:
+            list_html = (
+                "<section class='panel'><div class='split'><div><h2>민원 목록</h2><p class='muted'>접수부터 회신, 종결까지 민원 기준으로 추적합니다.</p></div>"
+                "<form class='inline-form' method='get' action='/complaints'>"
+                f"<input name='q' value='{esc(q)}' placeholder='번호, 제목, 단지, 동/호, 연락처 검색'>"
+                f"<select name='status'>{render_options(COMPLAINT_STATUS_OPTIONS, status, blank_label='전체 상태')}</select>"
+                f"<select name='channel'>{render_options(COMPLAINT_CHANNEL_OPTIONS, channel, blank_label='전체 채널')}</select>"
+                f"<select name='priority'>{render_options(COMPLAINT_PRIORITY_OPTIONS, priority, blank_label='전체 우선도')}</select>"
+                f"<select name='site'>{render_options(site_options, site_name, blank_label='전체 단지')}</select>"
+                f"<select name='building'>{render_options(building_options, building_label, blank_label='전체 동')}</select>"
+                "<button class='btn secondary' type='submit'>검색</button>"
+                f"<a class='btn secondary' href='{esc(pdf_href)}' target='_blank' rel='noopener'>PDF 출력</a>"
+                "</form></div>"
+                "<table><thead><tr><th>번호</th><th>민원</th><th>위치</th><th>우선도/상태</th><th>담당/기한</th><th>연결 작업</th><th>관리</th></tr></thead>"
+                "<tbody>"
             )
-        list_html = (
-            "<section class='panel'><div class='split'><div><h2>민원 목록</h2><p class='muted'>접수부터 회신, 종결까지 민원 기준으로 추적합니다.</p></div>"
-            "<form class='inline-form' method='get' action='/complaints'>"
-            f"<input name='q' value='{esc(q)}' placeholder='번호, 제목, 단지, 동/호, 연락처 검색'>"
-            f"<select name='status'>{render_options(COMPLAINT_STATUS_OPTIONS, status, blank_label='전체 상태')}</select>"
-            f"<select name='channel'>{render_options(COMPLAINT_CHANNEL_OPTIONS, channel, blank_label='전체 채널')}</select>"
-            f"<select name='priority'>{render_options(COMPLAINT_PRIORITY_OPTIONS, priority, blank_label='전체 우선도')}</select>"
-            f"<select name='site'>{render_options(site_options, site_name, blank_label='전체 단지')}</select>"
-            f"<select name='building'>{render_options(building_options, building_label, blank_label='전체 동')}</select>"
-            "<button class='btn secondary' type='submit'>검색</button>"
-            f"<a class='btn secondary' href='{esc(pdf_href)}' target='_blank' rel='noopener'>PDF 출력</a>"
-            "</form></div>"
-            "<table><thead><tr><th>번호</th><th>민원</th><th>위치</th><th>우선도/상태</th><th>담당/기한</th><th>연결 작업</th><th>관리</th></tr></thead>"
-            f"<tbody>{''.join(rows_html)}</tbody></table></section>"
-        )
-    else:
-        list_html = "<section class='panel'><h2>민원 목록</h2>" + empty_state("조건에 맞는 민원이 없습니다.") + "</section>"
+        else:
+            stream_conn.close()
+            list_html = "<section class='panel'><h2>민원 목록</h2>" + empty_state("조건에 맞는 민원이 없습니다.") + "</section>"
 
-    flash_message, flash_level = _flash_from_request(request)
-    body = (
-        page_header(
-            "Complaints",
-            "민원 관리",
-            "민원 접수, 분류, 배정, 회신, 작업지시 연결을 하나의 흐름으로 관리합니다.",
-            actions=f"<a class='btn secondary' href='{esc(pdf_href)}' target='_blank' rel='noopener'>PDF 출력</a>",
+        flash_message, flash_level = _flash_from_request(request)
+        body = (
+            page_header(
+                "Complaints",
+                "민원 관리",
+                "민원 접수, 분류, 배정, 회신, 작업지시 연결을 하나의 흐름으로 관리합니다.",
+                actions=f"<a class='btn secondary' href='{esc(pdf_href)}' target='_blank' rel='noopener'>PDF 출력</a>",
+            )
+            + live_feed_notice("complaint")
+            + "<div class='layout-2'>"
+            + form_html
+            + list_html
         )
-        + "<div class='layout-2'>"
-        + form_html
-        + list_html
-        + "</div>"
-    )
-    return HTMLResponse(layout(title="민원 관리", body=body, user=user, flash_message=flash_message, flash_level=flash_level))
+        if not first_rows:
+            body += "</div>"
+            return HTMLResponse(
+                layout(title="민원 관리", body=body, user=user, flash_message=flash_message, flash_level=flash_level),
+                headers=_etag_headers(etag),
+            )
+        return _stream_list_page(
+            title="민원 관리",
+            user=user,
+            flash_message=flash_message,
+            flash_level=flash_level,
+            before_rows=body,
+            conn=stream_conn,
+            cursor=complaint_cursor,
+            first_rows=first_rows,
+            render_row=lambda row: _complaint_list_row(user, row),
+            after_rows="</tbody></table></section></div>",
+            headers=_etag_headers(etag),
+        )
+    except Exception:
+        stream_conn.close()
+        raise
 
 
-@app.get("/complaints/pdf")
+@complaint_routes.get("/complaints/pdf")
 def complaints_pdf(request: Request):
     user, error = _authorize(request, "complaints:view")
     if error:
@@ -4840,15 +5595,16 @@ def complaints_pdf(request: Request):
     conn = get_conn()
     complaint_rows = _fetch_complaint_rows(conn, q, status, channel, priority, site_name, building_label)
     conn.close()
-    pdf_bytes = _build_complaints_pdf(
-        complaint_rows,
-        q=q,
-        status=status,
-        channel=channel,
-        priority=priority,
-        site_name=site_name,
-        building_label=building_label,
-    )
+    with memory.track("job-complaints-pdf-export", MEMORY_DIR):
+        pdf_bytes = _build_complaints_pdf(
+            complaint_rows,
+            q=q,
+            status=status,
+            channel=channel,
+            priority=priority,
+            site_name=site_name,
+            building_label=building_label,
+        )
     filename = f"complaints-report-{date.today().strftime('%Y%m%d')}.pdf"
     return Response(
         content=pdf_bytes,
@@ -4857,7 +5613,7 @@ def complaints_pdf(request: Request):
     )
 
 
-@app.post("/complaints/save")
+@complaint_routes.post("/complaints/save")
 def complaints_save(
     request: Request,
     complaint_id: str = Form(""),
@@ -4888,25 +5644,73 @@ def complaints_save(
     requester_phone_v = auth.normalize_phone(requester_phone)
     requester_email_v = requester_email.strip()
 
-    conn = get_conn()
-    if complaint_id_i:
-        existing = conn.execute("SELECT * FROM complaints WHERE id = ?", (complaint_id_i,)).fetchone()
-        if not existing:
-            conn.close()
-            return _with_flash("/complaints", "민원을 찾을 수 없습니다.", "error")
-        if not _can_manage_complaint(user, existing):
-            conn.close()
-            return _with_flash(f"/complaints?edit={complaint_id_i}", "이 민원의 기본정보를 수정할 권한이 없습니다.", "error")
+    def apply(conn, attach):
+        if complaint_id_i:
+            existing = conn.execute("SELECT * FROM complaints WHERE id = ?", (complaint_id_i,)).fetchone()
+            if not existing:
+                return _with_flash("/complaints", "민원을 찾을 수 없습니다.", "error")
+            if not _can_manage_complaint(user, existing):
+                return _with_flash(f"/complaints?edit={complaint_id_i}", "이 민원의 기본정보를 수정할 권한이 없습니다.", "error")
+
+            response_due_at_v = _normalize_complaint_due_date(response_due_at, priority.strip(), existing)
+            resolved_at, closed_at = _complaint_timestamps(status.strip(), existing)
+            conn.execute(
+                """
+                UPDATE complaints
+                SET channel = ?, category_primary = ?, category_secondary = ?, facility_id = ?, unit_label = ?, location_detail = ?,
+                    requester_name = ?, requester_phone = ?, requester_email = ?, title = ?, description = ?, priority = ?, status = ?,
+                    response_due_at = ?, resolved_at = ?, closed_at = ?, assignee_user_id = ?, updated_by = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (
+                    channel.strip(),
+                    category_primary.strip(),
+                    category_secondary.strip(),
+                    facility_id_i,
+                    unit_label.strip(),
+                    location_detail.strip(),
+                    requester_name.strip(),
+                    requester_phone_v,
+                    requester_email_v,
+                    title.strip(),
+                    description.strip(),
+                    priority.strip(),
+                    status.strip(),
+                    response_due_at_v,
+                    resolved_at,
+                    closed_at,
+                    assignee_id_i,
+                    user["id"],
+                    _now_text(),
+                    complaint_id_i,
+                ),
+            )
+            _record_complaint_update(
+                conn,
+                complaint_id_i,
+                "기본정보수정",
+                "민원 기본정보가 수정되었습니다.",
+                user["id"],
+                status_from=existing["status"] if existing["status"] != status.strip() else "",
+                status_to=status.strip() if existing["status"] != status.strip() else "",
+            )
+            attach(conn, "complaint", complaint_id_i, user["id"])
+            return _with_flash(f"/complaints?edit={complaint_id_i}", "민원이 수정되었습니다.", "ok")
 
-        response_due_at_v = _normalize_complaint_due_date(response_due_at, priority.strip(), existing)
-        resolved_at, closed_at = _complaint_timestamps(status.strip(), existing)
-        conn.execute(
-            """
-            UPDATE complaints
-            SET channel = ?, category_primary = ?, category_secondary = ?, facility_id = ?, unit_label = ?, location_detail = ?,
-                requester_name = ?, requester_phone = ?, requester_email = ?, title = ?, description = ?, priority = ?, status = ?,
-                response_due_at = ?, resolved_at = ?, closed_at = ?, assignee_user_id = ?, updated_by = ?, updated_at = ?
-            WHERE id = ?
+        if not auth.has_permission(user["role"], "complaints:create"):
+            return _with_flash("/complaints", "민원을 등록할 권한이 없습니다.", "error")
+
+        response_due_at_v = _normalize_complaint_due_date(response_due_at, priority.strip())
+        resolved_at, closed_at = _complaint_timestamps(status.strip())
+        cursor = conn.execute(
+            f"""
+            INSERT INTO complaints(
+                id, complaint_code, channel, category_primary, category_secondary, facility_id, unit_label, location_detail,
+                requester_name, requester_phone, requester_email, title, description, priority, status, response_due_at,
+                resolved_at, closed_at, assignee_user_id, created_by, updated_by, created_at, updated_at
+            )
+            SELECT next_id, {ops_db.entity_code_sql("CP")}, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+            FROM {ops_db.next_id_sql("complaints")}
             """,
             (
                 channel.strip(),
@@ -4927,73 +5731,20 @@ def complaints_save(
                 closed_at,
                 assignee_id_i,
                 user["id"],
+                user["id"],
+                _now_text(),
                 _now_text(),
-                complaint_id_i,
             ),
         )
-        _record_complaint_update(
-            conn,
-            complaint_id_i,
-            "기본정보수정",
-            "민원 기본정보가 수정되었습니다.",
-            user["id"],
-            status_from=existing["status"] if existing["status"] != status.strip() else "",
-            status_to=status.strip() if existing["status"] != status.strip() else "",
-        )
-        _save_attachments(conn, "complaint", complaint_id_i, files, user["id"])
-        conn.commit()
-        conn.close()
-        return _with_flash(f"/complaints?edit={complaint_id_i}", "민원이 수정되었습니다.", "ok")
+        created_id = cursor.lastrowid
+        _record_complaint_update(conn, created_id, "접수", "민원이 접수되었습니다.", user["id"], status_to=status.strip())
+        attach(conn, "complaint", created_id, user["id"])
+        return _with_flash(f"/complaints?edit={created_id}", "민원이 등록되었습니다.", "ok")
 
-    if not auth.has_permission(user["role"], "complaints:create"):
-        conn.close()
-        return _with_flash("/complaints", "민원을 등록할 권한이 없습니다.", "error")
-
-    response_due_at_v = _normalize_complaint_due_date(response_due_at, priority.strip())
-    resolved_at, closed_at = _complaint_timestamps(status.strip())
-    cursor = conn.execute(
-        """
-        INSERT INTO complaints(
-            complaint_code, channel, category_primary, category_secondary, facility_id, unit_label, location_detail,
-            requester_name, requester_phone, requester_email, title, description, priority, status, response_due_at,
-            resolved_at, closed_at, assignee_user_id, created_by, updated_by, created_at, updated_at
-        )
-        VALUES ('', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            channel.strip(),
-            category_primary.strip(),
-            category_secondary.strip(),
-            facility_id_i,
-            unit_label.strip(),
-            location_detail.strip(),
-            requester_name.strip(),
-            requester_phone_v,
-            requester_email_v,
-            title.strip(),
-            description.strip(),
-            priority.strip(),
-            status.strip(),
-            response_due_at_v,
-            resolved_at,
-            closed_at,
-            assignee_id_i,
-            user["id"],
-            user["id"],
-            _now_text(),
-            _now_text(),
-        ),
-    )
-    complaint_id_i = cursor.lastrowid
-    conn.execute("UPDATE complaints SET complaint_code = ? WHERE id = ?", (f"CP-{complaint_id_i:04d}", complaint_id_i))
-    _record_complaint_update(conn, complaint_id_i, "접수", "민원이 접수되었습니다.", user["id"], status_to=status.strip())
-    _save_attachments(conn, "complaint", complaint_id_i, files, user["id"])
-    conn.commit()
-    conn.close()
-    return _with_flash(f"/complaints?edit={complaint_id_i}", "민원이 등록되었습니다.", "ok")
+    return _run_with_uploads(apply, files)
 
 
-@app.post("/complaints/update/{complaint_id}")
+@complaint_routes.post("/complaints/update/{complaint_id}")
 def complaints_update(
     request: Request,
     complaint_id: int,
@@ -5007,42 +5758,40 @@ def complaints_update(
     if error:
         return error
 
-    conn = get_conn()
-    complaint = conn.execute("SELECT * FROM complaints WHERE id = ?", (complaint_id,)).fetchone()
-    if not complaint:
-        conn.close()
-        return _with_flash("/complaints", "민원을 찾을 수 없습니다.", "error")
-    if not _can_update_complaint(user, complaint):
-        conn.close()
-        return _with_flash(f"/complaints?edit={complaint_id}", "이 민원을 업데이트할 권한이 없습니다.", "error")
+    def apply(conn, attach):
+        complaint = conn.execute("SELECT * FROM complaints WHERE id = ?", (complaint_id,)).fetchone()
+        if not complaint:
+            return _with_flash("/complaints", "민원을 찾을 수 없습니다.", "error")
+        if not _can_update_complaint(user, complaint):
+            return _with_flash(f"/complaints?edit={complaint_id}", "이 민원을 업데이트할 권한이 없습니다.", "error")
 
-    new_status = status.strip() or complaint["status"]
-    resolved_at, closed_at = _complaint_timestamps(new_status, complaint)
-    conn.execute(
-        """
-        UPDATE complaints
-        SET status = ?, resolved_at = ?, closed_at = ?, updated_by = ?, updated_at = ?
-        WHERE id = ?
-        """,
-        (new_status, resolved_at, closed_at, user["id"], _now_text(), complaint_id),
-    )
-    _record_complaint_update(
-        conn,
-        complaint_id,
-        update_type.strip(),
-        message.strip(),
-        user["id"],
-        status_from=complaint["status"] if complaint["status"] != new_status else "",
-        status_to=new_status if complaint["status"] != new_status else "",
-        is_public_note=1 if _bool_from_form(is_public_note) else 0,
-    )
-    _save_attachments(conn, "complaint", complaint_id, files, user["id"])
-    conn.commit()
-    conn.close()
-    return _with_flash(f"/complaints?edit={complaint_id}", "민원 업데이트가 저장되었습니다.", "ok")
+        new_status = status.strip() or complaint["status"]
+        resolved_at, closed_at = _complaint_timestamps(new_status, complaint)
+        conn.execute(
+            """
+            UPDATE complaints
+            SET status = ?, resolved_at = ?, closed_at = ?, updated_by = ?, updated_at = ?
+            WHERE id = ?
+            """,
+            (new_status, resolved_at, closed_at, user["id"], _now_text(), complaint_id),
+        )
+        _record_complaint_update(
+            conn,
+            complaint_id,
+            update_type.strip(),
+            message.strip(),
+            user["id"],
+            status_from=complaint["status"] if complaint["status"] != new_status else "",
+            status_to=new_status if complaint["status"] != new_status else "",
+            is_public_note=1 if _bool_from_form(is_public_note) else 0,
+        )
+        attach(conn, "complaint", complaint_id, user["id"])
+        return _with_flash(f"/complaints?edit={complaint_id}", "민원 업데이트가 저장되었습니다.", "ok")
+
+    return _run_with_uploads(apply, files)
 
 
-@app.post("/complaints/feedback/{complaint_id}")
+@complaint_routes.post("/complaints/feedback/{complaint_id}")
 def complaints_feedback(
     request: Request,
     complaint_id: int,
@@ -5106,7 +5855,7 @@ def complaints_feedback(
     return _with_flash(f"/complaints?edit={complaint_id}", action_message, "ok")
 
 
-@app.post("/complaints/delete/{complaint_id}")
+@complaint_routes.post("/complaints/delete/{complaint_id}")
 def complaints_delete(request: Request, complaint_id: int):
     user, error = _authorize(request, "complaints:view")
     if error:
@@ -5128,11 +5877,14 @@ def complaints_delete(request: Request, complaint_id: int):
     return _with_flash("/complaints", "민원이 삭제되었습니다.", "ok")
 
 
-@app.get("/reports", response_class=HTMLResponse)
+@report_routes.get("/reports", response_class=HTMLResponse)
 def reports_page(request: Request):
     user, error = _authorize(request, "reports:view")
     if error:
         return error
+    etag = _page_etag(request, user, "reports")
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
 
     start = request.query_params.get("start", _month_start_text())
     end = request.query_params.get("end", _today_text())
@@ -5914,24 +6666,51 @@ def reports_page(request: Request):
         + updates_html
         + "</section></div></div>"
     )
-    return HTMLResponse(layout(title="운영 보고서", body=body, user=user, flash_message=flash_message, flash_level=flash_level))
+    return HTMLResponse(
+        layout(title="운영 보고서", body=body, user=user, flash_message=flash_message, flash_level=flash_level),
+        headers=_etag_headers(etag),
+    )
 
 
-@app.get("/admin/database", response_class=HTMLResponse)
+@admin_routes.get("/admin/database", response_class=HTMLResponse)
 def database_page(request: Request):
     user, error = _authorize(request, "db:raw:view")
     if error:
         return error
 
-    selected_table = _db_safe_table(request.query_params.get("table", DB_MANAGED_TABLES[0]))
-    edit_id = _parse_int(request.query_params.get("edit", ""), 0)
+    params = request.query_params
+    selected_table = _db_safe_table(params.get("table", DB_MANAGED_TABLES[0]))
+    edit_id = _parse_int(params.get("edit", ""), 0)
+    before = max(_parse_int(params.get("before", ""), 0), 0)
+    after = 0 if before else max(_parse_int(params.get("after", ""), 0), 0)
+    limit = min(max(_parse_int(params.get("limit", ""), DB_PAGE_SIZE), 1), DB_MAX_PAGE_SIZE)
     conn = get_conn()
     columns = _db_columns(conn, selected_table)
-    rows = conn.execute(f"SELECT * FROM {selected_table} ORDER BY id DESC LIMIT 100").fetchall()
+    filters = _db_parse_filters(columns, params)
+    try:
+        where, where_params = _db_filter_sql(columns, filters, _db_text_range_columns(conn, selected_table, columns))
+    except ValueError as exc:
+        conn.close()
+        return _with_flash(f"/admin/database?table={selected_table}", str(exc), "error")
+    rows = _db_rows_cursor(conn, selected_table, where, where_params, before=before, after=after, limit=limit + 1).fetchall()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if after:
+        rows.reverse()
+    newer_after = rows[0]["id"] if rows and (has_more if after else before) else 0
+    older_before = (rows[-1]["id"] if rows else after + 1) if (after or has_more) else 0
     edit_row = conn.execute(f"SELECT * FROM {selected_table} WHERE id = ?", (edit_id,)).fetchone() if edit_id else None
-    table_cards = _db_table_cards(conn, selected_table)
+    indexed = _db_indexed_columns(conn, selected_table)
+    stats = table_stats.read(conn, DB_MANAGED_TABLES)
     pdf_import_state = _complaints_pdf_import_state(conn)
     conn.close()
+    table_stats.schedule_refresh([table for table, stat in stats.items() if stat["stale"]])
+    table_cards = _db_table_cards(stats, selected_table)
+    toolbar = _db_render_filters(selected_table, columns, indexed, filters, limit)
+    pager = _db_render_pager(
+        selected_table, filters, limit, rows, newer_after=newer_after, older_before=older_before, paged=bool(before or after)
+    )
+    view_query = _db_view_query(selected_table, filters, limit, before=before, after=after)
 
     flash_message, flash_level = _flash_from_request(request)
     body = (
@@ -5939,6 +6718,7 @@ def database_page(request: Request):
             "Raw Database Admin",
             "DB 관리",
             "모든 운영 테이블을 raw DB 수준에서 직접 조회·등록·수정·삭제합니다.",
+            actions="<a class='btn secondary' href='/admin/sql'>SQL 통계</a><a class='btn secondary' href='/admin/profiler'>CPU 프로파일</a><a class='btn secondary' href='/admin/memory'>메모리</a>",
         )
         + "<div class='layout-2'>"
         + "<div class='stack'>"
@@ -5946,8 +6726,9 @@ def database_page(request: Request):
         + info_box("PDF 출력", "민원 PDF는 상단 메뉴의 민원 화면에서 검색 버튼 옆 'PDF 출력'으로 내려받습니다.")
         + info_box("주의", "sessions 삭제는 즉시 로그아웃 효과를 낼 수 있고, attachments 삭제는 연결된 파일 참조를 제거합니다.")
         + info_box("입력 방식", "현재 화면은 공통 CRUD 화면이라 외래키는 숫자 id로 직접 입력합니다.")
+        + info_box("행 수", "오른쪽 행 수는 캐시된 통계입니다. 변경 뒤에는 '≈'로 표시되고 백그라운드에서 다시 집계됩니다.")
         + _db_render_form(selected_table, columns, edit_row)
-        + _db_render_rows(selected_table, columns, rows)
+        + _db_render_rows(selected_table, columns, rows, toolbar=toolbar, pager=pager, view_query=view_query)
         + "</div>"
         + "<div class='stack'>"
         + table_cards
@@ -5956,7 +6737,7 @@ def database_page(request: Request):
     return HTMLResponse(layout(title="DB 관리", body=body, user=user, flash_message=flash_message, flash_level=flash_level))
 
 
-@app.post("/admin/complaints-pdf-import")
+@admin_routes.post("/admin/complaints-pdf-import")
 async def admin_complaints_pdf_import(request: Request):
     user, error = _authorize(request, "db:raw:edit")
     if error:
@@ -5979,15 +6760,16 @@ async def admin_complaints_pdf_import(request: Request):
     try:
         if action == "apply":
             backup_path = _db_backup_snapshot("operations_pre_pdf_import")
-        summary = pdf_import.import_complaints_pdf_bytes(
-            conn,
-            pdf_bytes,
-            source_name=upload.filename,
-            dry_run=action != "apply",
-            update_existing=update_existing,
-            create_work_orders=create_work_orders,
-            default_user_id=int(user["id"]),
-        )
+        with memory.track(f"job-complaints-pdf-import-{action}", MEMORY_DIR):
+            summary = pdf_import.import_complaints_pdf_bytes(
+                conn,
+                pdf_bytes,
+                source_name=upload.filename,
+                dry_run=action != "apply",
+                update_existing=update_existing,
+                create_work_orders=create_work_orders,
+                default_user_id=int(user["id"]),
+            )
         if action == "apply":
             conn.commit()
         else:
@@ -6003,7 +6785,7 @@ async def admin_complaints_pdf_import(request: Request):
         conn.close()
 
 
-@app.post("/admin/database/save")
+@admin_routes.post("/admin/database/save")
 async def database_save(request: Request):
     user, error = _authorize(request, "db:raw:edit")
     if error:
@@ -6012,10 +6794,9 @@ async def database_save(request: Request):
     form = await request.form()
     table = _db_safe_table(str(form.get("table", "")))
     row_id = _parse_int(form.get("row_id", ""), 0)
-    conn = get_conn()
-    columns = _db_columns(conn, table)
 
-    try:
+    def apply(conn):
+        columns = _db_columns(conn, table)
         if row_id:
             assignments = []
             values = []
@@ -6026,59 +6807,44 @@ async def database_save(request: Request):
                 assignments.append(f"{column['name']} = ?")
                 values.append(converted)
             conn.execute(f"UPDATE {table} SET {', '.join(assignments)} WHERE id = ?", [*values, row_id])
-            conn.commit()
-            conn.close()
             return _with_flash(f"/admin/database?table={table}&edit={row_id}", "행이 수정되었습니다.", "ok")
 
-        insert_columns = []
+        code_info = DB_CODE_FIELDS.get(table)
+        insert_columns = ["id"] if code_info else []
         insert_values = []
-        placeholders = []
+        placeholders = ["next_id"] if code_info else []
         for column in columns:
             if column["pk"]:
                 continue
             raw_value = form.get(f"col_{column['name']}", "")
-            code_info = DB_CODE_FIELDS.get(table)
             if code_info and column["name"] == code_info[0] and str(raw_value or "").strip() == "":
-                converted = f"__pending__{code_info[1].lower()}_{uuid.uuid4().hex}"
-            else:
-                converted = _db_convert_value(column, raw_value, for_create=True)
+                insert_columns.append(column["name"])
+                placeholders.append(ops_db.entity_code_sql(code_info[1]))
+                continue
+            converted = _db_convert_value(column, raw_value, for_create=True)
             if converted is _DB_OMIT:
                 continue
             insert_columns.append(column["name"])
             insert_values.append(converted)
             placeholders.append("?")
 
-        cursor = conn.execute(
-            f"INSERT INTO {table} ({', '.join(insert_columns)}) VALUES ({', '.join(placeholders)})",
-            insert_values,
-        )
-        conn.commit()
-        new_id = cursor.lastrowid
-        code_info = DB_CODE_FIELDS.get(table)
         if code_info:
-            code_field, code_prefix = code_info
-            current_code = conn.execute(
-                f"SELECT {code_field} FROM {table} WHERE id = ?",
-                (new_id,),
-            ).fetchone()[code_field]
-            if str(current_code).startswith("__pending__"):
-                conn.execute(
-                    f"UPDATE {table} SET {code_field} = ? WHERE id = ?",
-                    (f"{code_prefix}-{new_id:04d}", new_id),
-                )
-                conn.commit()
-        conn.close()
+            sql = f"INSERT INTO {table} ({', '.join(insert_columns)}) SELECT {', '.join(placeholders)} FROM {ops_db.next_id_sql(table)}"
+        else:
+            sql = f"INSERT INTO {table} ({', '.join(insert_columns)}) VALUES ({', '.join(placeholders)})"
+        new_id = conn.execute(sql, insert_values).lastrowid
         return _with_flash(f"/admin/database?table={table}&edit={new_id}", "행이 등록되었습니다.", "ok")
+
+    try:
+        return await writer.run_async(apply)
     except Exception as exc:
-        conn.rollback()
-        conn.close()
         target = f"/admin/database?table={table}"
         if row_id:
             target += f"&edit={row_id}"
         return _with_flash(target, f"DB 저장에 실패했습니다: {exc}", "error")
 
 
-@app.post("/admin/database/delete")
+@admin_routes.post("/admin/database/delete")
 async def database_delete(request: Request):
     user, error = _authorize(request, "db:raw:edit")
     if error:
@@ -6115,7 +6881,7 @@ async def database_delete(request: Request):
         return _with_flash(f"/admin/database?table={table}", f"DB 삭제에 실패했습니다: {exc}", "error")
 
 
-@app.post("/admin/database/delete-selected")
+@admin_routes.post("/admin/database/delete-selected")
 async def database_delete_selected(request: Request):
     user, error = _authorize(request, "db:raw:edit")
     if error:
@@ -6158,7 +6924,282 @@ async def database_delete_selected(request: Request):
         return _with_flash(f"/admin/database?table={table}", f"선택 삭제에 실패했습니다: {exc}", "error")
 
 
-@app.get("/admin/users", response_class=HTMLResponse)
+@admin_routes.get("/admin/sql", response_class=HTMLResponse)
+def sql_stats_page(request: Request):
+    user, error = _authorize(request, "db:raw:view")
+    if error:
+        return error
+
+    top_rows = []
+    for item in metrics.top_statements(SQL_STATS_TOP_N):
+        top_rows.append(
+            "<tr>"
+            f"<td><code>{esc(item['sql'])}</code><div class='muted'>{esc(item['route'] or '-')}</div></td>"
+            f"<td>{item['calls']:,}</td>"
+            f"<td>{item['total_ms']:,.1f}</td>"
+            f"<td>{item['avg_ms']:,.2f}</td>"
+            f"<td>{item['max_ms']:,.1f}</td>"
+            f"<td>{item['rows']:,}</td>"
+            "</tr>"
+        )
+    slow_rows = []
+    for item in metrics.slow_queries():
+        slow_rows.append(
+            "<tr>"
+            f"<td>{esc(item['at'])}</td>"
+            f"<td>{esc(item['route'] or '-')}</td>"
+            f"<td>{item['ms']:,.1f}</td>"
+            f"<td>{item['rows']:,}</td>"
+            f"<td><code>{esc(item['sql'])}</code></td>"
+            "</tr>"
+        )
+    reset_form = ""
+    if auth.has_permission(user["role"], "db:raw:edit"):
+        reset_form = "<form method='post' action='/admin/sql/reset'><button class='btn secondary' type='submit'>통계 초기화</button></form>"
+
+    flash_message, flash_level = _flash_from_request(request)
+    body = (
+        page_header(
+            "SQL Statistics",
+            "SQL 통계",
+            f"서버 시작 이후 실행된 SQL 문을 누적 시간 순으로 보여줍니다. {metrics.SLOW_QUERY_MS:g}ms 이상은 느린 쿼리로 기록됩니다.",
+            actions="<a class='btn secondary' href='/admin/database'>DB 관리</a>" + reset_form,
+        )
+        + f"<section class='panel'><h2>누적 시간 상위 {SQL_STATS_TOP_N}개</h2>"
+        + (
+            "<table><thead><tr><th>SQL / 마지막 경로</th><th>호출</th><th>누적 ms</th><th>평균 ms</th><th>최대 ms</th><th>행 수</th></tr></thead>"
+            f"<tbody>{''.join(top_rows)}</tbody></table>"
+            if top_rows
+            else empty_state("아직 기록된 SQL이 없습니다.")
+        )
+        + "</section>"
+        + "<section class='panel'><h2>최근 느린 쿼리</h2>"
+        + (
+            "<table><thead><tr><th>시각</th><th>경로</th><th>ms</th><th>행 수</th><th>SQL</th></tr></thead>"
+            f"<tbody>{''.join(slow_rows)}</tbody></table>"
+            if slow_rows
+            else empty_state("느린 쿼리가 없습니다.")
+        )
+        + "</section>"
+    )
+    return HTMLResponse(layout(title="SQL 통계", body=body, user=user, flash_message=flash_message, flash_level=flash_level))
+
+
+@admin_routes.post("/admin/sql/reset")
+def sql_stats_reset(request: Request):
+    user, error = _authorize(request, "db:raw:edit")
+    if error:
+        return error
+    metrics.reset_statement_stats()
+    return _with_flash("/admin/sql", "SQL 통계를 초기화했습니다.", "ok")
+
+
+@admin_routes.get("/admin/profiler", response_class=HTMLResponse)
+def profiler_page(request: Request):
+    user, error = _authorize(request, "db:raw:view")
+    if error:
+        return error
+
+    file_rows = []
+    for item in profiler.list_profiles(PROFILE_DIR):
+        file_rows.append(
+            "<tr>"
+            f"<td><a href='/admin/profiler/files/{quote(item['name'])}'>{esc(item['name'])}</a></td>"
+            f"<td>{esc(datetime.fromtimestamp(item['modified']).strftime('%Y-%m-%d %H:%M:%S'))}</td>"
+            f"<td>{item['size']:,}</td>"
+            "</tr>"
+        )
+    running = profiler.is_running()
+    flash_message, flash_level = _flash_from_request(request)
+    body = (
+        page_header(
+            "CPU Profiler",
+            "CPU 프로파일",
+            "필요할 때만 켜는 샘플링 프로파일러입니다. 결과는 collapsed stack 형식이며 speedscope.app 에 그대로 열 수 있습니다.",
+            actions="<a class='btn secondary' href='/admin/sql'>SQL 통계</a><a class='btn secondary' href='/admin/memory'>메모리</a><a class='btn secondary' href='/admin/database'>DB 관리</a>",
+        )
+        + "<div class='layout-2'>"
+        + "<div class='stack'>"
+        + "<section class='panel'><h2>구간 프로파일</h2>"
+        + (
+            "<div class='muted'>프로파일이 진행 중입니다. 완료되면 아래 목록에 추가됩니다.</div>"
+            if running
+            else "<form class='inline-form' method='post' action='/admin/profiler/start'>"
+            f"<input name='seconds' type='number' min='1' max='{profiler.PROFILE_MAX_WINDOW_SECONDS}' value='30'>"
+            "<button class='btn primary' type='submit'>시작</button></form>"
+        )
+        + "</section>"
+        + info_box(
+            "단일 요청 프로파일",
+            "관리자 세션으로 주소 뒤에 <code>?__profile=1</code> 을 붙이거나 <code>X-Ops-Profile: 1</code> 헤더를 보내면 해당 요청만 기록합니다. "
+            "응답의 X-Ops-Profile 헤더에 파일 이름이 표시됩니다.",
+        )
+        + "</div>"
+        + "<section class='panel'><h2>저장된 프로파일</h2>"
+        + (
+            "<table><thead><tr><th>파일</th><th>생성 시각</th><th>크기(byte)</th></tr></thead>"
+            f"<tbody>{''.join(file_rows)}</tbody></table>"
+            if file_rows
+            else empty_state("저장된 프로파일이 없습니다.")
+        )
+        + "</section></div>"
+    )
+    return HTMLResponse(layout(title="CPU 프로파일", body=body, user=user, flash_message=flash_message, flash_level=flash_level))
+
+
+@admin_routes.post("/admin/profiler/start")
+def profiler_start(request: Request, seconds: str = Form("30")):
+    user, error = _authorize(request, "db:raw:view")
+    if error:
+        return error
+    if not profiler.start_window(PROFILE_DIR, _parse_int(seconds, 30)):
+        return _with_flash("/admin/profiler", "이미 다른 프로파일이 진행 중입니다.", "warn")
+    return _with_flash("/admin/profiler", "구간 프로파일을 시작했습니다.", "ok")
+
+
+@admin_routes.get("/admin/profiler/files/{name}")
+def profiler_download(request: Request, name: str):
+    user, error = _authorize(request, "db:raw:view")
+    if error:
+        return error
+    path = profiler.profile_path(PROFILE_DIR, name)
+    if path is None:
+        return _with_flash("/admin/profiler", "프로파일 파일을 찾을 수 없습니다.", "error")
+    return Response(
+        content=path.read_bytes(),
+        media_type="text/plain; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{path.name}"'},
+    )
+
+
+def _format_mb(value: int) -> str:
+    return f"{value / 1048576:,.1f}"
+
+
+@admin_routes.get("/admin/memory", response_class=HTMLResponse)
+def memory_page(request: Request):
+    user, error = _authorize(request, "db:raw:view")
+    if error:
+        return error
+
+    budget_mb = memory.MEMORY_BUDGET_MB
+    route_rows = []
+    for item in memory.route_stats()[:SQL_STATS_TOP_N]:
+        over = max(item["max_growth"], item["max_traced_peak"]) >= budget_mb * 1048576 > 0
+        route_rows.append(
+            "<tr>"
+            f"<td><code>{esc(item['route'])}</code></td>"
+            f"<td>{item['requests']:,}</td>"
+            f"<td>{_format_mb(item['max_rss'])}</td>"
+            f"<td>{status_badge('초과') if over else ''}{_format_mb(item['max_growth'])}</td>"
+            f"<td>{_format_mb(item['max_traced_peak']) if item['max_traced_peak'] else '-'}</td>"
+            "</tr>"
+        )
+    budget_rows = []
+    for item in memory.over_budget():
+        report = (
+            f"<a href='/admin/memory/files/{quote(item['report'])}'>{esc(item['report'])}</a>" if item["report"] else "-"
+        )
+        budget_rows.append(
+            "<tr>"
+            f"<td>{esc(item['at'])}</td>"
+            f"<td><code>{esc(item['label'])}</code></td>"
+            f"<td>{_format_mb(item['rss_growth'])}</td>"
+            f"<td>{_format_mb(item['traced_peak'])}</td>"
+            f"<td>{report}</td>"
+            "</tr>"
+        )
+    file_rows = []
+    for item in memory.list_reports(MEMORY_DIR):
+        file_rows.append(
+            "<tr>"
+            f"<td><a href='/admin/memory/files/{quote(item['name'])}'>{esc(item['name'])}</a></td>"
+            f"<td>{esc(datetime.fromtimestamp(item['modified']).strftime('%Y-%m-%d %H:%M:%S'))}</td>"
+            f"<td>{item['size']:,}</td>"
+            "</tr>"
+        )
+    flash_message, flash_level = _flash_from_request(request)
+    body = (
+        page_header(
+            "Memory",
+            "메모리 사용량",
+            f"경로별 RSS 증가량을 항상 집계하고, 증가량이나 tracemalloc 최대치가 {budget_mb:g}MB 를 넘으면 memory_budget.log 에 기록합니다.",
+            actions="<a class='btn secondary' href='/admin/profiler'>CPU 프로파일</a><a class='btn secondary' href='/admin/database'>DB 관리</a>",
+        )
+        + "<section class='metrics'>"
+        + metric_card("현재 RSS(MB)", _format_mb(memory.current_rss()), "서버 프로세스 상주 메모리")
+        + metric_card("최대 RSS(MB)", _format_mb(memory.peak_rss()), "프로세스 시작 이후 최대치")
+        + metric_card("예산(MB)", f"{budget_mb:g}", "OPS_MEMORY_BUDGET_MB")
+        + "</section>"
+        + "<div class='layout-2'>"
+        + "<div class='stack'>"
+        + "<section class='panel'><h2>작업 추적</h2>"
+        + f"<div class='muted'>PDF 가져오기·내보내기 작업의 tracemalloc 추적이 {'켜져' if memory.job_tracing else '꺼져'} 있습니다.</div>"
+        + "<form class='inline-form' method='post' action='/admin/memory/jobs'>"
+        + f"<input type='hidden' name='enabled' value='{'0' if memory.job_tracing else '1'}'>"
+        + f"<button class='btn {'secondary' if memory.job_tracing else 'primary'}' type='submit'>{'끄기' if memory.job_tracing else '켜기'}</button></form>"
+        + "</section>"
+        + info_box(
+            "단일 요청 추적",
+            "관리자 세션으로 주소 뒤에 <code>?__memory=1</code> 을 붙이거나 <code>X-Ops-Memory: 1</code> 헤더를 보내면 "
+            "요청 전후 스냅샷을 비교해 할당 위치 상위 목록을 저장합니다. 응답의 X-Ops-Memory 헤더에 파일 이름이 표시됩니다.",
+        )
+        + "</div>"
+        + "<section class='panel'><h2>저장된 보고서</h2>"
+        + (
+            "<table><thead><tr><th>파일</th><th>생성 시각</th><th>크기(byte)</th></tr></thead>"
+            f"<tbody>{''.join(file_rows)}</tbody></table>"
+            if file_rows
+            else empty_state("저장된 메모리 보고서가 없습니다.")
+        )
+        + "</section></div>"
+        + "<section class='panel'><h2>경로별 메모리</h2>"
+        + (
+            "<table><thead><tr><th>경로</th><th>요청 수</th><th>최대 RSS(MB)</th><th>최대 증가(MB)</th><th>tracemalloc 최대(MB)</th></tr></thead>"
+            f"<tbody>{''.join(route_rows)}</tbody></table>"
+            if route_rows
+            else empty_state("아직 집계된 요청이 없습니다.")
+        )
+        + "</section>"
+        + "<section class='panel'><h2>예산 초과 기록</h2>"
+        + (
+            "<table><thead><tr><th>시각</th><th>대상</th><th>RSS 증가(MB)</th><th>tracemalloc 최대(MB)</th><th>보고서</th></tr></thead>"
+            f"<tbody>{''.join(budget_rows)}</tbody></table>"
+            if budget_rows
+            else empty_state("예산을 넘은 요청이 없습니다.")
+        )
+        + "</section>"
+    )
+    return HTMLResponse(layout(title="메모리 사용량", body=body, user=user, flash_message=flash_message, flash_level=flash_level))
+
+
+@admin_routes.post("/admin/memory/jobs")
+def memory_jobs_toggle(request: Request, enabled: str = Form("0")):
+    user, error = _authorize(request, "db:raw:edit")
+    if error:
+        return error
+    memory.job_tracing = enabled == "1"
+    if memory.job_tracing:
+        return _with_flash("/admin/memory", "작업 메모리 추적을 켰습니다.", "ok")
+    return _with_flash("/admin/memory", "작업 메모리 추적을 껐습니다.", "ok")
+
+
+@admin_routes.get("/admin/memory/files/{name}")
+def memory_download(request: Request, name: str):
+    user, error = _authorize(request, "db:raw:view")
+    if error:
+        return error
+    path = memory.report_path(MEMORY_DIR, name)
+    if path is None:
+        return _with_flash("/admin/memory", "메모리 보고서를 찾을 수 없습니다.", "error")
+    return Response(
+        content=path.read_bytes(),
+        media_type="text/plain; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{path.name}"'},
+    )
+
+
+@admin_routes.get("/admin/users", response_class=HTMLResponse)
 def users_page(request: Request):
     user, error = _authorize(request, "users:manage")
     if error:
@@ -6250,7 +7291,7 @@ def users_page(request: Request):
     return HTMLResponse(layout(title="권한 관리", body=body, user=user, flash_message=flash_message, flash_level=flash_level))
 
 
-@app.post("/admin/users/save")
+@admin_routes.post("/admin/users/save")
 def users_save(
     request: Request,
     user_id: str = Form(""),
@@ -6397,7 +7438,7 @@ def users_save(
         return _with_flash("/admin/users", f"사용자 저장에 실패했습니다: {exc}", "error")
 
 
-@app.post("/admin/users/delete/{user_id}")
+@admin_routes.post("/admin/users/delete/{user_id}")
 def users_delete(request: Request, user_id: int):
     current_user, error = _authorize(request, "users:manage")
     if error:
@@ -6424,15 +7465,156 @@ def users_delete(request: Request, user_id: int):
         return _with_flash(f"/admin/users?edit={user_id}", f"사용자 삭제에 실패했습니다: {exc}", "error")
 
 
+API_RESOURCES = {
+    "complaints": {
+        "permission": "complaints:view",
+        "rows_cursor": _complaint_rows_cursor,
+        "table": "complaints",
+        "computed": COMPLAINT_LIST_COLUMNS,
+        "filters": ("q", "status", "channel", "priority", "site_name", "building_label"),
+        "default_fields": (
+            "id", "complaint_code", "title", "status", "priority", "channel", "unit_label",
+            "facility_name", "assignee_name", "response_due_at", "updated_at",
+        ),
+    },
+    "work_orders": {
+        "permission": "work_orders:view",
+        "rows_cursor": _work_order_rows_cursor,
+        "table": "work_orders",
+        "computed": WORK_ORDER_LIST_COLUMNS,
+        "filters": ("q", "status", "priority"),
+        "default_fields": (
+            "id", "work_code", "title", "status", "priority", "category", "facility_name",
+            "assignee_name", "complaint_code", "due_date", "updated_at",
+        ),
+    },
+    "inventory": {
+        "permission": "inventory:view",
+        "rows_cursor": _inventory_rows_cursor,
+        "table": "inventory_items",
+        "computed": {},
+        "filters": ("q", "status", "category", "low_only"),
+        "default_fields": ("id", "item_code", "name", "category", "quantity", "min_quantity", "unit", "location", "status", "updated_at"),
+    },
+    "facilities": {
+        "permission": "facilities:view",
+        "rows_cursor": _facility_rows_cursor,
+        "table": "facilities",
+        "computed": FACILITY_LIST_COLUMNS,
+        "filters": ("q", "status"),
+        "default_fields": ("id", "facility_code", "name", "category", "building", "floor", "zone", "status", "manager_name", "updated_at"),
+    },
+}
+
+
+def _encode_api_cursor(updated_at: str, row_id: int) -> str:
+    raw = json.dumps([updated_at, row_id], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_api_cursor(token: str) -> tuple[str, int] | None:
+    try:
+        updated_at, row_id = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        return str(updated_at), int(row_id)
+    except (ValueError, TypeError):
+        return None
+
+
+def _api_error(status_code: int, detail: str) -> JSONResponse:
+    return JSONResponse(status_code=status_code, content={"ok": False, "detail": detail})
+
+
+@app.get("/api/v1/{resource}")
+def api_v1_list(request: Request, resource: str):
+    source = API_RESOURCES.get(resource)
+    if not source:
+        return _api_error(404, "지원하지 않는 API 리소스입니다.")
+    user, error = _authorize_api(request, source["permission"])
+    if error:
+        return error
+
+    params = request.query_params
+    after = None
+    if params.get("cursor"):
+        after = _decode_api_cursor(params["cursor"])
+        if after is None:
+            return _api_error(400, "cursor 값이 올바르지 않습니다.")
+    limit = min(max(_parse_int(params.get("limit", ""), API_PAGE_LIMIT), 1), API_MAX_PAGE_LIMIT)
+    encoding = params.get("format", "objects")
+    if encoding not in {"objects", "columns"}:
+        return _api_error(400, "format은 objects 또는 columns만 지원합니다.")
+
+    etag = _page_etag(request, user, f"api_{resource}")
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+
+    filters = []
+    for name in source["filters"]:
+        value = params.get(name, "").strip()
+        filters.append(value == "1" if name == "low_only" else value)
+
+    conn = get_conn()
+    available = [column["name"] for column in conn.execute(f"PRAGMA table_info({source['table']})").fetchall()]
+    available.extend(source["computed"])
+    requested = [field.strip() for field in params.get("fields", "").split(",") if field.strip()]
+    unknown = [field for field in requested if field not in available]
+    if unknown:
+        conn.close()
+        return _api_error(400, f"알 수 없는 필드입니다: {', '.join(unknown)}")
+    fields = list(dict.fromkeys(requested or [field for field in source["default_fields"] if field in available]))
+    selected = list(dict.fromkeys([*fields, "id", "updated_at"]))
+    rows = source["rows_cursor"](conn, *filters, after=after, limit=limit + 1, fields=selected).fetchall()
+    conn.close()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_api_cursor(rows[-1]["updated_at"], rows[-1]["id"])
+    payload = {"ok": True, "resource": resource, "next_cursor": next_cursor}
+    if encoding == "columns":
+        payload["columns"] = fields
+        payload["rows"] = [[row[field] for field in fields] for row in rows]
+    else:
+        payload["items"] = [{field: row[field] for field in fields} for row in rows]
+    return JSONResponse(payload, headers=_etag_headers(etag))
+
+
+def _metrics_authorized(request: Request) -> bool:
+    if METRICS_PUBLIC:
+        return True
+    authorization = request.headers.get("authorization", "").encode("utf-8")
+    if METRICS_TOKEN and secrets.compare_digest(authorization, f"Bearer {METRICS_TOKEN}".encode("utf-8")):
+        return True
+    user = auth.get_user_by_session(request.cookies.get(auth.SESSION_COOKIE))
+    return bool(user and auth.has_permission(user["role"], "db:raw:view"))
+
+
+@app.get("/metrics")
+async def metrics_endpoint(request: Request):
+    if not await run_in_threadpool(_metrics_authorized, request):
+        return Response(status_code=401, content="unauthorized\n", media_type="text/plain")
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    body = metrics.render_metrics(
+        db_path=ops_db.DB_PATH,
+        threadpool=(int(limiter.borrowed_tokens), int(limiter.total_tokens)),
+        rss_bytes=memory.current_rss(),
+    )
+    return Response(content=body, media_type="text/plain; version=0.0.4; charset=utf-8", headers={"Cache-Control": "no-store"})
+
+
 @app.get("/healthz")
 def healthz():
     try:
         conn = get_conn()
-        conn.execute("SELECT 1").fetchone()
+        schema_version = ops_db.schema_version(conn)
         conn.close()
     except Exception as exc:
         return JSONResponse(
             status_code=503,
             content={"ok": False, "service": "facility-operations", "db": "error", "detail": str(exc)},
         )
-    return {"ok": True, "service": "facility-operations", "db": "ok"}
+    return {"ok": True, "service": "facility-operations", "db": "ok", "schema_version": schema_version}
+
+
+if not lazy_routes.LAZY_ROUTES_ENABLED:
+    lazy_routes.load_all(app.router.routes)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import shutil
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from scripts.benchmark_routes import _git_commit
+
+DEFAULT_SIZES = "100,1000,5000"
+STAGES = ("extract", "parse", "dry_run", "apply")
+
+
+def _timed(callback):
+    started = time.perf_counter()
+    result = callback()
+    return result, time.perf_counter() - started
+
+
+def _stage_stats(seconds: list[float], rows: int, pages: int) -> dict:
+    best = min(seconds)
+    return {
+        "best_seconds": round(best, 4),
+        "mean_seconds": round(sum(seconds) / len(seconds), 4),
+        "rows_per_second": round(rows / best, 1) if best else 0.0,
+        "pages_per_second": round(pages / best, 1) if best else 0.0,
+    }
+
+
+def _run_size(size: int, *, repeat: int, seed: int, work_dir: Path) -> dict:
+    from ops import db as ops_db, pdf_import
+    from scripts.synthetic_report_pdf import build_report_pdf
+
+    (data, pages), generate_seconds = _timed(lambda: build_report_pdf(size, seed=seed))
+    fingerprint = hashlib.sha1(data).hexdigest()
+    timings: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    parsed_rows = 0
+    summary: dict = {}
+    for attempt in range(repeat):
+        page_lines, elapsed = _timed(lambda: pdf_import.extract_pdf_pages(data))
+        timings["extract"].append(elapsed)
+        report, elapsed = _timed(
+            lambda: pdf_import.parse_complaints_pdf_pages(page_lines, source_name="synthetic.pdf", source_fingerprint=fingerprint)
+        )
+        timings["parse"].append(elapsed)
+        parsed_rows = len(report.complaints)
+
+        ops_db.DB_PATH = work_dir / f"import-{size}-{attempt}.db"
+        ops_db.init_db()
+        conn = ops_db.get_conn()
+        try:
+            _, elapsed = _timed(lambda: pdf_import.import_parsed_complaint_report(conn, report, dry_run=True))
+            conn.rollback()
+            timings["dry_run"].append(elapsed)
+
+            def apply() -> dict:
+                result = pdf_import.import_parsed_complaint_report(conn, report, dry_run=False)
+                conn.commit()
+                return result
+
+            summary, elapsed = _timed(apply)
+            timings["apply"].append(elapsed)
+        finally:
+            conn.close()
+    stages = {stage: _stage_stats(timings[stage], parsed_rows, pages) for stage in STAGES}
+    return {
+        "complaints": size,
+        "parsed_rows": parsed_rows,
+        "pages": pages,
+        "pdf_bytes": len(data),
+        "generate_seconds": round(generate_seconds, 3),
+        "inserted": summary.get("counts", {}).get("complaints_inserted", 0),
+        "warnings": len(report.warnings),
+        "stages": stages,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="세대 민원 PDF 이관 단계별 처리량 벤치마크")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="쉼표로 구분한 보고서 민원 수")
+    parser.add_argument("--repeat", type=int, default=3, help="크기별 반복 횟수 (최솟값 기준으로 처리량 계산)")
+    parser.add_argument("--seed", type=int, default=7, help="합성 보고서 난수 시드")
+    parser.add_argument("--output", default="", help="결과 JSON 경로 (기본: bench_results/pdf-import-<시각>.json)")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    work_dir = ROOT_DIR / f"tmp_ops_pdf_bench_{uuid.uuid4().hex[:8]}"
+    work_dir.mkdir(parents=True, exist_ok=True)
+    os.environ["OPS_DB_PATH"] = str(work_dir / "operations.db")
+    os.environ.pop("LEGACY_DB_PATH", None)
+    report = {
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "sizes": {},
+    }
+    try:
+        for size in [int(value) for value in args.sizes.split(",") if value.strip()]:
+            result = _run_size(size, repeat=max(args.repeat, 1), seed=args.seed, work_dir=work_dir)
+            report["sizes"][str(size)] = result
+            print(
+                f"[{size:,}건] {result['pages']:,}페이지 / {result['pdf_bytes']:,} B / 해석 {result['parsed_rows']:,}건"
+                f" / 경고 {result['warnings']}건"
+            )
+            for stage, stats in result["stages"].items():
+                print(
+                    f"  {stage:<8} {stats['best_seconds']:>9.3f}s  {stats['rows_per_second']:>10,.1f} rows/s"
+                    f"  {stats['pages_per_second']:>9,.1f} pages/s"
+                )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    output = Path(args.output) if args.output else ROOT_DIR / "bench_results" / f"pdf-import-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\n결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
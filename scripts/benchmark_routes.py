@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+DEFAULT_SCALES = "1000,10000,100000"
+BENCH_ROUTES = [
+    ("/", 1.0, 0),
+    ("/complaints", 1.0, 0),
+    ("/complaints?status=처리중", 1.0, 0),
+    ("/work-orders", 1.0, 0),
+    ("/reports", 1.0, 0),
+    ("/inventory", 1.0, 0),
+    ("/complaints/pdf", 0.2, 10000),
+]
+SERVER_TIMING_DB = re.compile(r"db;dur=([0-9.]+)")
+
+
+def _percentile(values: list[float], ratio: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(ratio * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def _summarize(latencies: list[float], queries: list[float], db_ms: list[float], sizes: list[int]) -> dict:
+    return {
+        "samples": len(latencies),
+        "p50_ms": round(_percentile(latencies, 0.50), 2),
+        "p95_ms": round(_percentile(latencies, 0.95), 2),
+        "p99_ms": round(_percentile(latencies, 0.99), 2),
+        "mean_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+        "queries_per_request": round(sum(queries) / len(queries), 1) if queries else 0.0,
+        "db_p50_ms": round(_percentile(db_ms, 0.50), 2),
+        "response_bytes": max(sizes) if sizes else 0,
+    }
+
+
+def _run_scale(scale: int, *, iterations: int, warmup: int, seed: int) -> dict:
+    tmp_path = ROOT_DIR / f"tmp_ops_bench_{scale}_{uuid.uuid4().hex[:8]}"
+    tmp_path.mkdir(parents=True, exist_ok=True)
+    client = None
+    try:
+        os.environ["OPS_DB_PATH"] = str(tmp_path / "operations.db")
+        os.environ["OPS_UPLOAD_DIR"] = str(tmp_path / "uploads")
+        os.environ.pop("LEGACY_DB_PATH", None)
+
+        from ops.db import get_conn, init_db
+        from scripts.synthetic_data import generate
+
+        init_db()
+        started = time.perf_counter()
+        conn = get_conn()
+        try:
+            dataset = generate(conn, scale, seed=seed)
+        finally:
+            conn.close()
+        generate_seconds = time.perf_counter() - started
+
+        from fastapi.testclient import TestClient
+
+        import ops_main
+        from ops import auth, metrics
+
+        client = TestClient(ops_main.app)
+        login = client.post(
+            "/login",
+            data={"username": auth.DEFAULT_ADMIN_USERNAME, "password": auth.DEFAULT_ADMIN_PASSWORD},
+            follow_redirects=False,
+        )
+        if login.status_code not in {302, 303}:
+            raise SystemExit("벤치마크용 관리자 로그인에 실패했습니다.")
+
+        routes = {}
+        for path, weight, max_scale in BENCH_ROUTES:
+            if max_scale and scale > max_scale:
+                continue
+            count = max(1, round(iterations * weight))
+            for _ in range(max(1, round(warmup * weight))):
+                client.get(path)
+            latencies: list[float] = []
+            queries: list[float] = []
+            db_ms: list[float] = []
+            sizes: list[int] = []
+            for _ in range(count):
+                queries_before = metrics.SQLITE_QUERIES.value()
+                request_started = time.perf_counter()
+                response = client.get(path)
+                latencies.append((time.perf_counter() - request_started) * 1000)
+                if response.status_code != 200:
+                    raise SystemExit(f"{path} 응답이 {response.status_code} 입니다.")
+                queries.append(metrics.SQLITE_QUERIES.value() - queries_before)
+                match = SERVER_TIMING_DB.search(response.headers.get("server-timing", ""))
+                if match:
+                    db_ms.append(float(match.group(1)))
+                sizes.append(len(response.content))
+            routes[path] = _summarize(latencies, queries, db_ms, sizes)
+        return {"dataset": dataset, "generate_seconds": round(generate_seconds, 2), "routes": routes}
+    finally:
+        if client is not None:
+            client.close()
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+def _git_commit() -> str:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+    return result.stdout.strip()
+
+
+def _compare(baseline: dict, current: dict, max_regression: float) -> list[str]:
+    regressions = []
+    print(f"\n기준 {baseline.get('commit') or '-'} 대비 p95 변화")
+    for scale, scale_result in current["scales"].items():
+        base_routes = baseline.get("scales", {}).get(scale, {}).get("routes", {})
+        for path, stats in scale_result["routes"].items():
+            base = base_routes.get(path)
+            if not base or not base.get("p95_ms"):
+                continue
+            change = (stats["p95_ms"] - base["p95_ms"]) / base["p95_ms"] * 100
+            marker = " !!" if change > max_regression else ""
+            print(
+                f"  {scale:>7} {path:<28} {base['p95_ms']:>9.2f} -> {stats['p95_ms']:>9.2f} ms ({change:+.1f}%)"
+                f"  queries {base['queries_per_request']} -> {stats['queries_per_request']}{marker}"
+            )
+            if marker:
+                regressions.append(f"{scale} {path}")
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="시설 운영 시스템 주요 화면 응답 시간 벤치마크")
+    parser.add_argument("--scales", default=DEFAULT_SCALES, help="쉼표로 구분한 민원 데이터 규모")
+    parser.add_argument("--iterations", type=int, default=30, help="경로별 측정 횟수")
+    parser.add_argument("--warmup", type=int, default=3, help="경로별 예열 요청 수")
+    parser.add_argument("--seed", type=int, default=7, help="합성 데이터 난수 시드")
+    parser.add_argument("--output", default="", help="결과 JSON 경로 (기본: bench_results/routes-<시각>.json)")
+    parser.add_argument("--baseline", default="", help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-regression", type=float, default=20.0, help="p95 허용 증가율(%%), 넘으면 종료 코드 1")
+    parser.add_argument("--child-scale", type=int, default=0, help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.child_scale:
+        result = _run_scale(args.child_scale, iterations=args.iterations, warmup=args.warmup, seed=args.seed)
+        print(json.dumps(result, ensure_ascii=False))
+        return
+
+    scales = [int(value) for value in args.scales.split(",") if value.strip()]
+    report = {
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": args.iterations,
+        "seed": args.seed,
+        "scales": {},
+    }
+    for scale in scales:
+        print(f"[{scale:,}건] 데이터 생성 및 측정 중...", flush=True)
+        completed = subprocess.run(
+            [
+                sys.executable,
+                str(Path(__file__).resolve()),
+                "--child-scale",
+                str(scale),
+                "--iterations",
+                str(args.iterations),
+                "--warmup",
+                str(args.warmup),
+                "--seed",
+                str(args.seed),
+            ],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+        )
+        if completed.returncode != 0:
+            sys.stderr.write(completed.stderr)
+            raise SystemExit(f"{scale:,}건 벤치마크가 실패했습니다.")
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        report["scales"][str(scale)] = result
+        print(f"  생성 {result['generate_seconds']}s / {', '.join(f'{k} {v:,}' for k, v in result['dataset'].items())}")
+        for path, stats in result["routes"].items():
+            print(
+                f"  {path:<28} p50 {stats['p50_ms']:>8.2f}  p95 {stats['p95_ms']:>8.2f}  p99 {stats['p99_ms']:>8.2f} ms"
+                f"  queries {stats['queries_per_request']:>6}  {stats['response_bytes']:,} B"
+            )
+
+    output = Path(args.output) if args.output else ROOT_DIR / "bench_results" / f"routes-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\n결과 저장: {output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = _compare(baseline, report, args.max_regression)
+        if regressions:
+            raise SystemExit(f"p95 가 {args.max_regression:g}% 넘게 늘어난 경로: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from scripts.benchmark_routes import _git_commit
+from scripts.soak_test import _free_port
+
+MODES = {"eager": "0", "lazy": "1"}
+DEFAULT_PATHS = "/healthz,/login,/complaints"
+POLL_SECONDS = 0.01
+START_TIMEOUT = 60.0
+IMPORT_PROBE = (
+    "import json, time\n"
+    "started = time.perf_counter()\n"
+    "import fastapi\n"
+    "framework = time.perf_counter()\n"
+    "import ops_main\n"
+    "finished = time.perf_counter()\n"
+    "print(json.dumps({'fastapi_ms': (framework - started) * 1000, 'ops_main_ms': (finished - framework) * 1000}))\n"
+)
+
+
+def _median(values: list[float]) -> float:
+    return round(statistics.median(values), 1) if values else 0.0
+
+
+def _measure_import(env: dict[str, str]) -> dict[str, float]:
+    completed = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE], cwd=ROOT_DIR, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _measure_spin_up(env: dict[str, str], paths: list[str], log_path: Path) -> dict[str, float]:
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    with log_path.open("ab") as log_handle:
+        started = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "ops_main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+            cwd=ROOT_DIR,
+            env=env,
+            stdout=log_handle,
+            stderr=subprocess.STDOUT,
+        )
+        try:
+            result = {}
+            with httpx.Client(base_url=base_url, follow_redirects=False, timeout=10) as client:
+                while "first_response_ms" not in result:
+                    if process.poll() is not None:
+                        raise SystemExit(f"서버가 시작되지 않았습니다. 로그: {log_path}")
+                    if time.perf_counter() - started > START_TIMEOUT:
+                        raise SystemExit("서버 준비 대기 시간이 초과되었습니다.")
+                    try:
+                        client.get(paths[0])
+                    except httpx.HTTPError:
+                        time.sleep(POLL_SECONDS)
+                        continue
+                    result["first_response_ms"] = (time.perf_counter() - started) * 1000
+                for path in paths[1:]:
+                    request_started = time.perf_counter()
+                    client.get(path)
+                    result[f"first {path} ms"] = (time.perf_counter() - request_started) * 1000
+            return result
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="콜드 스타트(임포트 및 첫 응답) 시간 벤치마크: 지연 라우트 그룹 켬/끔 비교")
+    parser.add_argument("--runs", type=int, default=5, help="모드별 반복 횟수")
+    parser.add_argument("--paths", default=DEFAULT_PATHS, help="첫 응답을 잴 경로 목록 (첫 경로가 기동 확인용)")
+    parser.add_argument("--output", default="", help="결과 JSON 경로 (기본: bench_results/startup-<시각>.json)")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    paths = [path.strip() for path in args.paths.split(",") if path.strip()]
+    tmp_path = ROOT_DIR / f"tmp_ops_startup_{uuid.uuid4().hex[:8]}"
+    tmp_path.mkdir(parents=True, exist_ok=True)
+    samples: dict[str, list[dict[str, float]]] = {mode: [] for mode in MODES}
+    try:
+        os.environ["OPS_DB_PATH"] = str(tmp_path / "operations.db")
+        os.environ["OPS_UPLOAD_DIR"] = str(tmp_path / "uploads")
+        os.environ.pop("LEGACY_DB_PATH", None)
+
+        from ops import bootstrap
+
+        bootstrap.run()
+        base_env = {**os.environ, bootstrap.BOOTSTRAP_DONE_ENV: "1", "OPS_WORKERS": "1"}
+        for run in range(args.runs):
+            for mode, flag in MODES.items():
+                env = {**base_env, "OPS_LAZY_ROUTES": flag}
+                sample = _measure_import(env)
+                sample.update(_measure_spin_up(env, paths, tmp_path / "server.log"))
+                samples[mode].append(sample)
+            print(f"[{run + 1}/{args.runs}] " + "  ".join(f"{mode} 첫 응답 {samples[mode][-1]['first_response_ms']:.0f}ms" for mode in MODES), flush=True)
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+    summary = {mode: {key: _median([sample[key] for sample in items]) for key in items[0]} for mode, items in samples.items()}
+    report = {
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": args.runs,
+        "paths": paths,
+        "median": summary,
+        "samples": samples,
+    }
+    print(f"\n{'항목':<28}{'eager':>10}{'lazy':>10}{'차이':>10}")
+    for key in summary["eager"]:
+        eager, lazy = summary["eager"][key], summary["lazy"][key]
+        print(f"{key:<28}{eager:>10.1f}{lazy:>10.1f}{lazy - eager:>+10.1f}")
+
+    output = Path(args.output) if args.output else ROOT_DIR / "bench_results" / f"startup-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -30,9 +30,19 @@ Write-Host "실행 파일 빌드"
     --console `
     --name $appName `
     --hidden-import ops_main `
+    --hidden-import ops.assets `
     --hidden-import ops.auth `
+    --hidden-import ops.bootstrap `
     --hidden-import ops.db `
+    --hidden-import ops.events `
+    --hidden-import ops.lazy_routes `
+    --hidden-import ops.memory `
+    --hidden-import ops.metrics `
+    --hidden-import ops.profiler `
+    --hidden-import ops.table_stats `
     --hidden-import ops.ui `
+    --hidden-import ops.workers `
+    --hidden-import ops.writer `
     --hidden-import uvicorn.logging `
     --hidden-import uvicorn.loops.auto `
     --hidden-import uvicorn.protocols.http.auto `
@@ -40,6 +50,7 @@ Write-Host "실행 파일 빌드"
     --hidden-import uvicorn.lifespan.on `
     --hidden-import fastapi `
     --hidden-import python_multipart `
+    --add-data "ops\static;ops\static" `
     ops_launcher.py | Out-Host
 
 $runtimeDataDir = Join-Path $targetDir "runtime_data"
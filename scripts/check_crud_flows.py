@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import os
 import shutil
+import sqlite3
 import sys
+import time
 import uuid
 from pathlib import Path
 
@@ -51,7 +53,8 @@ def main() -> None:
         os.environ.pop("OPS_ADMIN_NAME", None)
 
         import ops_main
-        from ops.db import get_conn
+        from ops import events, table_stats
+        from ops.db import entity_code, get_conn
 
         client = TestClient(ops_main.app)
 
@@ -96,6 +99,7 @@ def main() -> None:
         facility_row = fetchone("SELECT * FROM facilities WHERE name = ?", (facility_name,))
         expect(facility_row is not None, "시설이 생성되지 않았습니다.")
         facility_id = facility_row["id"]
+        expect(facility_row["facility_code"] == entity_code("FAC", facility_id), "시설 코드가 등록 시점에 ID로 발급되지 않았습니다.")
         facility_attachment_count = fetchone(
             "SELECT COUNT(*) AS count FROM attachments WHERE entity_type = 'facility' AND entity_id = ?",
             (facility_id,),
@@ -109,6 +113,20 @@ def main() -> None:
             and "선택 첨부 삭제" in facility_page.text,
             "시설 수정 화면의 삭제 버튼 구조가 올바르지 않습니다.",
         )
+        expect(
+            f"data-attachment-id='{facility_id}'" in facility_page.text and "class='thumb'" not in facility_page.text.split("시설 목록", 1)[-1],
+            "시설 목록 첨부는 지연 로딩 자리표시로 렌더링되어야 합니다.",
+        )
+        facility_attachment_batch = client.get(f"/attachments/batch?entity_type=facility&ids={facility_id},0,abc")
+        expect(
+            facility_attachment_batch.status_code == 200
+            and facility_attachment_batch.json()["items"].get(str(facility_id), "").count("class='thumb'") == 6,
+            "첨부 일괄 조회 API 응답이 올바르지 않습니다.",
+        )
+        expect(
+            client.get(f"/attachments/batch?entity_type=users&ids={facility_id}").status_code == 400,
+            "지원하지 않는 첨부 대상은 거부되어야 합니다.",
+        )
 
         facility_update = client.post(
             "/facilities/save",
@@ -402,6 +420,12 @@ def main() -> None:
 
         complaint_page = client.get(f"/complaints?edit={complaint_id}")
         expect(complaint_page.status_code == 200 and "formaction='/complaints/delete/" in complaint_page.text, "민원 수정 화면의 삭제 버튼 구조가 올바르지 않습니다.")
+        expect(
+            complaint_row["complaint_code"] in complaint_page.text
+            and complaint_page.text.rstrip().endswith("</html>")
+            and complaint_page.text.count("</tbody></table></section></div>") >= 1,
+            "스트리밍 민원 목록 응답이 완전한 문서로 끝나지 않았습니다.",
+        )
 
         complaint_update = client.post(
             "/complaints/save",
@@ -640,6 +664,54 @@ def main() -> None:
 
         work_page = client.get(f"/work-orders?edit={work_id}")
         expect(work_page.status_code == 200 and "formaction='/work-orders/delete/" in work_page.text, "작업지시 수정 화면의 삭제 버튼 구조가 올바르지 않습니다.")
+        expect(
+            f"name='complaint_id' value='{complaint_id}'" in work_page.text and "<select name='complaint_id'>" not in work_page.text,
+            "작업지시 화면의 연결 민원은 검색형 입력으로 렌더링되어야 합니다.",
+        )
+        complaint_lookup = client.get("/api/lookup/complaints", params={"q": complaint_row["complaint_code"]})
+        expect(
+            complaint_lookup.status_code == 200
+            and any(item["value"] == str(complaint_id) for item in complaint_lookup.json()["items"]),
+            "민원 코드 검색 API가 대상 민원을 찾지 못했습니다.",
+        )
+        facility_lookup = client.get("/api/lookup/facilities", params={"q": "검증시설", "limit": "5"})
+        expect(
+            facility_lookup.status_code == 200
+            and any(item["value"] == str(facility_id) for item in facility_lookup.json()["items"]),
+            "시설 이름 검색 API가 대상 시설을 찾지 못했습니다.",
+        )
+        expect(client.get("/api/lookup/users").status_code == 404, "지원하지 않는 검색 대상은 거부되어야 합니다.")
+        api_first = client.get("/api/v1/complaints", params={"fields": "id,complaint_code,status", "limit": "1"})
+        api_first_payload = api_first.json()
+        expect(
+            api_first.status_code == 200
+            and len(api_first_payload["items"]) == 1
+            and set(api_first_payload["items"][0]) == {"id", "complaint_code", "status"}
+            and api_first_payload["next_cursor"],
+            "민원 JSON API의 필드 선택/페이지 응답이 올바르지 않습니다.",
+        )
+        api_second = client.get(
+            "/api/v1/complaints",
+            params={"fields": "id", "limit": "1", "cursor": api_first_payload["next_cursor"], "format": "columns"},
+        ).json()
+        expect(
+            api_second["columns"] == ["id"] and api_second["rows"] and api_second["rows"][0][0] != api_first_payload["items"][0]["id"],
+            "민원 JSON API의 keyset 다음 페이지가 올바르지 않습니다.",
+        )
+        narrow_conn = get_conn()
+        try:
+            narrow_columns = [
+                column[0]
+                for column in ops_main._complaint_rows_cursor(narrow_conn, limit=1, fields=["id", "complaint_code", "updated_at"]).description
+            ]
+        finally:
+            narrow_conn.close()
+        expect(narrow_columns == ["id", "complaint_code", "updated_at"], "JSON API 필드 선택이 SELECT 목록을 좁히지 않습니다.")
+        expect(
+            client.get("/api/v1/complaints", params={"fields": "password_hash"}).status_code == 400
+            and client.get("/api/v1/users").status_code == 404,
+            "JSON API가 알 수 없는 필드/리소스를 거부하지 않습니다.",
+        )
 
         work_update = client.post(
             "/work-orders/save",
@@ -697,6 +769,25 @@ def main() -> None:
         expect(work_row["status"] == "완료", "작업지시 상태 업데이트가 반영되지 않았습니다.")
         work_update_count = fetchone("SELECT COUNT(*) AS count FROM work_order_updates WHERE work_order_id = ?", (work_id,))["count"]
         expect(work_update_count >= 3, "작업지시 이력이 충분히 생성되지 않았습니다.")
+        def live_changes_seen() -> bool:
+            live_changes = [event["data"] for event in events.BROADCASTER.recent() if event["event"] == "change"]
+            return any(
+                change["kind"] == "work_order" and change["id"] == work_id and change["status"] == "완료" for change in live_changes
+            ) and any(change["kind"] == "inventory" and change["id"] == inventory_id for change in live_changes)
+
+        live_deadline = time.monotonic() + 3
+        while not live_changes_seen() and time.monotonic() < live_deadline:
+            time.sleep(0.05)
+        expect(
+            live_changes_seen()
+            and not any(event["event"] == "counters" for event in events.BROADCASTER.recent()),
+            "쓰기 경로의 실시간 변경 이벤트가 발행되지 않았거나 구독자 없이 카운터를 집계했습니다.",
+        )
+        work_list_page = client.get("/work-orders")
+        expect(
+            f"data-live-key='work_order:{work_id}'" in work_list_page.text and "data-live-feed='work_order'" in work_list_page.text,
+            "작업지시 목록에 실시간 갱신 표식이 없습니다.",
+        )
 
         user_name = f"user_{suffix}"
         user_create = client.post(
@@ -800,7 +891,39 @@ def main() -> None:
         raw_row = fetchone("SELECT * FROM inventory_items WHERE id = ?", (raw_id,))
         expect(raw_row["name"].endswith("-수정") and raw_row["quantity"] == 9, "DB관리 수정이 반영되지 않았습니다.")
 
+        sync_initial = client.get("/api/sync").json()
+        expect(
+            sync_initial.get("reset") is True
+            and any(row[0] == inventory_id for row in sync_initial["changes"]["inventory"]["rows"]),
+            "동기화 API 초기 응답에 재고 품목이 없습니다.",
+        )
+        snapshot_pages = [client.get("/api/sync", params={"limit": "1"}).json()]
+        while snapshot_pages[-1]["has_more"] and len(snapshot_pages) < 1000:
+            snapshot_pages.append(
+                client.get(
+                    "/api/sync",
+                    params={"since": snapshot_pages[-1]["cursor"], "snapshot": snapshot_pages[-1]["snapshot"], "limit": "1"},
+                ).json()
+            )
+        snapshot_inventory_ids = [
+            row[0] for page in snapshot_pages for row in page["changes"].get("inventory", {}).get("rows", [])
+        ]
+        expect(
+            len(snapshot_pages) > 1
+            and all(sum(len(change["rows"]) for change in page["changes"].values()) <= 1 for page in snapshot_pages)
+            and {page["cursor"] for page in snapshot_pages} == {sync_initial["cursor"]}
+            and not snapshot_pages[-1]["has_more"]
+            and snapshot_inventory_ids == [row[0] for row in sync_initial["changes"]["inventory"]["rows"]],
+            "동기화 API 초기 스냅샷이 limit 단위로 나뉘어 전달되지 않았습니다.",
+        )
         inventory_delete = client.post(f"/inventory/delete/{inventory_id}", follow_redirects=False)
+        sync_delta = client.get("/api/sync", params={"since": sync_initial["cursor"]}).json()
+        expect(
+            sync_delta.get("reset") is False
+            and sync_delta["cursor"] > sync_initial["cursor"]
+            and inventory_id in sync_delta["changes"]["inventory"]["deleted"],
+            "동기화 API 증분 응답에 삭제된 재고가 없습니다.",
+        )
         expect(inventory_delete.status_code in {302, 303}, "재고 삭제 요청이 실패했습니다.")
         expect(fetchone("SELECT * FROM inventory_items WHERE id = ?", (inventory_id,)) is None, "재고가 삭제되지 않았습니다.")
 
@@ -873,12 +996,72 @@ def main() -> None:
         bulk_row_a = fetchone("SELECT * FROM inventory_items WHERE name = ?", (bulk_name_a,))
         bulk_row_b = fetchone("SELECT * FROM inventory_items WHERE name = ?", (bulk_name_b,))
         expect(bulk_row_a is not None and bulk_row_b is not None, "DB관리 bulk 삭제용 행이 생성되지 않았습니다.")
+        expect(
+            bulk_row_a["id"] > raw_id and bulk_row_a["item_code"] == entity_code("INV", bulk_row_a["id"]),
+            "삭제된 ID/코드가 재사용되었거나 빈 코드가 자동 발급되지 않았습니다.",
+        )
 
         raw_page = client.get("/admin/database?table=inventory_items")
         expect(
             raw_page.status_code == 200 and "/admin/database/delete-selected" in raw_page.text and "data-db-select-all" in raw_page.text,
             "DB관리 화면에 bulk 삭제 UI가 반영되지 않았습니다.",
         )
+        filtered_page = client.get(
+            "/admin/database",
+            params={"table": "inventory_items", "fc": "name", "fo": "prefix", "fv": "bulk-item-", "limit": "1"},
+        )
+        expect(
+            filtered_page.status_code == 200
+            and f"name='row_ids' value='{bulk_row_b['id']}'" in filtered_page.text
+            and f"before={bulk_row_b['id']}" in filtered_page.text,
+            "DB관리 컬럼 필터/페이지 이동이 올바르지 않습니다.",
+        )
+        older_page = client.get(
+            "/admin/database",
+            params={"table": "inventory_items", "fc": "name", "fo": "prefix", "fv": "bulk-item-", "limit": "1", "before": str(bulk_row_b["id"])},
+        )
+        expect(
+            f"name='row_ids' value='{bulk_row_a['id']}'" in older_page.text and f"after={bulk_row_a['id']}" in older_page.text,
+            "DB관리 다음 페이지가 키셋 기준으로 이어지지 않습니다.",
+        )
+        integer_prefix = client.get(
+            "/admin/database",
+            params={"table": "inventory_items", "fc": "id", "fo": "prefix", "fv": "1"},
+            follow_redirects=False,
+        )
+        expect(
+            integer_prefix.status_code in {302, 303} and "level=error" in integer_prefix.headers.get("location", ""),
+            "DB관리 숫자 컬럼의 앞부분 일치 조건이 같음으로 바뀌어 조회되었습니다.",
+        )
+        collation_conn = sqlite3.connect(":memory:")
+        collation_conn.row_factory = sqlite3.Row
+        try:
+            collation_table = ops_main.DB_MANAGED_TABLES[0]
+            collation_conn.execute(
+                f"CREATE TABLE {collation_table} (id INTEGER PRIMARY KEY, title TEXT COLLATE NOCASE, code VARCHAR(20), amount NUMERIC)"
+            )
+            collation_conn.executemany(f"INSERT INTO {collation_table}(title, code, amount) VALUES (?, ?, ?)", [("Abc", "Abc", 1), ("abd", "abd", 2)])
+            collation_columns = ops_main._db_columns(collation_conn, collation_table)
+            range_columns = ops_main._db_text_range_columns(collation_conn, collation_table, collation_columns)
+            matched = {}
+            for name in ("title", "code"):
+                where, values = ops_main._db_filter_sql(collation_columns, [(name, "prefix", "ab")], range_columns)
+                matched[name] = collation_conn.execute(f"SELECT COUNT(*) FROM {collation_table} WHERE {' AND '.join(where)}", values).fetchone()[0]
+        finally:
+            collation_conn.close()
+        expect(
+            range_columns == {"code"} and matched == {"title": 1, "code": 1},
+            "DB관리 앞부분 일치가 BINARY 정렬 TEXT 컬럼 외에도 범위 비교로 바뀌었습니다.",
+        )
+        stats_conn = get_conn()
+        try:
+            table_stats.refresh(stats_conn, ["inventory_items"])
+            stats_conn.commit()
+            cached_stats = table_stats.read(stats_conn, ["inventory_items"])["inventory_items"]
+            actual_count = stats_conn.execute("SELECT COUNT(*) AS count FROM inventory_items").fetchone()["count"]
+        finally:
+            stats_conn.close()
+        expect(cached_stats["exact"] and cached_stats["count"] == actual_count, "DB관리 행 수 캐시가 실제 행 수와 다릅니다.")
 
         bulk_delete = client.post(
             "/admin/database/delete-selected",
@@ -891,6 +1074,14 @@ def main() -> None:
         expect(bulk_delete.status_code in {302, 303}, "DB관리 bulk 삭제 요청이 실패했습니다.")
         expect(fetchone("SELECT * FROM inventory_items WHERE id = ?", (bulk_row_a["id"],)) is None, "DB관리 bulk 삭제 첫 번째 행이 반영되지 않았습니다.")
         expect(fetchone("SELECT * FROM inventory_items WHERE id = ?", (bulk_row_b["id"],)) is None, "DB관리 bulk 삭제 두 번째 행이 반영되지 않았습니다.")
+        stats_conn = get_conn()
+        try:
+            expect(
+                not table_stats.read(stats_conn, ["inventory_items"])["inventory_items"]["exact"],
+                "행 삭제 후에도 DB관리 행 수 캐시가 정확값으로 표시됩니다.",
+            )
+        finally:
+            stats_conn.close()
 
         repeat_delete = client.post(f"/complaints/delete/{repeat_id}", follow_redirects=False)
         expect(repeat_delete.status_code in {302, 303}, "반복 민원 삭제 요청이 실패했습니다.")
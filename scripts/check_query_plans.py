@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import re
+import shutil
+import sys
+import time
+import uuid
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+
+BASELINE_PATH = Path(__file__).resolve().parent / "query_plan_baseline.json"
+SEED_COMPLAINTS = 5000
+LARGE_TABLE_ROWS = 1000
+REPORT_RANGE = ("2026-01-01", "2026-12-31")
+PLAN_STEP = re.compile(r"^(SCAN|SEARCH) (\w+)(?: USING (AUTOMATIC (?:PARTIAL )?COVERING INDEX|COVERING INDEX|INDEX|INTEGER PRIMARY KEY|PRIMARY KEY))?")
+TABLE_ALIAS = re.compile(r"\b(?:FROM|JOIN)\s+([A-Za-z_]\w*)(?:\s+(?:AS\s+)?([A-Za-z_]\w*))?", re.IGNORECASE)
+SQL_KEYWORDS = {"where", "left", "inner", "join", "on", "group", "order", "limit", "using", "cross", "natural", "union"}
+
+
+def remove_tree(path: Path) -> None:
+    for _ in range(5):
+        if not path.exists():
+            return
+        shutil.rmtree(path, ignore_errors=True)
+        if not path.exists():
+            return
+        gc.collect()
+        time.sleep(0.2)
+
+
+class _RecordingConn:
+    def __init__(self, conn):
+        self.conn = conn
+        self.statements: list[tuple[str, list]] = []
+
+    def execute(self, sql: str, params=()):
+        self.statements.append((sql, list(params)))
+        return self.conn.execute("SELECT 1 WHERE 0")
+
+
+def hot_queries(ops_main, conn) -> list[tuple[str, object, bool]]:
+    from ops import events, pdf_import
+
+    sample = conn.execute(
+        "SELECT * FROM complaints WHERE requester_phone != '' AND facility_id IS NOT NULL ORDER BY id DESC LIMIT 1"
+    ).fetchone()
+    admin = conn.execute("SELECT * FROM users ORDER BY id LIMIT 1").fetchone()
+    start, end = REPORT_RANGE
+    return [
+        (
+            "auth.session_lookup",
+            (
+                "SELECT u.* FROM sessions s JOIN users u ON u.id = s.user_id "
+                "WHERE s.token_hash = ? AND s.expires_at > datetime('now', 'localtime') AND u.is_active = 1",
+                ["x"],
+            ),
+            False,
+        ),
+        ("auth.session_expiry", ("DELETE FROM sessions WHERE expires_at <= datetime('now', 'localtime')", []), False),
+        ("complaints.list", lambda rec: ops_main._complaint_rows_cursor(rec), False),
+        ("complaints.list_status", lambda rec: ops_main._complaint_rows_cursor(rec, status="처리중"), False),
+        ("complaints.list_building", lambda rec: ops_main._complaint_rows_cursor(rec, site_name=sample["site_name"], building_label="101동"), False),
+        ("complaints.api_page", lambda rec: ops_main._complaint_rows_cursor(rec, after=(sample["updated_at"], sample["id"]), limit=50), False),
+        (
+            "complaints.api_page_status",
+            lambda rec: ops_main._complaint_rows_cursor(rec, status="처리중", after=(sample["updated_at"], sample["id"]), limit=50),
+            False,
+        ),
+        (
+            "complaints.api_page_fields",
+            lambda rec: ops_main._complaint_rows_cursor(
+                rec, after=(sample["updated_at"], sample["id"]), limit=50, fields=["id", "complaint_code", "updated_at"]
+            ),
+            False,
+        ),
+        ("complaints.repeat_candidates", lambda rec: ops_main._complaint_repeat_candidates(rec, sample), False),
+        ("work_orders.list", lambda rec: ops_main._work_order_rows_cursor(rec), False),
+        ("work_orders.list_status", lambda rec: ops_main._work_order_rows_cursor(rec, status="진행중"), False),
+        ("inventory.list_low", lambda rec: ops_main._inventory_rows_cursor(rec, low_only=True), False),
+        ("attachments.map", lambda rec: ops_main._attachment_map(rec, "complaint", [1, 2, 3]), False),
+        ("sync.assigned_work_orders", lambda rec: ops_main._sync_rows(rec, ops_main.SYNC_SOURCES["work_orders"], admin), False),
+        ("sync.snapshot_inventory", lambda rec: ops_main._sync_rows(rec, ops_main.SYNC_SOURCES["inventory"], admin, after=1, limit=500), False),
+        ("admin_db.page", lambda rec: ops_main._db_rows_cursor(rec, "complaints", [], [], before=sample["id"], limit=101), False),
+        (
+            "admin_db.filter_eq",
+            lambda rec: ops_main._db_rows_cursor(rec, "complaints", ["status = ?"], ["처리중"], before=sample["id"], limit=101),
+            False,
+        ),
+        (
+            "admin_db.filter_prefix",
+            lambda rec: ops_main._db_rows_cursor(rec, "complaints", ["title >= ? AND title < ?"], ["누수", "누숙"], limit=101),
+            False,
+        ),
+        ("sync.change_log", ("SELECT seq, table_name, row_id FROM change_log WHERE seq > ? ORDER BY seq LIMIT ?", [0, 500]), False),
+        ("events.complaint_snapshot", (events.EVENT_SNAPSHOT_SQL["complaint"], [sample["id"]]), False),
+        *[(f"events.counter_{name}", (sql, []), True) for name, sql in events.LIVE_COUNTER_SQL.items()],
+        ("reports.created_work", ("SELECT COUNT(*) AS count FROM work_orders WHERE substr(created_at, 1, 10) BETWEEN ? AND ?", [start, end]), True),
+        (
+            "reports.completed_work",
+            ("SELECT COUNT(*) AS count FROM work_orders WHERE completed_at != '' AND substr(completed_at, 1, 10) BETWEEN ? AND ?", [start, end]),
+            True,
+        ),
+        ("reports.created_complaints", ("SELECT COUNT(*) AS count FROM complaints WHERE substr(created_at, 1, 10) BETWEEN ? AND ?", [start, end]), True),
+        (
+            "reports.closed_complaints",
+            ("SELECT COUNT(*) AS count FROM complaints WHERE closed_at != '' AND substr(closed_at, 1, 10) BETWEEN ? AND ?", [start, end]),
+            True,
+        ),
+        (
+            "reports.overdue_complaints",
+            (
+                "SELECT COUNT(*) AS count FROM complaints WHERE response_due_at != '' AND response_due_at < ? "
+                "AND status NOT IN ('회신완료', '종결', '취소')",
+                [end],
+            ),
+            True,
+        ),
+        (
+            "reports.repeat_complaints",
+            (
+                f"""
+                SELECT COUNT(*) AS count
+                FROM complaints c
+                WHERE substr(c.created_at, 1, 10) BETWEEN ? AND ?
+                  AND EXISTS (
+                    SELECT 1
+                    FROM complaints c2
+                    WHERE c2.id != c.id
+                      AND c.requester_phone != ''
+                      AND c2.requester_phone = c.requester_phone
+                      AND c2.created_at >= datetime(c.created_at, '-{ops_main.COMPLAINT_REPEAT_WINDOW_DAYS} days')
+                      AND (
+                        (c.facility_id IS NOT NULL AND c2.facility_id = c.facility_id)
+                        OR (c.unit_label != '' AND c2.unit_label = c.unit_label)
+                        OR (c.location_detail != '' AND c2.location_detail = c.location_detail)
+                        OR (c.category_primary != '' AND c2.category_primary = c.category_primary)
+                      )
+                  )
+                """,
+                [start, end],
+            ),
+            False,
+        ),
+        ("pdf_import.batch_by_fingerprint", ("SELECT * FROM complaint_import_batches WHERE source_fingerprint = ?", ["x"]), False),
+        ("pdf_import.complaint_by_source_ref", ("SELECT * FROM complaints WHERE source_reference = ?", [f"{pdf_import.SOURCE_TYPE}:complaint:x:1"]), False),
+        (
+            "pdf_import.facility_by_source_ref",
+            (
+                "SELECT id FROM facilities WHERE source_reference = ? OR (building = ? AND name = ?) LIMIT 1",
+                [f"{pdf_import.SOURCE_TYPE}:facility:x:101동", "101동", "x 101동"],
+            ),
+            False,
+        ),
+        ("pdf_import.work_order_by_source_ref", ("SELECT * FROM work_orders WHERE source_reference = ?", [f"{pdf_import.SOURCE_TYPE}:work:x:1"]), False),
+    ]
+
+
+def _table_aliases(sql: str) -> dict[str, str]:
+    aliases = {}
+    for table, alias in TABLE_ALIAS.findall(sql):
+        aliases[table] = table
+        if alias and alias.lower() not in SQL_KEYWORDS:
+            aliases[alias] = table
+    return aliases
+
+
+def _plan_flags(plan: list[str], sql: str, large_tables: set[str], expect_covering: bool) -> list[str]:
+    aliases = _table_aliases(sql)
+    flags = set()
+    for detail in plan:
+        if detail.startswith("USE TEMP B-TREE"):
+            flags.add("temp_btree:" + detail.replace("USE TEMP B-TREE FOR ", "").lower().replace(" ", "_"))
+            continue
+        matched = PLAN_STEP.match(detail)
+        if not matched:
+            continue
+        step, name, access = matched.groups()
+        table = aliases.get(name, name)
+        if access and access.startswith("AUTOMATIC"):
+            flags.add(f"automatic_index:{table}")
+        elif step == "SCAN" and table in large_tables and not access:
+            flags.add(f"full_scan:{table}")
+        elif step == "SCAN" and table in large_tables and access == "INDEX":
+            flags.add(f"index_scan:{table}")
+        elif step == "SEARCH" and expect_covering and access == "INDEX":
+            flags.add(f"not_covering:{table}")
+    return sorted(flags)
+
+
+def collect_plans(ops_main, conn) -> dict[str, dict]:
+    large_tables = {
+        row["name"]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'").fetchall()
+        if conn.execute(f"SELECT COUNT(*) AS count FROM {row['name']}").fetchone()["count"] >= LARGE_TABLE_ROWS
+    }
+    results = {}
+    for name, source, expect_covering in hot_queries(ops_main, conn):
+        if callable(source):
+            recorder = _RecordingConn(conn)
+            source(recorder)
+            sql, params = recorder.statements[-1]
+        else:
+            sql, params = source
+        plan = [row["detail"] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()]
+        results[name] = {"flags": _plan_flags(plan, sql, large_tables, expect_covering), "plan": plan}
+    return results
+
+
+def compare(baseline: dict[str, dict], current: dict[str, dict]) -> tuple[list[str], list[str]]:
+    regressions = []
+    improvements = []
+    for name, result in current.items():
+        known = baseline.get(name)
+        if known is None:
+            regressions.append(f"{name}: 기준선에 없는 쿼리입니다 ({', '.join(result['flags']) or '플래그 없음'})")
+            continue
+        added = sorted(set(result["flags"]) - set(known["flags"]))
+        removed = sorted(set(known["flags"]) - set(result["flags"]))
+        if added:
+            regressions.append(f"{name}: {', '.join(added)}\n    " + "\n    ".join(result["plan"]))
+        if removed:
+            improvements.append(f"{name}: {', '.join(removed)} 해소")
+    for name in sorted(set(baseline) - set(current)):
+        improvements.append(f"{name}: 카탈로그에서 제거됨")
+    return regressions, improvements
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="주요 SQL 의 EXPLAIN QUERY PLAN 회귀 점검")
+    parser.add_argument("--complaints", type=int, default=SEED_COMPLAINTS, help="계획 산출용 합성 민원 수")
+    parser.add_argument("--update-baseline", action="store_true", help=f"현재 계획으로 {BASELINE_PATH.name} 갱신")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    tmp_path = ROOT_DIR / f"tmp_ops_query_plans_{uuid.uuid4().hex[:8]}"
+    if tmp_path.exists():
+        remove_tree(tmp_path)
+    tmp_path.mkdir(parents=True, exist_ok=True)
+    try:
+        os.environ["OPS_DB_PATH"] = str(tmp_path / "operations.db")
+        os.environ["OPS_UPLOAD_DIR"] = str(tmp_path / "uploads")
+        os.environ.pop("LEGACY_DB_PATH", None)
+
+        import ops_main
+        from ops.db import get_conn
+        from scripts.synthetic_data import generate
+
+        conn = get_conn()
+        try:
+            generate(conn, args.complaints)
+            current = collect_plans(ops_main, conn)
+        finally:
+            conn.close()
+    finally:
+        remove_tree(tmp_path)
+
+    flagged = {name: result["flags"] for name, result in current.items() if result["flags"]}
+    for name, flags in flagged.items():
+        print(f"- {name}: {', '.join(flags)}")
+    if args.update_baseline:
+        BASELINE_PATH.write_text(json.dumps(current, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"OK: query plan baseline updated ({len(current)} statements, {len(flagged)} flagged)")
+        return
+
+    baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8")) if BASELINE_PATH.exists() else {}
+    regressions, improvements = compare(baseline, current)
+    for item in improvements:
+        print(f"개선: {item} (--update-baseline 으로 기준선을 갱신하세요)")
+    if regressions:
+        raise AssertionError("쿼리 계획 회귀가 발견되었습니다:\n" + "\n".join(regressions))
+    print(f"OK: query plans verified ({len(current)} statements, {len(flagged)} flagged as in baseline)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="tool_search 레거시 공구 DB를 재고 품목으로 이관 (중단 지점부터 재개)")
+    parser.add_argument("legacy_db", nargs="?", default="", help="레거시 tools.db 경로 (기본: LEGACY_DB_PATH)")
+    parser.add_argument("--db", dest="db_path", default="", help="대상 SQLite DB 경로")
+    parser.add_argument("--batch-size", type=int, default=0, help="한 번에 커밋할 공구 수")
+    return parser.parse_args()
+
+
+def _print_progress(done: int, total: int) -> None:
+    percent = done * 100 / total if total else 100.0
+    print(f"\r이관 진행: {done}/{total} ({percent:.1f}%)", end="\n" if done >= total else "", flush=True)
+
+
+def main() -> None:
+    args = parse_args()
+    if args.legacy_db:
+        os.environ["LEGACY_DB_PATH"] = str(Path(args.legacy_db).expanduser())
+    if args.db_path:
+        os.environ["OPS_DB_PATH"] = str(Path(args.db_path).expanduser())
+
+    from ops import bootstrap, db as ops_db
+
+    if not ops_db.LEGACY_DB_PATH or not ops_db.LEGACY_DB_PATH.exists():
+        raise SystemExit(f"레거시 DB를 찾을 수 없습니다: {ops_db.LEGACY_DB_PATH or '(LEGACY_DB_PATH 미지정)'}")
+
+    bootstrap.run()
+    started = time.perf_counter()
+    try:
+        imported = bootstrap.migrate_legacy(_print_progress, args.batch_size)
+    except KeyboardInterrupt:
+        raise SystemExit("\n중단되었습니다. 다시 실행하면 마지막으로 커밋한 배치 다음부터 이어서 이관합니다.")
+    if imported is None:
+        raise SystemExit("다른 프로세스가 이관을 진행 중입니다.")
+    conn = ops_db.get_conn()
+    try:
+        state = conn.execute("SELECT * FROM legacy_migration_state WHERE source = ?", (ops_db.LEGACY_SOURCE,)).fetchone()
+    finally:
+        conn.close()
+    if state is None:
+        print("이관 대상이 없습니다 (재고 품목이 이미 있거나 레거시 tools 테이블이 없음).")
+        return
+    print(f"이번 실행 {imported}건 이관 ({time.perf_counter() - started:.2f}s), 누적 {state['imported']}/{state['total']}건, 완료 {state['completed_at'] or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from scripts.benchmark_routes import _git_commit, _percentile
+
+DEFAULT_LEVELS = "1,2,4,8,16,32"
+METRICS_TOKEN = uuid.uuid4().hex
+SEED_COMPLAINTS = 2000
+OPERATIONS = {
+    "dashboard": 20,
+    "complaint_list": 15,
+    "work_order_list": 10,
+    "complaint_save": 15,
+    "work_order_update": 15,
+    "inventory_tx": 15,
+    "pdf_export": 5,
+    "login": 5,
+}
+LOCKED_LOG_PATTERN = "database is locked"
+LOCK_WAIT_METRIC = "ops_sqlite_write_lock_wait_seconds"
+METRIC_LINE = re.compile(r'^(\w+?)(?:\{le="([^"]+)"\})? ([0-9.e+-]+|\+Inf)$')
+REQUEST_TIMEOUT = 60.0
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def _seed_database(tmp_path: Path, complaints: int) -> dict[str, list[int]]:
+    os.environ["OPS_DB_PATH"] = str(tmp_path / "operations.db")
+    os.environ["OPS_UPLOAD_DIR"] = str(tmp_path / "uploads")
+    os.environ.pop("LEGACY_DB_PATH", None)
+
+    from ops import bootstrap
+    from ops.db import get_conn
+    from scripts.synthetic_data import generate
+
+    bootstrap.run()
+    os.environ[bootstrap.BOOTSTRAP_DONE_ENV] = "1"
+    conn = get_conn()
+    try:
+        generate(conn, complaints)
+        ids = {
+            "work_orders": [row["id"] for row in conn.execute("SELECT id FROM work_orders")],
+            "inventory": [row["id"] for row in conn.execute("SELECT id FROM inventory_items")],
+        }
+    finally:
+        conn.close()
+    return ids
+
+
+def _start_server(port: int, workers: int, log_path: Path) -> subprocess.Popen:
+    log_handle = log_path.open("wb")
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "ops_main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+        ],
+        cwd=ROOT_DIR,
+        env={**os.environ, "OPS_WORKERS": str(workers), "OPS_METRICS_TOKEN": METRICS_TOKEN},
+        stdout=log_handle,
+        stderr=subprocess.STDOUT,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"서버가 시작되지 않았습니다. 로그: {log_path}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/healthz", timeout=2).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.3)
+    process.terminate()
+    raise SystemExit("서버 준비 대기 시간이 초과되었습니다.")
+
+
+def _login(client: httpx.Client) -> httpx.Response:
+    from ops import auth
+
+    return client.post("/login", data={"username": auth.DEFAULT_ADMIN_USERNAME, "password": auth.DEFAULT_ADMIN_PASSWORD})
+
+
+def _request(client: httpx.Client, operation: str, rng: random.Random, ids: dict[str, list[int]]) -> httpx.Response:
+    if operation == "dashboard":
+        return client.get("/")
+    if operation == "complaint_list":
+        return client.get("/complaints", params={"status": rng.choice(["접수", "처리중", "배정완료"])})
+    if operation == "work_order_list":
+        return client.get("/work-orders", params={"status": rng.choice(["접수", "진행중", "대기"])})
+    if operation == "complaint_save":
+        building = f"{rng.randint(101, 115)}동"
+        return client.post(
+            "/complaints/save",
+            data={
+                "title": f"{building} 부하 시험 민원",
+                "unit_label": f"{building} {rng.randint(1, 25)}0{rng.randint(1, 4)}호",
+                "requester_phone": f"010-{rng.randint(2000, 9999)}-{rng.randint(0, 9999):04d}",
+                "category_primary": rng.choice(["전기", "기계", "건축"]),
+            },
+        )
+    if operation == "work_order_update":
+        return client.post(
+            f"/work-orders/update/{rng.choice(ids['work_orders'])}",
+            data={"update_type": "진행메모", "body": "부하 시험 진행 메모"},
+        )
+    if operation == "inventory_tx":
+        return client.post(
+            f"/inventory/tx/{rng.choice(ids['inventory'])}",
+            data={"tx_type": rng.choice(["입고", "사용"]), "quantity": "1", "reason": "부하 시험"},
+        )
+    if operation == "pdf_export":
+        return client.get("/complaints/pdf", params={"building": f"{rng.randint(101, 115)}동", "status": "접수"})
+    fresh = httpx.Client(base_url=str(client.base_url), timeout=REQUEST_TIMEOUT)
+    try:
+        return _login(fresh)
+    finally:
+        fresh.close()
+
+
+def _outcome(response: httpx.Response) -> str:
+    if response.status_code >= 500:
+        return "error"
+    location = response.headers.get("location", "")
+    if location.startswith("/login"):
+        return "error"
+    return "rejected" if "level=error" in location else "ok"
+
+
+def _drive(base_url: str, concurrency: int, seconds: float, ids: dict[str, list[int]], seed: int) -> list[tuple[str, float, str]]:
+    samples: list[tuple[str, float, str]] = []
+    samples_lock = threading.Lock()
+    stop_at = time.perf_counter() + seconds
+    names = list(OPERATIONS)
+    weights = list(OPERATIONS.values())
+
+    def worker(index: int) -> None:
+        rng = random.Random(seed * 1000 + index)
+        client = httpx.Client(base_url=base_url, timeout=REQUEST_TIMEOUT)
+        local: list[tuple[str, float, str]] = []
+        try:
+            if _login(client).status_code not in {302, 303}:
+                local.append(("login", 0.0, "error"))
+                return
+            while time.perf_counter() < stop_at:
+                operation = rng.choices(names, weights=weights)[0]
+                started = time.perf_counter()
+                try:
+                    outcome = _outcome(_request(client, operation, rng, ids))
+                except httpx.HTTPError:
+                    outcome = "error"
+                local.append((operation, (time.perf_counter() - started) * 1000, outcome))
+        finally:
+            client.close()
+            with samples_lock:
+                samples.extend(local)
+
+    threads = [threading.Thread(target=worker, args=(index,), daemon=True) for index in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples
+
+
+def _scrape_lock_waits(base_url: str, workers: int) -> dict[str, dict]:
+    snapshots: dict[str, dict] = {}
+    for _ in range(workers * 8):
+        try:
+            text = httpx.get(f"{base_url}/metrics", headers={"Authorization": f"Bearer {METRICS_TOKEN}"}, timeout=10).text
+        except httpx.HTTPError:
+            continue
+        pid = ""
+        buckets: dict[str, float] = {}
+        total = 0.0
+        count = 0.0
+        for line in text.splitlines():
+            matched = METRIC_LINE.match(line)
+            if not matched:
+                continue
+            name, le, value = matched.groups()
+            if name == "ops_process_id":
+                pid = value
+            elif name == f"{LOCK_WAIT_METRIC}_bucket" and le:
+                buckets[le] = float(value)
+            elif name == f"{LOCK_WAIT_METRIC}_sum":
+                total = float(value)
+            elif name == f"{LOCK_WAIT_METRIC}_count":
+                count = float(value)
+        if pid:
+            snapshots[pid] = {"buckets": buckets, "sum": total, "count": count}
+        if len(snapshots) >= workers:
+            break
+    return snapshots
+
+
+def _lock_wait_delta(before: dict[str, dict], after: dict[str, dict]) -> dict:
+    buckets: Counter[str] = Counter()
+    total = 0.0
+    count = 0.0
+    for pid, snapshot in after.items():
+        previous = before.get(pid, {"buckets": {}, "sum": 0.0, "count": 0.0})
+        for le, value in snapshot["buckets"].items():
+            buckets[le] += value - previous["buckets"].get(le, 0.0)
+        total += snapshot["sum"] - previous["sum"]
+        count += snapshot["count"] - previous["count"]
+
+    def quantile(ratio: float) -> str:
+        target = count * ratio
+        for le, cumulative in sorted(buckets.items(), key=lambda item: float(item[0])):
+            if cumulative >= target:
+                return le
+        return "+Inf"
+
+    return {
+        "writes": int(count),
+        "mean_ms": round(total / count * 1000, 2) if count else 0.0,
+        "p50_le_seconds": quantile(0.5) if count else "0",
+        "p95_le_seconds": quantile(0.95) if count else "0",
+        "p99_le_seconds": quantile(0.99) if count else "0",
+        "buckets": {le: int(value) for le, value in sorted(buckets.items(), key=lambda item: float(item[0]))},
+    }
+
+
+def _locked_errors(log_path: Path, offset: int) -> tuple[int, int]:
+    with log_path.open("rb") as handle:
+        handle.seek(offset)
+        chunk = handle.read()
+    return chunk.decode("utf-8", "replace").count(LOCKED_LOG_PATTERN), offset + len(chunk)
+
+
+def _summarize_level(samples: list[tuple[str, float, str]], seconds: float) -> dict:
+    latencies = [latency for _, latency, _ in samples]
+    errors = sum(1 for _, _, outcome in samples if outcome == "error")
+    per_operation: dict[str, list[tuple[float, str]]] = defaultdict(list)
+    for operation, latency, outcome in samples:
+        per_operation[operation].append((latency, outcome))
+    return {
+        "requests": len(samples),
+        "throughput_rps": round(len(samples) / seconds, 1),
+        "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+        "rejected": sum(1 for _, _, outcome in samples if outcome == "rejected"),
+        "p50_ms": round(_percentile(latencies, 0.50), 1),
+        "p95_ms": round(_percentile(latencies, 0.95), 1),
+        "p99_ms": round(_percentile(latencies, 0.99), 1),
+        "max_ms": round(max(latencies), 1) if latencies else 0.0,
+        "operations": {
+            operation: {
+                "requests": len(items),
+                "errors": sum(1 for _, outcome in items if outcome == "error"),
+                "rejected": sum(1 for _, outcome in items if outcome == "rejected"),
+                "p95_ms": round(_percentile([latency for latency, _ in items], 0.95), 1),
+                "p99_ms": round(_percentile([latency for latency, _ in items], 0.99), 1),
+            }
+            for operation, items in sorted(per_operation.items())
+        },
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="동시 사용자 부하 및 SQLite 쓰기 경합 소크 테스트")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 워커 프로세스 수")
+    parser.add_argument("--write-queue", action="store_true", help="단일 쓰기 스레드 커밋 큐(OPS_WRITE_QUEUE)를 켜고 실행")
+    parser.add_argument("--levels", default=DEFAULT_LEVELS, help="쉼표로 구분한 동시 사용자 수 단계")
+    parser.add_argument("--seconds", type=float, default=30.0, help="단계별 부하 시간(초)")
+    parser.add_argument("--complaints", type=int, default=SEED_COMPLAINTS, help="사전 생성할 합성 민원 수")
+    parser.add_argument("--seed", type=int, default=7, help="난수 시드")
+    parser.add_argument("--max-error-rate", type=float, default=0.01, help="한계 판정용 허용 오류율")
+    parser.add_argument("--p95-budget-ms", type=float, default=1000.0, help="한계 판정용 p95 응답 시간 예산")
+    parser.add_argument("--output", default="", help="결과 JSON 경로 (기본: bench_results/soak-<시각>.json)")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    tmp_path = ROOT_DIR / f"tmp_ops_soak_{uuid.uuid4().hex[:8]}"
+    tmp_path.mkdir(parents=True, exist_ok=True)
+    log_path = tmp_path / "server.log"
+    process = None
+    report = {
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "workers": args.workers,
+        "write_queue": args.write_queue,
+        "seconds_per_level": args.seconds,
+        "seed_complaints": args.complaints,
+        "operation_weights": OPERATIONS,
+        "levels": {},
+    }
+    if args.write_queue:
+        os.environ["OPS_WRITE_QUEUE"] = "1"
+    try:
+        ids = _seed_database(tmp_path, args.complaints)
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        process = _start_server(port, args.workers, log_path)
+        log_offset = 0
+        scaling_limit = 0
+        within_budget = True
+        for level in [int(value) for value in args.levels.split(",") if value.strip()]:
+            before = _scrape_lock_waits(base_url, args.workers)
+            samples = _drive(base_url, level, args.seconds, ids, args.seed + level)
+            result = _summarize_level(samples, args.seconds)
+            result["lock_wait"] = _lock_wait_delta(before, _scrape_lock_waits(base_url, args.workers))
+            result["database_locked_errors"], log_offset = _locked_errors(log_path, log_offset)
+            report["levels"][str(level)] = result
+            within_budget = within_budget and result["error_rate"] <= args.max_error_rate and result["p95_ms"] <= args.p95_budget_ms
+            if within_budget:
+                scaling_limit = level
+            print(
+                f"[동시 {level:>3}] {result['throughput_rps']:>7.1f} req/s  오류 {result['error_rate'] * 100:5.2f}%"
+                f"  p50 {result['p50_ms']:>7.1f}  p95 {result['p95_ms']:>7.1f}  p99 {result['p99_ms']:>7.1f} ms"
+                f"  쓰기 대기 p95≤{result['lock_wait']['p95_le_seconds']}s  locked {result['database_locked_errors']}건",
+                flush=True,
+            )
+        report["scaling_limit"] = scaling_limit
+        print(
+            f"\n오류율 {args.max_error_rate * 100:g}% / p95 {args.p95_budget_ms:g}ms 기준 최대 동시 사용자: "
+            f"{scaling_limit or '없음'} (워커 {args.workers}개)"
+        )
+    finally:
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+    output = Path(args.output) if args.output else ROOT_DIR / "bench_results" / f"soak-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
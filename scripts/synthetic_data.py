@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+SITE_NAMES = ["한빛마을 1단지", "푸른숲 아파트", "새솔 센트럴"]
+BUILDINGS = [f"{number}동" for number in range(101, 116)]
+FLOORS = 25
+UNITS_PER_FLOOR = 4
+CHANNELS = ["전화", "방문", "모바일", "카카오톡", "이메일", "기타"]
+CATEGORY_TITLES = {
+    "전기": ["세대 전등 고장", "차단기 트립 반복", "복도 조명 깜빡임"],
+    "기계": ["온수 미공급", "보일러 소음", "배관 누수"],
+    "소방": ["감지기 오작동", "소화전 점검 요청"],
+    "건축": ["현관문 도어클로저 불량", "창호 결로", "벽면 균열"],
+    "청소": ["계단 청소 요청", "음식물 수거함 악취"],
+    "소음": ["층간소음 민원", "야간 공사 소음"],
+    "주차": ["무단 주차 신고", "주차 차단기 고장"],
+    "안전": ["놀이터 시설 파손", "난간 흔들림"],
+    "민원": ["관리비 문의", "택배 보관 문의"],
+    "기타": ["기타 요청"],
+}
+PRIORITY_WEIGHTS = {"낮음": 20, "보통": 55, "높음": 20, "긴급": 5}
+STATUS_WEIGHTS = {"접수": 15, "배정완료": 10, "처리중": 15, "처리완료": 10, "회신완료": 10, "종결": 35, "보류": 3, "취소": 2}
+WORK_STATUS_WEIGHTS = {"접수": 15, "진행중": 25, "대기": 10, "보류": 5, "완료": 35, "종결": 10}
+FAMILY_NAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN_NAMES = ["민준", "서연", "도윤", "하은", "지호", "수아", "예준", "지우", "현우", "서윤", "정희", "영수"]
+INVENTORY_ITEMS = [
+    ("전기", "LED 등기구 20W", "개"),
+    ("전기", "누전차단기 30A", "개"),
+    ("기계", "볼밸브 25A", "개"),
+    ("기계", "펌프 메카니컬 씰", "개"),
+    ("소방", "연기감지기", "개"),
+    ("건축", "도어클로저", "개"),
+    ("청소", "대형 비닐봉투", "박스"),
+    ("공구", "전동드릴 배터리", "개"),
+]
+FACILITY_KINDS = [("전기", "전기실 수배전반"), ("기계", "기계실 급수펌프"), ("소방", "소방 수신기"), ("기계", "지하주차장 배기팬")]
+REPEAT_RATIO = 0.15
+ATTACHMENT_RATIO = 0.1
+WORK_ORDER_RATIO = 0.3
+SPAN_DAYS = 365
+BATCH_ROWS = 2000
+SYNTHETIC_USERS = [("synthetic_tech_1", "합성 기사 1"), ("synthetic_tech_2", "합성 기사 2"), ("synthetic_tech_3", "합성 기사 3")]
+
+
+def _weighted(rng: random.Random, weights: dict[str, int]) -> str:
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def _timestamp(value: datetime) -> str:
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _person(rng: random.Random) -> tuple[str, str]:
+    name = rng.choice(FAMILY_NAMES) + rng.choice(GIVEN_NAMES)
+    phone = f"010-{rng.randint(2000, 9999)}-{rng.randint(0, 9999):04d}"
+    return name, phone
+
+
+def _unit(rng: random.Random) -> tuple[str, str]:
+    building = rng.choice(BUILDINGS)
+    unit_number = f"{rng.randint(1, FLOORS)}{rng.randint(1, UNITS_PER_FLOOR):02d}호"
+    return building, unit_number
+
+
+def _executemany(conn, sql: str, rows: list[tuple]) -> None:
+    for start in range(0, len(rows), BATCH_ROWS):
+        conn.executemany(sql, rows[start : start + BATCH_ROWS])
+
+
+def _ensure_users(conn) -> list[int]:
+    from ops import auth
+
+    user_ids = []
+    password_hash = ""
+    for username, full_name in SYNTHETIC_USERS:
+        row = conn.execute("SELECT id FROM users WHERE username = ?", (username,)).fetchone()
+        if row:
+            user_ids.append(int(row["id"]))
+            continue
+        password_hash = password_hash or auth.hash_password(os.urandom(12).hex())
+        cursor = conn.execute(
+            """
+            INSERT INTO users(username, full_name, role, password_hash, is_active, created_at, updated_at)
+            VALUES (?, ?, 'technician', ?, 1, datetime('now', 'localtime'), datetime('now', 'localtime'))
+            """,
+            (username, full_name, password_hash),
+        )
+        user_ids.append(int(cursor.lastrowid))
+    return user_ids
+
+
+def _next_id(conn, table_name: str) -> int:
+    return int(conn.execute(f"SELECT COALESCE(MAX(id), 0) + 1 AS next_id FROM {table_name}").fetchone()["next_id"])
+
+
+def generate(conn, complaints: int, *, seed: int = 7, now: datetime | None = None) -> dict[str, int]:
+    rng = random.Random(seed)
+    now = now or datetime.now()
+    user_ids = _ensure_users(conn)
+    admin_id = int(conn.execute("SELECT id FROM users ORDER BY id LIMIT 1").fetchone()["id"])
+    site_name = SITE_NAMES[seed % len(SITE_NAMES)]
+
+    facility_start = _next_id(conn, "facilities")
+    facility_rows = []
+    for index in range(max(len(BUILDINGS), min(complaints // 50, 2000))):
+        category, label = FACILITY_KINDS[index % len(FACILITY_KINDS)]
+        building = BUILDINGS[index % len(BUILDINGS)]
+        created = _timestamp(now - timedelta(days=rng.randint(SPAN_DAYS, SPAN_DAYS * 3)))
+        facility_rows.append(
+            (
+                facility_start + index,
+                f"FAC-SYN-{facility_start + index:06d}",
+                category,
+                f"{building} {label} {index // len(BUILDINGS) + 1}",
+                building,
+                f"B{rng.randint(1, 2)}",
+                "운영중" if rng.random() > 0.05 else "점검필요",
+                created,
+                created,
+            )
+        )
+    _executemany(
+        conn,
+        """
+        INSERT INTO facilities(id, facility_code, category, name, building, floor, status, created_by, updated_by, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, NULL, NULL, ?, ?)
+        """,
+        facility_rows,
+    )
+    facility_ids = [row[0] for row in facility_rows]
+
+    item_start = _next_id(conn, "inventory_items")
+    item_rows = []
+    for index in range(max(len(INVENTORY_ITEMS), complaints // 20 if complaints < 10000 else 500)):
+        category, name, unit = INVENTORY_ITEMS[index % len(INVENTORY_ITEMS)]
+        min_quantity = rng.randint(2, 10)
+        item_rows.append(
+            (
+                item_start + index,
+                f"INV-SYN-{item_start + index:06d}",
+                category,
+                f"{name} #{index // len(INVENTORY_ITEMS) + 1}",
+                rng.randint(0, min_quantity * 4),
+                unit,
+                f"{rng.choice(BUILDINGS)} 자재창고",
+                min_quantity,
+                _timestamp(now - timedelta(days=rng.randint(0, SPAN_DAYS))),
+            )
+        )
+    _executemany(
+        conn,
+        """
+        INSERT INTO inventory_items(id, item_code, category, name, quantity, unit, location, min_quantity, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [row + (row[-1],) for row in item_rows],
+    )
+
+    complaint_start = _next_id(conn, "complaints")
+    complaint_rows = []
+    update_rows = []
+    attachment_rows = []
+    residents: list[tuple[str, str, str, str, str]] = []
+    for index in range(complaints):
+        complaint_id = complaint_start + index
+        if residents and rng.random() < REPEAT_RATIO:
+            building, unit_number, name, phone, category = rng.choice(residents[-500:])
+        else:
+            building, unit_number = _unit(rng)
+            name, phone = _person(rng)
+            category = rng.choice(list(CATEGORY_TITLES))
+            residents.append((building, unit_number, name, phone, category))
+        priority = _weighted(rng, PRIORITY_WEIGHTS)
+        status = _weighted(rng, STATUS_WEIGHTS)
+        created = now - timedelta(days=SPAN_DAYS * (1 - index / max(complaints, 1)), minutes=rng.randint(0, 600))
+        updated = min(created + timedelta(hours=rng.randint(1, 240)), now)
+        resolved_at = _timestamp(updated) if status in {"처리완료", "회신완료", "종결"} else ""
+        closed_at = _timestamp(updated) if status in {"종결", "취소"} else ""
+        title = rng.choice(CATEGORY_TITLES[category])
+        complaint_rows.append(
+            (
+                complaint_id,
+                f"CP-{complaint_id:04d}",
+                site_name,
+                building,
+                unit_number,
+                rng.choice(CHANNELS),
+                category,
+                rng.choice(facility_ids) if category in {"전기", "기계", "소방"} and rng.random() < 0.5 else None,
+                f"{building} {unit_number}",
+                name,
+                phone,
+                f"{building} {unit_number} {title}",
+                f"{building} {unit_number} 세대에서 {title} 건으로 연락했습니다.",
+                priority,
+                status,
+                _timestamp(created + timedelta(days=3)),
+                resolved_at,
+                closed_at,
+                rng.choice(user_ids) if status != "접수" else None,
+                admin_id,
+                admin_id,
+                _timestamp(created),
+                _timestamp(updated),
+            )
+        )
+        update_rows.append((complaint_id, "접수", "", "접수", "민원이 접수되었습니다.", 0, admin_id, _timestamp(created)))
+        for step in range(rng.randint(0, 3)):
+            update_rows.append(
+                (
+                    complaint_id,
+                    rng.choice(["내부메모", "상태변경", "회신", "배정"]),
+                    "",
+                    status,
+                    f"진행 메모 {step + 1}",
+                    step % 2,
+                    rng.choice(user_ids),
+                    _timestamp(created + timedelta(hours=step + 1)),
+                )
+            )
+        if rng.random() < ATTACHMENT_RATIO:
+            for photo in range(rng.randint(1, 3)):
+                attachment_rows.append(
+                    ("complaint", complaint_id, f"synthetic-{complaint_id}-{photo}.jpg", f"현장사진{photo + 1}.jpg", admin_id, _timestamp(created))
+                )
+    _executemany(
+        conn,
+        """
+        INSERT INTO complaints(
+            id, complaint_code, site_name, building_label, unit_number, channel, category_primary, facility_id, unit_label,
+            requester_name, requester_phone, title, description, priority, status, response_due_at, resolved_at, closed_at,
+            assignee_user_id, created_by, updated_by, created_at, updated_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        complaint_rows,
+    )
+    _executemany(
+        conn,
+        """
+        INSERT INTO complaint_updates(complaint_id, update_type, status_from, status_to, message, is_public_note, created_by, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        update_rows,
+    )
+
+    work_start = _next_id(conn, "work_orders")
+    work_rows = []
+    work_update_rows = []
+    for row in complaint_rows:
+        if rng.random() >= WORK_ORDER_RATIO:
+            continue
+        work_id = work_start + len(work_rows)
+        status = _weighted(rng, WORK_STATUS_WEIGHTS)
+        created = datetime.strptime(row[-2], "%Y-%m-%d %H:%M:%S") + timedelta(hours=1)
+        work_rows.append(
+            (
+                work_id,
+                f"WO-{work_id:04d}",
+                row[0],
+                row[6],
+                row[11],
+                row[7],
+                row[9],
+                row[13],
+                status,
+                row[12],
+                rng.choice(user_ids),
+                (created + timedelta(days=rng.randint(1, 14))).strftime("%Y-%m-%d"),
+                row[-1] if status in {"완료", "종결"} else "",
+                admin_id,
+                admin_id,
+                _timestamp(created),
+                row[-1],
+            )
+        )
+        work_update_rows.append((work_id, "생성", "작업지시가 생성되었습니다.", admin_id, _timestamp(created)))
+        if rng.random() < ATTACHMENT_RATIO:
+            attachment_rows.append(("work_order", work_id, f"synthetic-wo-{work_id}.jpg", "작업사진.jpg", admin_id, _timestamp(created)))
+    _executemany(
+        conn,
+        """
+        INSERT INTO work_orders(
+            id, work_code, complaint_id, category, title, facility_id, requester_name, priority, status, description,
+            assignee_user_id, due_date, completed_at, created_by, updated_by, created_at, updated_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        work_rows,
+    )
+    _executemany(
+        conn,
+        "INSERT INTO work_order_updates(work_order_id, update_type, body, actor_user_id, created_at) VALUES (?, ?, ?, ?, ?)",
+        work_update_rows,
+    )
+    _executemany(
+        conn,
+        """
+        INSERT INTO attachments(entity_type, entity_id, file_path, original_name, created_by, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        attachment_rows,
+    )
+
+    transaction_rows = []
+    for row in item_rows:
+        for _ in range(rng.randint(0, 4)):
+            delta = rng.choice([-2, -1, -1, 3, 5])
+            transaction_rows.append(
+                (row[0], "입고" if delta > 0 else "출고", delta, "정기 수불", rng.choice(user_ids), _timestamp(now - timedelta(days=rng.randint(0, SPAN_DAYS))))
+            )
+    _executemany(
+        conn,
+        """
+        INSERT INTO inventory_transactions(item_id, tx_type, quantity_delta, reason, actor_user_id, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        transaction_rows,
+    )
+    conn.commit()
+    conn.execute("ANALYZE")
+    return {
+        "facilities": len(facility_rows),
+        "inventory_items": len(item_rows),
+        "inventory_transactions": len(transaction_rows),
+        "complaints": len(complaint_rows),
+        "complaint_updates": len(update_rows),
+        "work_orders": len(work_rows),
+        "work_order_updates": len(work_update_rows),
+        "attachments": len(attachment_rows),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="시설 운영 시스템 성능 측정용 합성 데이터 생성")
+    parser.add_argument("--db", dest="db_path", default="", help="대상 SQLite DB 경로")
+    parser.add_argument("--complaints", type=int, default=1000, help="생성할 민원 수")
+    parser.add_argument("--seed", type=int, default=7, help="난수 시드")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.db_path:
+        os.environ["OPS_DB_PATH"] = str(Path(args.db_path).expanduser())
+
+    from ops.db import get_conn, init_db
+
+    init_db()
+    conn = get_conn()
+    try:
+        counts = generate(conn, args.complaints, seed=args.seed)
+    finally:
+        conn.close()
+    print(", ".join(f"{name} {count:,}" for name, count in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import argparse
+import io
+import random
+import sys
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+from reportlab.pdfgen import canvas
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from scripts.synthetic_data import BUILDINGS, _person, _unit, _weighted
+
+PAGE_LINES = 76
+FONT_SIZE = 8
+COLUMN_HEADERS = ["민원ID", "동", "호수", "민원유형", "상태", "담당자", "접수일시", "연락처", "민원내용"]
+PAGE_FOOTER = "KA Facility OS · 세대 민원관리 보고서"
+SOURCE_CATEGORIES = [
+    ["복합 민원"],
+    ["유리/창문", "오염"],
+    ["기타 마감불량"],
+    ["도배", "들뜸"],
+    ["타일", "균열"],
+    ["창호", "결로"],
+    ["욕실 배수 불량"],
+]
+DESCRIPTIONS = [
+    "거실 창문 및 방충망 오염",
+    "작은방 창문 오염",
+    "외벽 도색 마감 불량",
+    "욕실 타일 줄눈 갈라짐",
+    "안방 벽지 들뜸 보수 요청",
+    "현관 하부 실리콘 마감 불량",
+]
+REPORT_STATUS_WEIGHTS = {"접수": 30, "배정완료": 35, "처리중": 15, "처리완료": 10, "종결": 10}
+ASSIGNEES = ["현장A", "현장B", "현장C", "미배정"]
+
+
+def _font_name() -> str:
+    for candidate in ("HYGothic-Medium", "HYSMyeongJo-Medium"):
+        try:
+            if candidate not in pdfmetrics.getRegisteredFontNames():
+                pdfmetrics.registerFont(UnicodeCIDFont(candidate))
+            return candidate
+        except Exception:
+            continue
+    return "Helvetica"
+
+
+def _records(complaints: int, rng: random.Random, now: datetime) -> list[dict]:
+    rows = []
+    for index in range(complaints):
+        building, unit_number = _unit(rng)
+        _, phone = _person(rng)
+        received = now - timedelta(minutes=rng.randint(60, 60 * 24 * 120))
+        rows.append(
+            {
+                "ticket": str(1001 + index),
+                "building": building,
+                "unit": unit_number,
+                "category": rng.choice(SOURCE_CATEGORIES),
+                "status": _weighted(rng, REPORT_STATUS_WEIGHTS),
+                "assignee": rng.choice(ASSIGNEES),
+                "received": received,
+                "phone": phone if rng.random() < 0.8 else "",
+                "description": rng.choice(DESCRIPTIONS),
+            }
+        )
+    rows.sort(key=lambda row: (BUILDINGS.index(row["building"]), row["received"]))
+    return rows
+
+
+def _record_lines(row: dict) -> list[str]:
+    lines = [row["ticket"], row["building"], row["unit"], *row["category"], row["status"], row["assignee"]]
+    lines += [row["received"].strftime("%Y-%m-%d"), row["received"].strftime("%H:%M")]
+    if row["phone"]:
+        lines.append(row["phone"])
+    lines.append(row["description"])
+    return lines
+
+
+def _summary_lines(site_name: str, rows: list[dict], now: datetime) -> list[str]:
+    status_counts = Counter(row["status"] for row in rows)
+    closed = status_counts.get("종결", 0)
+    lines = [
+        "KA",
+        site_name,
+        "Field Operations Reporting",
+        "시공사 합성건설",
+        "세대 민원 처리 현황 보고서",
+        f"{site_name} 세대 민원 합성 보고서입니다.",
+        f"최근 접수 {max(row['received'] for row in rows).strftime('%Y-%m-%d %H:%M') if rows else now.strftime('%Y-%m-%d %H:%M')}",
+        "제출처",
+        f"{site_name} 관리사무소",
+        "보고일",
+        now.strftime("%Y년 %m월 %d일"),
+        "문서구분",
+        "전체 보고",
+        "단지명",
+        site_name,
+        "제출사",
+        site_name,
+        "시공사",
+        "합성건설",
+        "공사명",
+        f"{site_name} 하자 보수 세대 민원 처리",
+        "민원건수",
+        str(len(rows)),
+        "세대수",
+        str(len(BUILDINGS) * 100),
+        "미처리",
+        str(len(rows) - closed),
+        "종결",
+        str(closed),
+        "재민원",
+        "0",
+        f"보고기준 {now.strftime('%Y-%m-%d %H:%M:%S')} · 단지 {site_name} · 범위 전체",
+        "상태 분포",
+    ]
+    for status, count in status_counts.most_common():
+        lines += [status, str(count)]
+    return lines + ["상세 목록", *COLUMN_HEADERS]
+
+
+def build_report_pdf(complaints: int, *, seed: int = 7, site_name: str = "합성더샵", now: datetime | None = None) -> tuple[bytes, int]:
+    rng = random.Random(seed)
+    now = now or datetime.now()
+    rows = _records(complaints, rng, now)
+    font_name = _font_name()
+    buf = io.BytesIO()
+    pdf = canvas.Canvas(buf, pagesize=A4)
+    page_number = 1
+    page_lines = _summary_lines(site_name, rows, now)
+
+    def flush_page() -> None:
+        nonlocal page_number, page_lines
+        text = pdf.beginText(36, 806)
+        text.setFont(font_name, FONT_SIZE)
+        for line in [*page_lines, PAGE_FOOTER, f"{page_number} page"]:
+            text.textLine(line)
+        pdf.drawText(text)
+        pdf.showPage()
+        page_number += 1
+        page_lines = ["세대 민원관리 전체 상세목록", f"{site_name} · 전체", *COLUMN_HEADERS]
+
+    def append_block(block: list[str]) -> None:
+        if len(page_lines) + len(block) > PAGE_LINES:
+            flush_page()
+        page_lines.extend(block)
+
+    current_building = ""
+    building_counts = Counter(row["building"] for row in rows)
+    for row in rows:
+        if row["building"] != current_building:
+            if current_building:
+                append_block([f"동 소계 · {current_building}: {building_counts[current_building]}건"])
+            current_building = row["building"]
+            append_block([f"동: {current_building}"])
+        append_block(_record_lines(row))
+    if current_building:
+        append_block([f"동 소계 · {current_building}: {building_counts[current_building]}건"])
+    flush_page()
+    pdf.save()
+    return buf.getvalue(), page_number - 1
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="세대 민원 처리 현황 보고서 형식의 합성 PDF 생성")
+    parser.add_argument("output", help="저장할 PDF 경로")
+    parser.add_argument("--complaints", type=int, default=500, help="보고서에 넣을 민원 수")
+    parser.add_argument("--seed", type=int, default=7, help="난수 시드")
+    parser.add_argument("--site", default="합성더샵", help="단지명")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    data, pages = build_report_pdf(args.complaints, seed=args.seed, site_name=args.site)
+    Path(args.output).write_bytes(data)
+    print(f"{args.output}: 민원 {args.complaints:,}건 / {pages:,}페이지 / {len(data):,} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,5 +2,10 @@
 set -euo pipefail
 
 : "${PORT:=10000}"
+OPS_WORKERS="$(python -m ops.workers)"
+export OPS_WORKERS
 
-exec uvicorn ops_main:app --host 0.0.0.0 --port "$PORT"
+python -m ops.bootstrap
+export OPS_BOOTSTRAPPED=1
+
+exec uvicorn ops_main:app --host 0.0.0.0 --port "$PORT" --workers "$OPS_WORKERS"